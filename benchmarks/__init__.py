@@ -0,0 +1 @@
+"""Benchmark suite for the hashmap and trees packages."""
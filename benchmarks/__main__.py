@@ -0,0 +1,129 @@
+"""
+Command-line entry point:
+
+    python -m benchmarks --sizes 1e3,1e5 --output results.json
+    python -m benchmarks --sizes 1e3,1e5 --compare results.json
+"""
+import argparse
+import datetime
+import json
+import platform
+import sys
+from typing import Any
+
+from . import bench_hashmap, bench_trees
+from .workloads import DISTRIBUTIONS, KEY_TYPES, make_keys
+
+SUITES = {
+    **{name: bench_hashmap for name in bench_hashmap.STRUCTURES},
+    **{name: bench_trees for name in bench_trees.STRUCTURES},
+}
+
+
+def parse_sizes(text: str) -> list[int]:
+    return [int(float(size)) for size in text.split(",")]
+
+
+def parse_choices(text: str, allowed) -> list[str]:
+    chosen = text.split(",")
+    for choice in chosen:
+        if choice not in allowed:
+            raise argparse.ArgumentTypeError(f"{choice!r} is not one of {', '.join(allowed)}")
+    return chosen
+
+
+def run_suite(args: argparse.Namespace) -> list[dict[str, Any]]:
+    rows = []
+    for size in args.sizes:
+        for key_type in args.key_types:
+            for distribution in args.distributions:
+                present, absent = make_keys(size, key_type, distribution, args.seed)
+                for structure in args.structures:
+                    print(f"{structure} n={size} {key_type}/{distribution}", file=sys.stderr)
+                    results = SUITES[structure].run(structure, present, absent, args.budget, args.memory)
+                    for op, metrics in results.items():
+                        rows.append({
+                            "structure": structure,
+                            "size": size,
+                            "key_type": key_type,
+                            "distribution": distribution,
+                            "op": op,
+                            **metrics,
+                        })
+    return rows
+
+
+def row_key(row: dict[str, Any]) -> tuple:
+    return (row["structure"], row["size"], row["key_type"], row["distribution"], row["op"])
+
+
+def print_table(rows: list[dict[str, Any]], baseline: dict[tuple, dict[str, Any]]):
+    header = f"{'structure':<10} {'size':>9} {'keys':<16} {'op':<12} {'ops/sec':>12} {'p50 ns':>9} {'p99 ns':>9} {'max ns':>11}"
+    if baseline:
+        header += f" {'vs base':>8}"
+    print(header)
+
+    for row in rows:
+        keys = f"{row['key_type']}/{row['distribution']}"
+        if "error" in row:
+            print(f"{row['structure']:<10} {row['size']:>9} {keys:<16} {row['op']:<12} {row['error']:>12}")
+            continue
+
+        line = (
+            f"{row['structure']:<10} {row['size']:>9} {keys:<16} {row['op']:<12} "
+            f"{row['ops_per_sec']:>12.0f} {row.get('p50_ns', '-'):>9} {row.get('p99_ns', '-'):>9} "
+            f"{row.get('max_ns', '-'):>11}"
+        )
+        if row["timed_out"]:
+            line += " (timed out)"
+        base = baseline.get(row_key(row))
+        if base and base.get("ops_per_sec"):
+            line += f" {row['ops_per_sec'] / base['ops_per_sec']:>7.2f}x"
+        print(line)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=parse_sizes, default=parse_sizes("1e3,1e4"),
+                        help="comma-separated sizes, e.g. 1e3,1e5,1e7 (default: 1e3,1e4)")
+    parser.add_argument("--structures", type=lambda text: parse_choices(text, SUITES), default=list(SUITES))
+    parser.add_argument("--key-types", type=lambda text: parse_choices(text, KEY_TYPES), default=list(KEY_TYPES))
+    parser.add_argument("--distributions", type=lambda text: parse_choices(text, DISTRIBUTIONS),
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument("--budget", type=float, default=30.0,
+                        help="seconds allowed per timed case before it is cut short (default: 30)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", dest="memory", action="store_false",
+                        help="skip the tracemalloc peak-memory pass")
+    parser.add_argument("--output", help="write machine-readable JSON results to this path")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare ops/sec against")
+    args = parser.parse_args(argv)
+
+    baseline: dict[tuple, dict[str, Any]] = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {row_key(row): row for row in json.load(f)["results"]}
+
+    rows = run_suite(args)
+    print_table(rows, baseline)
+
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "implementation": platform.python_implementation(),
+                "platform": platform.platform(),
+                "argv": sys.argv[1:] if argv is None else argv,
+                "seed": args.seed,
+            },
+            "results": rows,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
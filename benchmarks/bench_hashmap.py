@@ -0,0 +1,49 @@
+"""Hash map benchmarks: insert, lookup, delete, iteration and resize cost."""
+from functools import partial
+from typing import Any
+
+from hashmap import CompactHashMap, CuckooHashMap, DynamicHashMap, RobinHoodHashMap
+
+from .harness import guarded, peak_memory, summarize, time_each, time_once
+
+STRUCTURES = {
+    "dynamic": DynamicHashMap,
+    "robinhood": RobinHoodHashMap,
+    "compact": CompactHashMap,
+    "cuckoo": CuckooHashMap,
+    # compare its lookup_miss against "dynamic" to see what the filter saves
+    "bloom": partial(DynamicHashMap, bloom="standard"),
+}
+
+
+def build(cls: Any, keys: list) -> Any:
+    hm = cls()
+    for key in keys:
+        hm.put(key, key)
+    return hm
+
+
+def run(structure: str, present: list, absent: list, budget: float, memory: bool) -> dict[str, dict]:
+    cls = STRUCTURES[structure]
+    results: dict[str, dict] = {}
+
+    hm = cls()
+    resize_ns: list[int] = []
+    hm.on_resize(lambda old, new, seconds: resize_ns.append(int(seconds * 1e9)))
+    put = hm.put
+    results["insert"] = time_each(lambda key: put(key, key), present, budget)
+    results["resize"] = summarize(resize_ns)
+    hm.disable_stats()
+
+    if results["insert"]["timed_out"]:
+        # a degenerate distribution; the remaining cases would be just as slow
+        return results
+
+    results["lookup_hit"] = guarded(lambda: time_each(hm.get, present, budget))
+    results["lookup_miss"] = guarded(lambda: time_each(hm.get, absent, budget))
+    results["iterate"] = guarded(lambda: time_once(lambda: sum(1 for _ in hm.items())))
+    results["delete"] = guarded(lambda: time_each(hm.remove, present, budget))
+
+    if memory:
+        results["insert"]["peak_memory_bytes"] = peak_memory(lambda: build(cls, present))
+    return results
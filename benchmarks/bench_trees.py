@@ -0,0 +1,37 @@
+"""Tree benchmarks: insert, search, delete and in-order iteration."""
+from typing import Any
+
+from trees import AVLTree, BinarySearchTree
+
+from .harness import guarded, peak_memory, time_each, time_once
+
+STRUCTURES = {
+    "bst": BinarySearchTree,
+    "avl": AVLTree,
+}
+
+
+def build(cls: type, keys: list) -> Any:
+    tree = cls()
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def run(structure: str, present: list, absent: list, budget: float, memory: bool) -> dict[str, dict]:
+    cls = STRUCTURES[structure]
+    results: dict[str, dict] = {}
+
+    tree = cls()
+    results["insert"] = time_each(tree.insert, present, budget)
+    if results["insert"]["timed_out"]:
+        return results
+
+    results["search_hit"] = guarded(lambda: time_each(tree.search, present, budget))
+    results["search_miss"] = guarded(lambda: time_each(tree.search, absent, budget))
+    results["iterate"] = guarded(lambda: time_once(lambda: sum(1 for _ in tree)))
+    results["delete"] = guarded(lambda: time_each(tree.delete, present, budget))
+
+    if memory:
+        results["insert"]["peak_memory_bytes"] = peak_memory(lambda: build(cls, present))
+    return results
@@ -0,0 +1,88 @@
+"""Timing and memory measurement helpers shared by the benchmarks."""
+import time
+import tracemalloc
+from typing import Any, Callable, Iterable
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+# wall-clock budget checks are only done every so many operations
+BUDGET_CHECK_INTERVAL = 1024
+
+
+def percentile(sorted_values: list[int], pct: float) -> int:
+    if not sorted_values:
+        return 0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))
+    return sorted_values[index]
+
+
+def time_each(op: Callable[[Any], Any], args: Iterable[Any], budget: float) -> dict[str, Any]:
+    """
+    Calls op(arg) for every arg, timing each call separately, and reports
+    throughput and latency percentiles in nanoseconds. Stops early and flags
+    the result once `budget` seconds have elapsed.
+    """
+    clock = time.perf_counter_ns
+    latencies = []
+    record = latencies.append
+    deadline = clock() + int(budget * 1e9)
+    timed_out = False
+
+    for i, arg in enumerate(args):
+        start = clock()
+        op(arg)
+        end = clock()
+        record(end - start)
+        if i % BUDGET_CHECK_INTERVAL == 0 and end > deadline:
+            timed_out = True
+            break
+
+    return summarize(latencies, timed_out)
+
+
+def time_once(op: Callable[[], int]) -> dict[str, Any]:
+    """Times a single bulk call that returns how many elements it processed"""
+    start = time.perf_counter_ns()
+    count = op()
+    elapsed = time.perf_counter_ns() - start
+    return {
+        "ops": count,
+        "total_ns": elapsed,
+        "ops_per_sec": count / elapsed * 1e9 if elapsed else 0.0,
+        "timed_out": False,
+    }
+
+
+def summarize(latencies: list[int], timed_out: bool = False) -> dict[str, Any]:
+    total = sum(latencies)
+    ordered = sorted(latencies)
+    result: dict[str, Any] = {
+        "ops": len(latencies),
+        "total_ns": total,
+        "ops_per_sec": len(latencies) / total * 1e9 if total else 0.0,
+        "max_ns": ordered[-1] if ordered else 0,
+        "timed_out": timed_out,
+    }
+    for pct in PERCENTILES:
+        result[f"p{pct:g}_ns"] = percentile(ordered, pct)
+    return result
+
+
+def peak_memory(build: Callable[[], Any]) -> int:
+    """Returns the peak number of bytes allocated while running build()"""
+    tracemalloc.start()
+    try:
+        result = build()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def guarded(case: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+    """Runs a benchmark case, recording structural failures instead of aborting the suite"""
+    try:
+        return case()
+    except RecursionError as exc:
+        return {"error": type(exc).__name__, "timed_out": False}
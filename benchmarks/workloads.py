@@ -0,0 +1,50 @@
+"""Key generators for the benchmark workloads."""
+import itertools
+import random
+
+KEY_TYPES = ("int", "str")
+DISTRIBUTIONS = ("random", "sequential", "adversarial")
+
+# multiples of a large power of two all land in one bucket when ints hash to
+# themselves (`key % size`); kept to check that key hashes stay well mixed
+ADVERSARIAL_STRIDE = 1 << 24
+
+# "Aa" and "BB" share a base-31 polynomial hash, and so do all strings made
+# by concatenating them in any order; likewise a regression check for mixing
+COLLIDING_BLOCKS = ("Aa", "BB")
+
+
+def int_keys(n: int, distribution: str, rng: random.Random) -> list[int]:
+    if distribution == "random":
+        return rng.sample(range(n * 16), n)
+    elif distribution == "sequential":
+        return list(range(n))
+    elif distribution == "adversarial":
+        return [i * ADVERSARIAL_STRIDE for i in range(n)]
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def str_keys(n: int, distribution: str, rng: random.Random) -> list[str]:
+    if distribution == "random":
+        return [f"{value:x}-key" for value in rng.sample(range(n * 16), n)]
+    elif distribution == "sequential":
+        return [f"key-{i:012d}" for i in range(n)]
+    elif distribution == "adversarial":
+        width = max(1, (n - 1).bit_length())
+        blocks = itertools.product(COLLIDING_BLOCKS, repeat=width)
+        return ["".join(parts) for parts in itertools.islice(blocks, n)]
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def make_keys(n: int, key_type: str, distribution: str, seed: int = 0) -> tuple[list, list]:
+    """Returns (present keys, absent keys) of the requested shape"""
+    rng = random.Random(seed)
+    generate = int_keys if key_type == "int" else str_keys
+    if key_type not in KEY_TYPES:
+        raise ValueError(f"Unknown key type: {key_type}")
+
+    keys = generate(2 * n, distribution, rng)
+    present, absent = keys[0::2], keys[1::2]
+    if distribution == "random":
+        rng.shuffle(present)
+    return present, absent
@@ -1,4 +1,45 @@
 """HashMap package - Dynamic hash map with collision handling."""
-from .hashmap import DynamicHashMap, Node, Hasher, hashable
+from .hashmap import DynamicHashMap, Node, Hasher, KeyedHasher, hashable
+from .hashing import HashedKey
+from .robinhood import RobinHoodHashMap
+from .compact import CompactHashMap
+from .cuckoo import CuckooHashMap
+from .concurrent import ConcurrentHashMap
+from .mmapmap import MmapHashMap
+from .bloom import BloomFilter, CountingBloomFilter
+from .cache import BoundedCache
+from .hamt import PersistentHashMap, TransientHashMap
+from .ttl import TTLHashMap
+from .sharedmap import SharedShardedHashMap, ShardFullError
 
-__all__ = ["DynamicHashMap", "Node", "Hasher", "hashable"]
+__all__ = [
+    "DynamicHashMap",
+    "Node",
+    "Hasher",
+    "KeyedHasher",
+    "hashable",
+    "HashedKey",
+    "RobinHoodHashMap",
+    "CompactHashMap",
+    "CuckooHashMap",
+    "IntHashMap",
+    "ConcurrentHashMap",
+    "MmapHashMap",
+    "BoundedCache",
+    "SharedShardedHashMap",
+    "ShardFullError",
+    "BloomFilter",
+    "CountingBloomFilter",
+    "PersistentHashMap",
+    "TransientHashMap",
+    "TTLHashMap",
+]
+
+
+def __getattr__(name: str):
+    # IntHashMap needs numpy, an optional extra that is slow to import, so
+    # its module is only loaded on first access
+    if name == "IntHashMap":
+        from .intmap import IntHashMap
+        return IntHashMap
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,107 @@
+"""Bloom filters over integer hash codes, used to short-circuit HashMap misses."""
+import math
+
+COUNTER_MAX = 255
+
+
+class BloomFilter:
+    """
+    Set of hash codes answering "definitely absent" or "maybe present".
+    Sized for `capacity` additions at false-positive rate `fp_rate`; the k
+    bit positions come from double hashing the two 32-bit halves of the
+    hash code, which HashMap hashing has already mixed.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01):
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1")
+        self.capacity = max(capacity, 1)
+        self.fp_rate = fp_rate
+        self.num_bits = max(8, math.ceil(-self.capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, hash_code: int) -> list[int]:
+        """All k bit positions, for the write paths; lookups compute them inline"""
+        num_bits = self.num_bits
+        pos = (hash_code & 0xFFFFFFFF) % num_bits
+        step = ((hash_code >> 32 & 0xFFFFFFFF) | 1) % num_bits
+        positions = []
+        for _ in range(self.num_hashes):
+            positions.append(pos)
+            pos += step
+            if pos >= num_bits:
+                pos -= num_bits
+        return positions
+
+    def add(self, hash_code: int):
+        bits = self._bits
+        for pos in self._positions(hash_code):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def might_contain(self, hash_code: int) -> bool:
+        # same positions as _positions, without building a list: most misses
+        # stop at the first or second clear bit
+        bits = self._bits
+        num_bits = self.num_bits
+        pos = (hash_code & 0xFFFFFFFF) % num_bits
+        if not bits[pos >> 3] & (1 << (pos & 7)):
+            return False
+        step = ((hash_code >> 32 & 0xFFFFFFFF) | 1) % num_bits
+        for _ in range(self.num_hashes - 1):
+            pos += step
+            if pos >= num_bits:
+                pos -= num_bits
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def clear(self):
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+    def __contains__(self, hash_code: int) -> bool:
+        return self.might_contain(hash_code)
+
+
+class CountingBloomFilter(BloomFilter):
+    """
+    Bloom filter with an 8-bit counter per position, so hash codes can be
+    removed again. A counter that saturates stays set for good.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01):
+        super().__init__(capacity, fp_rate)
+        self._bits = bytearray(self.num_bits)
+
+    def add(self, hash_code: int):
+        counters = self._bits
+        for pos in self._positions(hash_code):
+            if counters[pos] < COUNTER_MAX:
+                counters[pos] += 1
+        self.count += 1
+
+    def remove(self, hash_code: int):
+        """Forgets one earlier add() of hash_code; removing anything else corrupts the filter"""
+        counters = self._bits
+        for pos in self._positions(hash_code):
+            if 0 < counters[pos] < COUNTER_MAX:
+                counters[pos] -= 1
+        self.count -= 1
+
+    def might_contain(self, hash_code: int) -> bool:
+        counters = self._bits
+        num_bits = self.num_bits
+        pos = (hash_code & 0xFFFFFFFF) % num_bits
+        if not counters[pos]:
+            return False
+        step = ((hash_code >> 32 & 0xFFFFFFFF) | 1) % num_bits
+        for _ in range(self.num_hashes - 1):
+            pos += step
+            if pos >= num_bits:
+                pos -= num_bits
+            if not counters[pos]:
+                return False
+        return True
@@ -0,0 +1,253 @@
+"""Bounded cache with LRU / LFU eviction built on DynamicHashMap."""
+import sys
+from typing import Any, Callable, Optional
+
+from .hashmap import DynamicHashMap, hashable
+
+POLICIES = ("lru", "lfu")
+
+
+class CacheEntry:
+    def __init__(self, key: hashable, value: Any, nbytes: int):
+        self.key = key
+        self.value = value
+        self.nbytes = nbytes
+        self.freq = 1
+        self.prev: Optional['CacheEntry'] = None
+        self.next: Optional['CacheEntry'] = None
+
+
+class EntryList:
+    """Intrusive doubly-linked list of CacheEntry objects around a sentinel"""
+
+    def __init__(self):
+        self.head = CacheEntry(None, None, 0)  # type: ignore[arg-type]
+        self.head.prev = self.head
+        self.head.next = self.head
+
+    def is_empty(self) -> bool:
+        return self.head.next is self.head
+
+    def push_front(self, entry: CacheEntry):
+        first = self.head.next
+        assert first is not None
+        entry.prev = self.head
+        entry.next = first
+        first.prev = entry
+        self.head.next = entry
+
+    def back(self) -> CacheEntry:
+        assert self.head.prev is not None
+        return self.head.prev
+
+    @staticmethod
+    def unlink(entry: CacheEntry):
+        assert entry.prev is not None and entry.next is not None
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = entry.next = None
+
+    def __iter__(self):
+        current = self.head.next
+        while current is not self.head:
+            assert current is not None
+            yield current
+            current = current.next
+
+
+class BoundedCache:
+    """
+    Cache bounded by entry count (max_size) and/or approximate memory
+    (max_bytes, measured with `sizeof`). All operations are O(1):
+
+    - "lru" evicts the least recently used entry, tracked by one recency list
+    - "lfu" evicts the least frequently used entry, tracked by one recency
+      list per access count, with ties broken by recency
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: str = "lru",
+        sizeof: Callable[[Any], int] = sys.getsizeof,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown eviction policy: {policy!r}")
+        if max_size is not None and max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self.sizeof = sizeof
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+
+        self._entries = DynamicHashMap()
+        self._recency = EntryList()
+        # LFU only: access count -> entries with that count, most recent first
+        self._buckets = DynamicHashMap()
+        self._min_freq = 0
+
+    # ---------- Policy bookkeeping ----------
+
+    def _link(self, entry: CacheEntry):
+        if self.policy == "lru":
+            self._recency.push_front(entry)
+            return
+
+        bucket = self._buckets.get(entry.freq)
+        if bucket is None:
+            bucket = EntryList()
+            self._buckets.put(entry.freq, bucket)
+        bucket.push_front(entry)
+
+    def _unlink(self, entry: CacheEntry):
+        EntryList.unlink(entry)
+        if self.policy == "lfu":
+            bucket = self._buckets.get(entry.freq)
+            if bucket.is_empty():
+                self._buckets.remove(entry.freq)
+                if self._min_freq == entry.freq:
+                    self._min_freq += 1
+
+    def _touch(self, entry: CacheEntry):
+        self._unlink(entry)
+        if self.policy == "lfu":
+            entry.freq += 1
+        self._link(entry)
+
+    def _victim(self) -> CacheEntry:
+        if self.policy == "lru":
+            return self._recency.back()
+
+        bucket = self._buckets.get(self._min_freq)
+        if bucket is None:
+            # an explicit removal emptied the lowest bucket; rare, so rescan
+            self._min_freq = min(self._buckets.keys())
+            bucket = self._buckets.get(self._min_freq)
+        return bucket.back()
+
+    def _discard(self, entry: CacheEntry):
+        self._unlink(entry)
+        self._entries.remove(entry.key)
+        self.current_bytes -= entry.nbytes
+
+    def _over_limit(self, extra_items: int = 0, extra_bytes: int = 0) -> bool:
+        if self.max_size is not None and len(self._entries) + extra_items > self.max_size:
+            return True
+        if self.max_bytes is not None and self.current_bytes + extra_bytes > self.max_bytes:
+            return True
+        return False
+
+    # ---------- Core operations ----------
+
+    def put(self, key: hashable, value: Any):
+        nbytes = self.sizeof(value) if self.max_bytes is not None else 0
+
+        freq = 1
+        entry = self._entries.get(key)
+        if entry is not None:
+            # an overwrite keeps the access history of the key
+            freq = entry.freq
+            self._discard(entry)
+
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            # can never fit; storing it would just flush the whole cache
+            return
+
+        while self._over_limit(1, nbytes):
+            self._discard(self._victim())
+            self.evictions += 1
+
+        entry = CacheEntry(key, value, nbytes)
+        entry.freq = freq
+        if self.policy == "lfu":
+            if freq < self._min_freq or self._buckets.get(self._min_freq) is None:
+                self._min_freq = freq
+        self._entries.put(key, entry)
+        self._link(entry)
+        self.current_bytes += nbytes
+
+    def get(self, key: hashable, default=None):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def remove(self, key: hashable):
+        entry = self._entries.get(key)
+        if entry is None:
+            raise KeyError(key)
+        self._discard(entry)
+
+    # ---------- Utility methods ----------
+
+    def contains(self, key: hashable) -> bool:
+        """Membership test that neither counts as a hit nor refreshes the entry"""
+        return self._entries.contains(key)
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self._recency = EntryList()
+        self._buckets.clear()
+        self._min_freq = 0
+        self.current_bytes = 0
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def keys(self):
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        for _, value in self.items():
+            yield value
+
+    def items(self):
+        """Yields entries from the most to the least likely to be kept"""
+        if self.policy == "lru":
+            for entry in self._recency:
+                yield (entry.key, entry.value)
+            return
+
+        freqs = sorted(self._buckets.keys(), reverse=True)
+        for freq in freqs:
+            for entry in self._buckets.get(freq):
+                yield (entry.key, entry.value)
+
+    # ---------- Dict-like interface ----------
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, key: hashable):
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            raise KeyError(key)
+
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def __setitem__(self, key: hashable, value: Any):
+        self.put(key, value)
+
+    def __contains__(self, key: hashable) -> bool:
+        return self.contains(key)
@@ -0,0 +1,71 @@
+"""Stable binary encoding of HashMap keys for on-disk formats."""
+import struct
+from typing import Any
+
+from .hashing import HashedKey
+
+INT_TAG = b"i"
+STR_TAG = b"s"
+BYTES_TAG = b"b"
+FLOAT_TAG = b"f"
+TUPLE_TAG = b"t"
+
+FLOAT = struct.Struct("<d")
+# length prefix of every encoded tuple item
+ITEM_LENGTH = struct.Struct("<I")
+
+
+def encode_key(key: Any) -> bytes:
+    """
+    Encodes a key as a type tag followed by its payload. Integral floats are
+    stored as ints so they match the equal int key.
+    """
+    if isinstance(key, int):
+        length = (key.bit_length() + 8) // 8
+        return INT_TAG + key.to_bytes(length, "little", signed=True)
+    elif isinstance(key, str):
+        return STR_TAG + key.encode("utf-8", "surrogatepass")
+    elif isinstance(key, bytes):
+        return BYTES_TAG + key
+    elif isinstance(key, float):
+        if key.is_integer():
+            return encode_key(int(key))
+        return FLOAT_TAG + FLOAT.pack(key)
+    elif isinstance(key, tuple):
+        parts = [TUPLE_TAG]
+        for item in key:
+            encoded = encode_key(item)
+            parts.append(ITEM_LENGTH.pack(len(encoded)))
+            parts.append(encoded)
+        return b"".join(parts)
+    elif isinstance(key, HashedKey):
+        return encode_key(key.key)
+    else:
+        raise TypeError(f"Unsupported key type: {type(key)}")
+
+
+def decode_key(data: bytes) -> Any:
+    tag, payload = data[:1], data[1:]
+    if tag == INT_TAG:
+        return int.from_bytes(payload, "little", signed=True)
+    elif tag == STR_TAG:
+        return payload.decode("utf-8", "surrogatepass")
+    elif tag == BYTES_TAG:
+        return bytes(payload)
+    elif tag == FLOAT_TAG:
+        return FLOAT.unpack(payload)[0]
+    elif tag == TUPLE_TAG:
+        items = []
+        pos = 1
+        while pos < len(data):
+            if pos + ITEM_LENGTH.size > len(data):
+                raise ValueError("Truncated tuple key")
+            (length,) = ITEM_LENGTH.unpack_from(data, pos)
+            pos += ITEM_LENGTH.size
+            if pos + length > len(data):
+                raise ValueError("Truncated tuple key")
+            items.append(decode_key(data[pos:pos + length]))
+            pos += length
+        return tuple(items)
+    else:
+        raise ValueError(f"Unknown key tag: {tag!r}")
@@ -0,0 +1,212 @@
+"""Compact, insertion-ordered HashMap with a sparse index over dense entry arrays."""
+from array import array
+from typing import Any, Optional
+
+from .hashmap import (
+    DynamicHashMap,
+    _check_flat_table_options,
+    _check_shrink_load_factor,
+    _make_hasher,
+    hashable,
+)
+
+FREE = -1
+DUMMY = -2
+
+
+def _index_typecode(capacity: int) -> str:
+    """Picks the narrowest signed array type able to address `capacity` entries"""
+    if capacity <= 0x7F:
+        return "b"
+    elif capacity <= 0x7FFF:
+        return "h"
+    elif capacity <= 0x7FFFFFFF:
+        return "i"
+    return "q"
+
+
+class CompactHashMap(DynamicHashMap):
+    """
+    DynamicHashMap layout in the style of CPython's dict: a sparse `array`
+    index of small integers pointing into dense parallel key/value/hash
+    lists. Iteration walks only the dense lists, so it touches live entries in
+    insertion order, and resizing only rebuilds the index.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 8,
+        load_factor: float = 0.75,
+        incremental_resize: bool = False,
+        resize_batch: int = 4,
+        shrink_load_factor: float = 0.0,
+        bloom: Optional[str] = None,
+        bloom_fp_rate: float = 0.01,
+        hash_seed: "Optional[bytes | int | str]" = None,
+    ):
+        # same signature as DynamicHashMap; resize_batch and bloom_fp_rate only
+        # matter for the options rejected here
+        _check_flat_table_options("CompactHashMap", incremental_resize, bloom)
+        self.load_factor = load_factor
+        self.capacity = initial_capacity
+        self.hasher = _make_hasher(self.capacity, hash_seed)
+        self.num_items = 0
+        self.shrink_load_factor = _check_shrink_load_factor(shrink_load_factor, load_factor)
+        self._min_capacity = initial_capacity
+        self._keys: list[Optional[hashable]] = []
+        self._values: list[Any] = []
+        self._hashes: list[int] = []
+        self._index = self._new_index(self.capacity)
+
+    @staticmethod
+    def _new_index(capacity: int) -> array:
+        return array(_index_typecode(capacity), [FREE]) * capacity
+
+    def _lookup(self, key: hashable, hash_code: int) -> tuple[int, int]:
+        """
+        Returns (slot, entry) for key. If the key is absent, entry is FREE and
+        slot is the free index slot where it would be inserted.
+        """
+        index = self._index
+        keys = self._keys
+        hashes = self._hashes
+        capacity = self.capacity
+        slot = hash_code % capacity
+
+        while True:
+            entry = index[slot]
+            if entry == FREE:
+                return slot, FREE
+            if entry >= 0 and hashes[entry] == hash_code and keys[entry] == key:
+                return slot, entry
+            slot += 1
+            if slot == capacity:
+                slot = 0
+
+    # ---------- Core operations ----------
+
+    def put(self, key: hashable, value: Any):
+        hash_code = self.hasher.hash_code(key)
+        slot, entry = self._lookup(key, hash_code)
+        if entry >= 0:
+            self._values[entry] = value
+            return
+
+        # open addressing needs at least one free slot to terminate probes,
+        # which load factors of 1 and above would otherwise use up
+        if len(self._keys) + 1 >= self.capacity:
+            grow = self.num_items + 1 >= self.capacity // 2
+            self._resize(self.capacity * 2 if grow else self.capacity)
+            slot, _ = self._lookup(key, hash_code)
+
+        self._index[slot] = len(self._keys)
+        self._keys.append(key)
+        self._values.append(value)
+        self._hashes.append(hash_code)
+        self.num_items += 1
+
+        # deleted entries still occupy index slots until the next rebuild
+        if len(self._keys) / self.capacity >= self.load_factor:
+            if self.num_items / self.capacity >= self.load_factor / 2:
+                self._resize(self.capacity * 2)
+            else:
+                self._resize(self.capacity)
+
+    def get(self, key: hashable, default=None):
+        _, entry = self._lookup(key, self.hasher.hash_code(key))
+        if entry < 0:
+            return default
+        return self._values[entry]
+
+    def remove(self, key: hashable):
+        slot, entry = self._lookup(key, self.hasher.hash_code(key))
+        if entry < 0:
+            raise KeyError(key)
+
+        self._index[slot] = DUMMY
+        self._keys[entry] = None
+        self._values[entry] = None
+        self.num_items -= 1
+        self._maybe_shrink()
+
+    # ---------- Utility methods ----------
+
+    def contains(self, key: hashable) -> bool:
+        _, entry = self._lookup(key, self.hasher.hash_code(key))
+        return entry >= 0
+
+    def clear(self):
+        if self.shrink_load_factor:
+            self.capacity = self._min_capacity
+            self.hasher.set_size(self.capacity)
+        self._keys = []
+        self._values = []
+        self._hashes = []
+        self._index = self._new_index(self.capacity)
+        self.num_items = 0
+
+    def keys(self):
+        for key in self._keys:
+            if key is not None:
+                yield key
+
+    def values(self):
+        for key, value in zip(self._keys, self._values):
+            if key is not None:
+                yield value
+
+    def items(self):
+        for key, value in zip(self._keys, self._values):
+            if key is not None:
+                yield (key, value)
+
+    # ---------- Instrumentation ----------
+
+    def _probe_lengths(self):
+        capacity = self.capacity
+        hashes = self._hashes
+        for slot, entry in enumerate(self._index):
+            if entry >= 0:
+                yield (slot - hashes[entry] % capacity) % capacity + 1
+
+    def _chain_lengths(self):
+        return None
+
+    # ---------- Dict-like interface ----------
+
+    def __getitem__(self, key: hashable):
+        _, entry = self._lookup(key, self.hasher.hash_code(key))
+        if entry < 0:
+            raise KeyError(key)
+        return self._values[entry]
+
+    # ---------- Resizing ----------
+
+    def _schedule_resize(self, new_capacity: int):
+        self._resize(new_capacity)
+
+    def _resize(self, new_capacity: int):
+        if self.num_items != len(self._keys):
+            self._compact_entries()
+
+        new_capacity = max(new_capacity, len(self._keys) + 1)
+        self.capacity = new_capacity
+        self.hasher.set_size(new_capacity)
+
+        # entries are known to be distinct, so rebuilding is pure integer work
+        index = self._new_index(new_capacity)
+        for entry, hash_code in enumerate(self._hashes):
+            slot = hash_code % new_capacity
+            while index[slot] != FREE:
+                slot += 1
+                if slot == new_capacity:
+                    slot = 0
+            index[slot] = entry
+        self._index = index
+
+    def _compact_entries(self):
+        """Drops holes left by removals from the dense arrays, keeping order"""
+        live = [i for i, key in enumerate(self._keys) if key is not None]
+        self._keys = [self._keys[i] for i in live]
+        self._values = [self._values[i] for i in live]
+        self._hashes = [self._hashes[i] for i in live]
@@ -0,0 +1,146 @@
+"""Thread-safe HashMap built from independently locked DynamicHashMap segments."""
+import threading
+from typing import Any, Optional
+
+from .hashing import hash_key
+from .hashmap import DynamicHashMap, Node, hashable
+
+
+class Segment:
+    """
+    One independently locked slice of a ConcurrentHashMap.
+
+    Writers bump `version` to an odd value before mutating and back to an even
+    value afterwards, so readers can run without the lock and only retry under
+    it if a write overlapped their lookup.
+    """
+
+    def __init__(self, initial_capacity: int, load_factor: float):
+        self.map = DynamicHashMap(initial_capacity, load_factor)
+        self.lock = threading.Lock()
+        self.version = 0
+
+    def find(self, key: hashable) -> Optional[Node]:
+        version = self.version
+        if not version & 1:
+            try:
+                node = self.map._find_node(key)
+            except (IndexError, TypeError):
+                # table, bins or tree bin swapped mid-lookup by a resize
+                pass
+            else:
+                if self.version == version:
+                    return node
+
+        with self.lock:
+            return self.map._find_node(key)
+
+
+class ConcurrentHashMap:
+    """
+    Striped-lock hash map: keys are spread over `concurrency_level` segments,
+    each a resizable DynamicHashMap guarded by its own lock. Writers only
+    serialize with writers of the same segment and resizes are per segment.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 64,
+        load_factor: float = 0.75,
+        concurrency_level: int = 16,
+    ):
+        self.load_factor = load_factor
+        per_segment = max(2, -(-initial_capacity // concurrency_level))
+        self.segments = [Segment(per_segment, load_factor) for _ in range(concurrency_level)]
+
+    def _segment(self, key: hashable) -> Segment:
+        # the high bits of the mixed hash keep segment choice independent of
+        # the low bits the segment's own Hasher turns into a bucket index
+        return self.segments[(hash_key(key) >> 32) % len(self.segments)]
+
+    # ---------- Core operations ----------
+
+    def put(self, key: hashable, value: Any):
+        segment = self._segment(key)
+        with segment.lock:
+            segment.version += 1
+            try:
+                segment.map.put(key, value)
+            finally:
+                segment.version += 1
+
+    def put_if_absent(self, key: hashable, value: Any):
+        """Atomically stores value unless key is present; returns the current value"""
+        segment = self._segment(key)
+        with segment.lock:
+            node = segment.map._find_node(key)
+            if node is not None:
+                return node.value
+            segment.version += 1
+            try:
+                segment.map.put(key, value)
+            finally:
+                segment.version += 1
+            return value
+
+    def get(self, key: hashable, default=None):
+        node = self._segment(key).find(key)
+        if node is None:
+            return default
+        return node.value
+
+    def remove(self, key: hashable):
+        segment = self._segment(key)
+        with segment.lock:
+            segment.version += 1
+            try:
+                segment.map.remove(key)
+            finally:
+                segment.version += 1
+
+    # ---------- Utility methods ----------
+
+    def contains(self, key: hashable) -> bool:
+        return self._segment(key).find(key) is not None
+
+    def size(self) -> int:
+        return sum(segment.map.num_items for segment in self.segments)
+
+    def clear(self):
+        for segment in self.segments:
+            with segment.lock:
+                segment.version += 1
+                segment.map.clear()
+                segment.version += 1
+
+    def items(self):
+        """Yields a per-segment consistent snapshot of the entries"""
+        for segment in self.segments:
+            with segment.lock:
+                snapshot = list(segment.map.items())
+            yield from snapshot
+
+    def keys(self):
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        for _, value in self.items():
+            yield value
+
+    # ---------- Dict-like interface ----------
+
+    def __len__(self):
+        return self.size()
+
+    def __getitem__(self, key: hashable):
+        node = self._segment(key).find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key: hashable, value: Any):
+        self.put(key, value)
+
+    def __contains__(self, key: hashable) -> bool:
+        return self.contains(key)
@@ -0,0 +1,314 @@
+"""Bucketized cuckoo HashMap with a stash, giving constant-time lookups."""
+import random
+from typing import Any, Optional
+
+from .hashing import mix64
+from .hashmap import (
+    DynamicHashMap,
+    _check_flat_table_options,
+    _check_shrink_load_factor,
+    _make_hasher,
+    hashable,
+)
+
+BUCKET_SIZE = 4
+STASH_SIZE = 4
+# length of the eviction walk before an entry falls back to the stash
+MAX_KICKS = 100
+# second hash functions tried at one size before a failed walk grows the table
+MAX_REHASHES = 3
+
+
+class CuckooHashMap(DynamicHashMap):
+    """
+    Drop-in alternative to DynamicHashMap with a hard bound on lookup cost.
+
+    Every key may only live in one of two buckets of BUCKET_SIZE slots, chosen
+    by two independent functions of its hash, or in a small stash. A lookup
+    therefore compares against at most 2 * BUCKET_SIZE + STASH_SIZE entries
+    unless more keys share one full hash code than two buckets and the stash
+    can hold. Inserts make room by evicting residents to their other bucket
+    (a random walk); if that fails and the stash is full, the table is
+    rebuilt with a new second hash function, or grown if it is well loaded.
+    Pass `hash_seed` to key the hash so such keys cannot be precomputed.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 8,
+        load_factor: float = 0.9,
+        incremental_resize: bool = False,
+        resize_batch: int = 4,
+        shrink_load_factor: float = 0.0,
+        bloom: Optional[str] = None,
+        bloom_fp_rate: float = 0.01,
+        hash_seed: "Optional[bytes | int | str]" = None,
+    ):
+        # same signature as DynamicHashMap; resize_batch and bloom_fp_rate only
+        # matter for the options rejected here
+        _check_flat_table_options("CuckooHashMap", incremental_resize, bloom)
+        self.load_factor = load_factor
+        self.capacity = self._round_capacity(initial_capacity)
+        self.hasher = _make_hasher(self.capacity, hash_seed)
+        self.num_items = 0
+        self.shrink_load_factor = _check_shrink_load_factor(shrink_load_factor, load_factor)
+        self._min_capacity = self.capacity
+        self._rng = random.Random(0)
+        # mixed into the second bucket choice; redrawn when a rebuild is needed
+        self._salt = 0
+        self._allocate(self.capacity)
+
+    @staticmethod
+    def _round_capacity(capacity: int) -> int:
+        """Rounds up to whole buckets, with at least two buckets to choose from"""
+        return max(2, -(-capacity // BUCKET_SIZE)) * BUCKET_SIZE
+
+    def _allocate(self, capacity: int):
+        self._keys: list[Optional[hashable]] = [None] * capacity
+        self._values: list[Any] = [None] * capacity
+        self._hashes: list[int] = [0] * capacity
+        # [key, value, hash_code] entries the eviction walk could not place
+        self._stash: list[list[Any]] = []
+        self._num_buckets = capacity // BUCKET_SIZE
+
+    def _bucket_pair(self, hash_code: int) -> tuple[int, int]:
+        num_buckets = self._num_buckets
+        first = hash_code % num_buckets
+        second = mix64(hash_code ^ self._salt) % num_buckets
+        if second == first:
+            second = first + 1 if first + 1 < num_buckets else 0
+        return first, second
+
+    def _find_slot(self, key: hashable, hash_code: int) -> int:
+        """
+        Returns the slot holding key, or -1 if the key is absent. Slots from
+        `capacity` on address the stash.
+        """
+        keys = self._keys
+        hashes = self._hashes
+        for bucket in self._bucket_pair(hash_code):
+            start = bucket * BUCKET_SIZE
+            for slot in range(start, start + BUCKET_SIZE):
+                if hashes[slot] == hash_code and keys[slot] == key:
+                    return slot
+
+        for i, (stashed_key, _, stashed_hash) in enumerate(self._stash):
+            if stashed_hash == hash_code and stashed_key == key:
+                return self.capacity + i
+        return -1
+
+    def _place_in_bucket(self, bucket: int, key: hashable, value: Any, hash_code: int) -> bool:
+        keys = self._keys
+        start = bucket * BUCKET_SIZE
+        for slot in range(start, start + BUCKET_SIZE):
+            if keys[slot] is None:
+                keys[slot] = key
+                self._values[slot] = value
+                self._hashes[slot] = hash_code
+                return True
+        return False
+
+    def _place(self, key: hashable, value: Any, hash_code: int) -> Optional[tuple[hashable, Any, int]]:
+        """
+        Inserts a key known to be absent. Returns the entry left homeless
+        when both the eviction walk and the stash are exhausted.
+        """
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        rng = self._rng
+
+        for _ in range(MAX_KICKS):
+            first, second = self._bucket_pair(hash_code)
+            if self._place_in_bucket(first, key, value, hash_code):
+                return None
+            if self._place_in_bucket(second, key, value, hash_code):
+                return None
+
+            # both buckets are full: evict a random resident, which then
+            # tries its own alternative bucket on the next round
+            slot = (first if rng.random() < 0.5 else second) * BUCKET_SIZE + rng.randrange(BUCKET_SIZE)
+            keys[slot], key = key, keys[slot]
+            values[slot], value = value, values[slot]
+            hashes[slot], hash_code = hash_code, hashes[slot]
+
+        if len(self._stash) < STASH_SIZE:
+            self._stash.append([key, value, hash_code])
+            return None
+        return key, value, hash_code
+
+    def _inseparable(self, hash_code: int) -> bool:
+        """
+        True if both buckets of hash_code hold only keys with that exact hash,
+        which no table size or hash function can pull apart
+        """
+        keys = self._keys
+        hashes = self._hashes
+        for bucket in self._bucket_pair(hash_code):
+            start = bucket * BUCKET_SIZE
+            for slot in range(start, start + BUCKET_SIZE):
+                if keys[slot] is None or hashes[slot] != hash_code:
+                    return False
+        return True
+
+    def _drain_stash(self):
+        """Moves stashed entries back into the table where slots have freed up"""
+        kept = []
+        for entry in self._stash:
+            key, value, hash_code = entry
+            first, second = self._bucket_pair(hash_code)
+            if not (
+                self._place_in_bucket(first, key, value, hash_code)
+                or self._place_in_bucket(second, key, value, hash_code)
+            ):
+                kept.append(entry)
+        self._stash = kept
+
+    # ---------- Core operations ----------
+
+    def put(self, key: hashable, value: Any):
+        hash_code = self.hasher.hash_code(key)
+        index = self._find_slot(key, hash_code)
+        if index >= self.capacity:
+            self._stash[index - self.capacity][1] = value
+            return
+        if index >= 0:
+            self._values[index] = value
+            return
+
+        homeless = self._place(key, value, hash_code)
+        self.num_items += 1
+        if homeless is not None:
+            if self._inseparable(homeless[2]):
+                self._stash.append(list(homeless))
+            else:
+                self._rebuild_after_failure(self.capacity, self._entries() + [homeless])
+
+        if self.num_items / self.capacity >= self.load_factor:
+            self._resize(self.capacity * 2)
+
+    def get(self, key: hashable, default=None):
+        index = self._find_slot(key, self.hasher.hash_code(key))
+        if index < 0:
+            return default
+        if index >= self.capacity:
+            return self._stash[index - self.capacity][1]
+        return self._values[index]
+
+    def remove(self, key: hashable):
+        index = self._find_slot(key, self.hasher.hash_code(key))
+        if index < 0:
+            raise KeyError(key)
+
+        if index >= self.capacity:
+            del self._stash[index - self.capacity]
+        else:
+            self._keys[index] = None
+            self._values[index] = None
+            self._hashes[index] = 0
+            if self._stash:
+                self._drain_stash()
+
+        self.num_items -= 1
+        self._maybe_shrink()
+
+    # ---------- Utility methods ----------
+
+    def contains(self, key: hashable) -> bool:
+        return self._find_slot(key, self.hasher.hash_code(key)) >= 0
+
+    def clear(self):
+        if self.shrink_load_factor:
+            self.capacity = self._min_capacity
+            self.hasher.set_size(self.capacity)
+        self._allocate(self.capacity)
+        self.num_items = 0
+
+    def keys(self):
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        for _, value in self.items():
+            yield value
+
+    def items(self):
+        for key, value in zip(self._keys, self._values):
+            if key is not None:
+                yield (key, value)
+        for key, value, _ in self._stash:
+            yield (key, value)
+
+    # ---------- Instrumentation ----------
+
+    def _probe_lengths(self):
+        """Buckets inspected to find each entry: 1 or 2, or 3 for the stash"""
+        for slot, key in enumerate(self._keys):
+            if key is not None:
+                yield 1 if self._bucket_pair(self._hashes[slot])[0] == slot // BUCKET_SIZE else 2
+        for _ in self._stash:
+            yield 3
+
+    def _chain_lengths(self):
+        return None
+
+    # ---------- Dict-like interface ----------
+
+    def __getitem__(self, key: hashable):
+        index = self._find_slot(key, self.hasher.hash_code(key))
+        if index < 0:
+            raise KeyError(key)
+        if index >= self.capacity:
+            return self._stash[index - self.capacity][1]
+        return self._values[index]
+
+    # ---------- Resizing ----------
+
+    def _schedule_resize(self, new_capacity: int):
+        self._resize(new_capacity)
+
+    def _resize(self, new_capacity: int):
+        entries = self._entries()
+        if not self._rebuild(new_capacity, entries):
+            self._rebuild_after_failure(self.capacity, entries)
+
+    def _entries(self) -> list[tuple[hashable, Any, int]]:
+        entries = [
+            (key, value, hash_code)
+            for key, value, hash_code in zip(self._keys, self._values, self._hashes)
+            if key is not None
+        ]
+        entries.extend((key, value, hash_code) for key, value, hash_code in self._stash)
+        return entries
+
+    def _rebuild(self, capacity: int, entries: list[tuple[hashable, Any, int]]) -> bool:
+        """
+        Reinserts entries into a fresh table of the given capacity. Returns
+        False if an entry could neither be placed nor stashed.
+        """
+        capacity = self._round_capacity(capacity)
+        self.capacity = capacity
+        self.hasher.set_size(capacity)
+        self._allocate(capacity)
+        for entry in entries:
+            homeless = self._place(*entry)
+            if homeless is not None:
+                if not self._inseparable(homeless[2]):
+                    return False
+                self._stash.append(list(homeless))
+        return True
+
+    def _rebuild_after_failure(self, capacity: int, entries: list[tuple[hashable, Any, int]]):
+        """
+        Retries a rebuild with new second hash functions until every entry
+        fits; a well-loaded table, or one that keeps failing, is doubled.
+        """
+        attempts = 0
+        while True:
+            if len(entries) / capacity >= self.load_factor / 2 or attempts >= MAX_REHASHES:
+                capacity *= 2
+                attempts = 0
+            attempts += 1
+            self._salt = self._rng.getrandbits(64)
+            if self._rebuild(capacity, entries):
+                return
@@ -0,0 +1,391 @@
+"""Persistent hash array mapped trie (HAMT) with structural sharing."""
+from typing import Any, Callable, Iterable, Optional
+
+from .hashing import MASK64
+from .hashmap import Hasher, KeyedHasher, hashable
+
+BITS = 5
+BRANCH_MASK = (1 << BITS) - 1
+
+HashFunction = Callable[[hashable], int]
+
+# returned by lookups that found nothing; None is a valid stored value
+_MISSING = object()
+
+
+class Edit:
+    """Ownership token: nodes created under one transient may be mutated in place by it"""
+
+    __slots__ = ()
+
+
+def _bit(hash_code: int, shift: int) -> int:
+    return 1 << ((hash_code >> shift) & BRANCH_MASK)
+
+
+def _pair_index(bitmap: int, bit: int) -> int:
+    """Position of the key slot for `bit` in a node's flat key/value array"""
+    return 2 * (bitmap & (bit - 1)).bit_count()
+
+
+class BitmapNode:
+    """
+    Trie node for 5 bits of the hash. `array` stores one key/value pair per
+    set bit of `bitmap`; a pair whose key is None holds a child node instead.
+    """
+
+    __slots__ = ("bitmap", "array", "edit")
+
+    def __init__(self, bitmap: int, array: list[Any], edit: Optional[Edit] = None):
+        self.bitmap = bitmap
+        self.array = array
+        self.edit = edit
+
+    def _editable(self, edit: Optional[Edit]) -> "BitmapNode":
+        if edit is not None and self.edit is edit:
+            return self
+        return BitmapNode(self.bitmap, self.array[:], edit)
+
+    def find(self, shift: int, hash_code: int, key: hashable) -> Any:
+        bit = _bit(hash_code, shift)
+        if not self.bitmap & bit:
+            return _MISSING
+        i = _pair_index(self.bitmap, bit)
+        stored = self.array[i]
+        if stored is None:
+            return self.array[i + 1].find(shift + BITS, hash_code, key)
+        return self.array[i + 1] if stored == key else _MISSING
+
+    def assoc(
+        self, edit: Optional[Edit], shift: int, hash_code: int, key: hashable, value: Any, hash_fn: HashFunction,
+    ) -> tuple["BitmapNode", bool]:
+        """Returns (node with key set, whether key was added)"""
+        bit = _bit(hash_code, shift)
+        i = _pair_index(self.bitmap, bit)
+
+        if not self.bitmap & bit:
+            node = self._editable(edit)
+            node.array[i:i] = [key, value]
+            node.bitmap |= bit
+            return node, True
+
+        stored, current = self.array[i], self.array[i + 1]
+        if stored is None:
+            child, added = current.assoc(edit, shift + BITS, hash_code, key, value, hash_fn)
+            if child is current:
+                return self, added
+            node = self._editable(edit)
+            node.array[i + 1] = child
+            return node, added
+
+        if stored == key:
+            if current is value:
+                return self, False
+            node = self._editable(edit)
+            node.array[i + 1] = value
+            return node, False
+
+        child = _split(edit, shift + BITS, hash_fn(stored), stored, current, hash_code, key, value)
+        node = self._editable(edit)
+        node.array[i] = None
+        node.array[i + 1] = child
+        return node, True
+
+    def without(self, edit: Optional[Edit], shift: int, hash_code: int, key: hashable) -> Optional[Any]:
+        """Returns the node without key: self if key is absent, None if it became empty"""
+        bit = _bit(hash_code, shift)
+        if not self.bitmap & bit:
+            return self
+        i = _pair_index(self.bitmap, bit)
+        stored, current = self.array[i], self.array[i + 1]
+
+        if stored is None:
+            child = current.without(edit, shift + BITS, hash_code, key)
+            if child is current:
+                return self
+            if child is not None:
+                node = self._editable(edit)
+                single = child.single_pair()
+                if single is not None:
+                    # pull a lone remaining entry up so paths stay short
+                    node.array[i], node.array[i + 1] = single
+                else:
+                    node.array[i + 1] = child
+                return node
+        elif stored != key:
+            return self
+
+        if self.bitmap == bit:
+            return None
+        node = self._editable(edit)
+        del node.array[i:i + 2]
+        node.bitmap ^= bit
+        return node
+
+    def single_pair(self) -> Optional[tuple[hashable, Any]]:
+        if len(self.array) == 2 and self.array[0] is not None:
+            return self.array[0], self.array[1]
+        return None
+
+    def items(self):
+        array = self.array
+        for i in range(0, len(array), 2):
+            if array[i] is None:
+                yield from array[i + 1].items()
+            else:
+                yield (array[i], array[i + 1])
+
+
+class CollisionNode:
+    """Leaf holding keys whose full 64-bit hashes are equal"""
+
+    __slots__ = ("hash_code", "array", "edit")
+
+    def __init__(self, hash_code: int, array: list[Any], edit: Optional[Edit] = None):
+        self.hash_code = hash_code
+        self.array = array
+        self.edit = edit
+
+    def _editable(self, edit: Optional[Edit]) -> "CollisionNode":
+        if edit is not None and self.edit is edit:
+            return self
+        return CollisionNode(self.hash_code, self.array[:], edit)
+
+    def _key_index(self, key: hashable) -> int:
+        array = self.array
+        for i in range(0, len(array), 2):
+            if array[i] == key:
+                return i
+        return -1
+
+    def find(self, shift: int, hash_code: int, key: hashable) -> Any:
+        if hash_code != self.hash_code:
+            return _MISSING
+        i = self._key_index(key)
+        return self.array[i + 1] if i >= 0 else _MISSING
+
+    def assoc(
+        self, edit: Optional[Edit], shift: int, hash_code: int, key: hashable, value: Any, hash_fn: HashFunction,
+    ) -> tuple[Any, bool]:
+        if hash_code != self.hash_code:
+            # nest this node under a bitmap node and let that place the key
+            parent = BitmapNode(_bit(self.hash_code, shift), [None, self], edit)
+            return parent.assoc(edit, shift, hash_code, key, value, hash_fn)
+
+        i = self._key_index(key)
+        if i >= 0:
+            if self.array[i + 1] is value:
+                return self, False
+            node = self._editable(edit)
+            node.array[i + 1] = value
+            return node, False
+
+        node = self._editable(edit)
+        node.array += [key, value]
+        return node, True
+
+    def without(self, edit: Optional[Edit], shift: int, hash_code: int, key: hashable) -> Optional[Any]:
+        if hash_code != self.hash_code:
+            return self
+        i = self._key_index(key)
+        if i < 0:
+            return self
+        if len(self.array) == 2:
+            return None
+        node = self._editable(edit)
+        del node.array[i:i + 2]
+        return node
+
+    def single_pair(self) -> Optional[tuple[hashable, Any]]:
+        if len(self.array) == 2:
+            return self.array[0], self.array[1]
+        return None
+
+    def items(self):
+        array = self.array
+        for i in range(0, len(array), 2):
+            yield (array[i], array[i + 1])
+
+
+def _split(
+    edit: Optional[Edit], shift: int,
+    hash1: int, key1: hashable, value1: Any,
+    hash2: int, key2: hashable, value2: Any,
+) -> Any:
+    """Builds the smallest subtrie holding two entries that collided at `shift - BITS`"""
+    if hash1 == hash2:
+        return CollisionNode(hash1, [key1, value1, key2, value2], edit)
+
+    index1 = (hash1 >> shift) & BRANCH_MASK
+    index2 = (hash2 >> shift) & BRANCH_MASK
+    if index1 == index2:
+        child = _split(edit, shift + BITS, hash1, key1, value1, hash2, key2, value2)
+        return BitmapNode(1 << index1, [None, child], edit)
+    if index1 < index2:
+        return BitmapNode((1 << index1) | (1 << index2), [key1, value1, key2, value2], edit)
+    return BitmapNode((1 << index1) | (1 << index2), [key2, value2, key1, value1], edit)
+
+
+class _TrieMap:
+    """Read operations shared by persistent and transient maps"""
+
+    hasher: Hasher
+    _root: Optional[Any]
+    _count: int
+
+    def _hash(self, key: hashable) -> int:
+        return self.hasher.hash_code(key) & MASK64
+
+    def _find(self, key: hashable) -> Any:
+        if self._root is None:
+            return _MISSING
+        return self._root.find(0, self._hash(key), key)
+
+    def get(self, key: hashable, default=None):
+        value = self._find(key)
+        return default if value is _MISSING else value
+
+    def contains(self, key: hashable) -> bool:
+        return self._find(key) is not _MISSING
+
+    def size(self) -> int:
+        return self._count
+
+    def keys(self):
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        for _, value in self.items():
+            yield value
+
+    def items(self):
+        if self._root is not None:
+            yield from self._root.items()
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, key: hashable):
+        value = self._find(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: hashable) -> bool:
+        return self.contains(key)
+
+
+class PersistentHashMap(_TrieMap):
+    """
+    Immutable hash map: set() and delete() return a new version that shares
+    every untouched subtrie with the old one, so each update copies only the
+    O(log32 n) nodes on one path. Versions are safe to hand to concurrent
+    readers as-is. For batches of updates, use transient() or update().
+    """
+
+    def __init__(
+        self,
+        items: Optional[Iterable[tuple[hashable, Any]]] = None,
+        hash_seed: "Optional[bytes | int | str]" = None,
+    ):
+        self.hasher = Hasher(1) if hash_seed is None else KeyedHasher(1, hash_seed)
+        self._root: Optional[Any] = None
+        self._count = 0
+        if items is not None:
+            built = self.update(items)
+            self._root = built._root
+            self._count = built._count
+
+    def _version(self, root: Optional[Any], count: int) -> "PersistentHashMap":
+        version = object.__new__(PersistentHashMap)
+        version.hasher = self.hasher
+        version._root = root
+        version._count = count
+        return version
+
+    # ---------- Core operations ----------
+
+    def set(self, key: hashable, value: Any) -> "PersistentHashMap":
+        hash_code = self._hash(key)
+        root = self._root if self._root is not None else BitmapNode(0, [])
+        new_root, added = root.assoc(None, 0, hash_code, key, value, self._hash)
+        if new_root is self._root:
+            return self
+        return self._version(new_root, self._count + added)
+
+    def delete(self, key: hashable) -> "PersistentHashMap":
+        if self._root is None:
+            raise KeyError(key)
+        new_root = self._root.without(None, 0, self._hash(key), key)
+        if new_root is self._root:
+            raise KeyError(key)
+        return self._version(new_root, self._count - 1)
+
+    def update(self, items: Iterable[tuple[hashable, Any]]) -> "PersistentHashMap":
+        """Returns a version with all (key, value) pairs or mapping items set"""
+        transient = self.transient()
+        transient.update(items)
+        return transient.persistent()
+
+    def transient(self) -> "TransientHashMap":
+        """Returns a mutable copy that edits nodes in place until persistent() is called"""
+        return TransientHashMap(self.hasher, self._root, self._count)
+
+
+class TransientHashMap(_TrieMap):
+    """
+    Mutable view of a PersistentHashMap version. Nodes it copies are tagged
+    with its Edit token and then updated in place, so a batch of n updates
+    copies each touched node once instead of once per update.
+    """
+
+    def __init__(self, hasher: Hasher, root: Optional[Any], count: int):
+        self.hasher = hasher
+        self._root = root
+        self._count = count
+        self._edit: Optional[Edit] = Edit()
+
+    def _check_editable(self) -> Edit:
+        if self._edit is None:
+            raise RuntimeError("Transient map used after persistent()")
+        return self._edit
+
+    def put(self, key: hashable, value: Any):
+        edit = self._check_editable()
+        root = self._root if self._root is not None else BitmapNode(0, [], edit)
+        self._root, added = root.assoc(edit, 0, self._hash(key), key, value, self._hash)
+        self._count += added
+
+    def remove(self, key: hashable):
+        edit = self._check_editable()
+        hash_code = self._hash(key)
+        # nodes owned by this transient shrink in place, so identity cannot
+        # tell whether anything was removed; look the key up first
+        if self._root is None or self._root.find(0, hash_code, key) is _MISSING:
+            raise KeyError(key)
+        self._root = self._root.without(edit, 0, hash_code, key)
+        self._count -= 1
+
+    def update(self, items: Iterable[tuple[hashable, Any]]):
+        if hasattr(items, "items"):
+            items = items.items()  # type: ignore[union-attr]
+        put = self.put
+        for key, value in items:
+            put(key, value)
+
+    def persistent(self) -> PersistentHashMap:
+        """Freezes the edits and returns them as a new persistent version"""
+        self._check_editable()
+        self._edit = None
+        version = object.__new__(PersistentHashMap)
+        version.hasher = self.hasher
+        version._root = self._root
+        version._count = self._count
+        return version
+
+    def __setitem__(self, key: hashable, value: Any):
+        self.put(key, value)
+
+    def __delitem__(self, key: hashable):
+        self.remove(key)
@@ -0,0 +1,89 @@
+"""Well-mixed 64-bit hashing of HashMap keys."""
+import hashlib
+import struct
+from typing import Any
+
+MASK64 = (1 << 64) - 1
+# 2**64 / golden ratio, the Fibonacci hashing multiplier
+FIB64 = 0x9E3779B97F4A7C15
+
+FLOAT_BITS = struct.Struct("<d")
+UINT64 = struct.Struct("<Q")
+
+
+def mix64(hash_code: int) -> int:
+    """splitmix64 finalizer: spreads the low 64 bits of any int over all 64 bits"""
+    z = (hash_code + 0x9E3779B97F4A7C15) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+def fib64(key: int) -> int:
+    """
+    Cheap int mixer (Fibonacci hashing): one multiply, keeping the
+    well-mixed middle 64 bits of the product so `hash % size` reads them
+    """
+    return key * FIB64 >> 32 & MASK64
+
+
+def digest64(data: bytes) -> int:
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def hash_key(key: Any) -> int:
+    """
+    Returns a 64-bit hash of key. Keys that compare equal hash equally, so
+    integral floats hash like the matching int. Objects exposing an integer
+    `hash_code` attribute (such as HashedKey) supply their own hash.
+    """
+    cls = type(key)
+    if cls is int:
+        # fib64 inlined: int keys dominate and a call costs as much as the mixing
+        return key * FIB64 >> 32 & MASK64
+    elif cls is str:
+        return digest64(key.encode("utf-8", "surrogatepass"))
+    elif cls is bytes:
+        return digest64(key)
+    elif cls is tuple:
+        hash_code = mix64(len(key))
+        for item in key:
+            hash_code = mix64(hash_code ^ hash_key(item))
+        return hash_code
+    elif isinstance(key, float):
+        if key.is_integer():
+            return fib64(int(key))
+        return mix64(UINT64.unpack(FLOAT_BITS.pack(key))[0])
+
+    # subclasses of the supported types, then precomputed hashes
+    for base in (int, str, bytes, tuple):
+        if isinstance(key, base):
+            return hash_key(base(key))
+    hash_code = getattr(key, "hash_code", None)
+    if isinstance(hash_code, int):
+        return hash_code
+    raise TypeError(f"Unsupported key type: {type(key)}")
+
+
+class HashedKey:
+    """
+    Key wrapper that computes the hash once, for composite keys that are
+    looked up repeatedly. Compares equal to the key it wraps.
+    """
+
+    __slots__ = ("key", "hash_code")
+
+    def __init__(self, key: Any):
+        self.key = key
+        self.hash_code = hash_key(key)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HashedKey):
+            other = other.key
+        return self.key == other
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"HashedKey({self.key!r})"
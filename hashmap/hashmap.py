@@ -1,13 +1,40 @@
 """Dynamic HashMap implementation with chaining and automatic resizing."""
-from typing import Any, Optional
+import hashlib
+import os
+import pickle
+import struct
+from bisect import bisect_left, bisect_right
+from typing import IO, Any, Iterable, Optional, Union
 
-hashable = int | str
+from .bloom import BloomFilter, CountingBloomFilter
+from .codec import decode_key, encode_key
+from .hashing import MASK64, HashedKey, hash_key
+from .stats import HashMapStats, ResizeCallback, health_report, instrument, uninstrument
+
+hashable = Union[int, str, bytes, float, tuple, HashedKey]
+
+SNAPSHOT_MAGIC = b"FSDH"
+SNAPSHOT_VERSION = 1
+# magic, format version, load factor, capacity, item count
+SNAPSHOT_HEADER = struct.Struct("<4sHdQQ")
+# key length, value length
+SNAPSHOT_ENTRY = struct.Struct("<II")
+SNAPSHOT_BLOCK_SIZE = 1 << 20
+
+BLOOM_FILTERS = {"standard": BloomFilter, "counting": CountingBloomFilter}
+
+# chains longer than TREEIFY_THRESHOLD get a sorted TreeBin index, which is
+# dropped again once removals bring them down to UNTREEIFY_THRESHOLD
+TREEIFY_THRESHOLD = 8
+UNTREEIFY_THRESHOLD = 6
 
 
 class Node:
-    def __init__(self, key: hashable, value: Any):
+    def __init__(self, key: hashable, value: Any, hash_code: int = 0):
         self.key = key
         self.value = value
+        # full (unreduced) hash, reused on resize and as a cheap pre-check
+        self.hash_code = hash_code
         self.next: Optional['Node'] = None
 
 
@@ -19,73 +46,267 @@ class Hasher:
         self.size = size
 
     def hash(self, key: hashable) -> int:
-        if isinstance(key, int):
-            return key % self.size
-        elif isinstance(key, str):
-            hash_code = 0
-            for c in key:
-                hash_code = hash_code * 31 + ord(c)
-            return hash_code % self.size
-        else:
-            raise TypeError(f"Unsupported key type: {type(key)}")
+        return self.hash_code(key) % self.size
+
+    # the full hash of key, independent of the table size; bound directly to
+    # hash_key to save a call frame on every lookup
+    hash_code = staticmethod(hash_key)
+
+    def index(self, hash_code: int) -> int:
+        """Reduces a full hash code to a slot index"""
+        return hash_code % self.size
+
+
+def _seed_bytes(seed: "bytes | int | str") -> bytes:
+    if seed == "random":
+        return os.urandom(16)
+    if isinstance(seed, int):
+        if not 0 <= seed < 1 << 512:
+            raise ValueError("hash_seed must be a non-negative int below 2**512")
+        return seed.to_bytes(max(16, (seed.bit_length() + 7) // 8), "little")
+    if isinstance(seed, bytes) and len(seed) <= hashlib.blake2b.MAX_KEY_SIZE:
+        return seed
+    raise ValueError("hash_seed must be \"random\", an int or at most 64 bytes")
+
+
+class KeyedHasher(Hasher):
+    """
+    Hasher keyed with a secret seed (keyed blake2b over the codec encoding
+    of the key), so colliding keys cannot be computed without the seed.
+    Objects that only expose a precomputed hash_code are keyed on that code.
+    """
+
+    def __init__(self, size: int, seed: "bytes | int | str"):
+        super().__init__(size)
+        self.seed = _seed_bytes(seed)
+
+    def hash_code(self, key: hashable) -> int:
+        try:
+            data = encode_key(key)
+        except TypeError:
+            precomputed = getattr(key, "hash_code", None)
+            if not isinstance(precomputed, int):
+                raise
+            data = (precomputed & MASK64).to_bytes(8, "little")
+        digest = hashlib.blake2b(data, digest_size=8, key=self.seed).digest()
+        return int.from_bytes(digest, "little")
+
+
+class TreeBin:
+    """
+    Sorted index over one long chain, giving O(log n) lookups when many keys
+    share a bucket. The chain itself is kept in hash order, so everything
+    that walks chains (iteration, resizing) needs no special case.
+    """
+
+    def __init__(self, head: Node):
+        nodes = []
+        current: Optional[Node] = head
+        while current:
+            nodes.append(current)
+            current = current.next
+        nodes.sort(key=lambda node: node.hash_code)
+
+        for node, nxt in zip(nodes, nodes[1:]):
+            node.next = nxt
+        nodes[-1].next = None
+        self.nodes = nodes
+        self.hashes = [node.hash_code for node in nodes]
+
+    @property
+    def head(self) -> Optional[Node]:
+        return self.nodes[0] if self.nodes else None
+
+    def _position(self, key: hashable, hash_code: int) -> int:
+        hashes = self.hashes
+        nodes = self.nodes
+        i = bisect_left(hashes, hash_code)
+        while i < len(hashes) and hashes[i] == hash_code:
+            if nodes[i].key == key:
+                return i
+            i += 1
+        return -1
+
+    def find(self, key: hashable, hash_code: int) -> Optional[Node]:
+        i = self._position(key, hash_code)
+        return self.nodes[i] if i >= 0 else None
+
+    def insert(self, node: Node):
+        """Links a node for a key known to be absent"""
+        i = bisect_right(self.hashes, node.hash_code)
+        nodes = self.nodes
+        node.next = nodes[i] if i < len(nodes) else None
+        if i > 0:
+            nodes[i - 1].next = node
+        nodes.insert(i, node)
+        self.hashes.insert(i, node.hash_code)
+
+    def remove(self, key: hashable, hash_code: int) -> bool:
+        i = self._position(key, hash_code)
+        if i < 0:
+            return False
+        nodes = self.nodes
+        if i > 0:
+            nodes[i - 1].next = nodes[i].next
+        del nodes[i]
+        del self.hashes[i]
+        return True
+
+    def __len__(self):
+        return len(self.nodes)
+
+
+def _check_shrink_load_factor(shrink_load_factor: float, load_factor: float) -> float:
+    # a shrink lands at a load of at least load_factor / 4, so a higher
+    # low-water mark would immediately trigger the next shrink
+    if not 0 <= shrink_load_factor <= load_factor / 4:
+        raise ValueError("shrink_load_factor must be between 0 and load_factor / 4")
+    return shrink_load_factor
+
+
+def _make_hasher(size: int, hash_seed: "Optional[bytes | int | str]") -> Hasher:
+    # a seed ("random", an int or bytes) switches to keyed hashing
+    return Hasher(size) if hash_seed is None else KeyedHasher(size, hash_seed)
+
+
+def _check_flat_table_options(cls_name: str, incremental_resize: bool, bloom: Optional[str]):
+    """
+    Rejects the DynamicHashMap options that the open-addressing variants do
+    not implement, so they fail clearly instead of being silently ignored
+    """
+    if incremental_resize:
+        raise ValueError(f"{cls_name} does not support incremental_resize")
+    if bloom is not None:
+        raise ValueError(f"{cls_name} does not support bloom filters")
 
 
 class DynamicHashMap:
-    def __init__(self, initial_capacity: int = 8, load_factor: float = 0.75):
+    # resize telemetry, only allocated once enable_stats() is called
+    _stats: Optional[HashMapStats] = None
+    # negative-lookup filter, only allocated when `bloom` is set
+    _bloom: Optional[BloomFilter] = None
+    # per-bucket TreeBin indexes, only allocated once a chain grows too long
+    _bins: Optional[list[Optional[TreeBin]]] = None
+
+    def __init__(
+        self,
+        initial_capacity: int = 8,
+        load_factor: float = 0.75,
+        incremental_resize: bool = False,
+        resize_batch: int = 4,
+        shrink_load_factor: float = 0.0,
+        bloom: Optional[str] = None,
+        bloom_fp_rate: float = 0.01,
+        hash_seed: "Optional[bytes | int | str]" = None,
+    ):
         self.load_factor = load_factor
         self.capacity = initial_capacity
         self.table: list[Optional[Node]] = [None] * self.capacity
-        self.hasher = Hasher(self.capacity)
+        self.hasher = _make_hasher(self.capacity, hash_seed)
         self.num_items = 0
 
+        # removals shrink the table once the load drops below
+        # `shrink_load_factor` (0 disables), never below the initial capacity
+        self.shrink_load_factor = _check_shrink_load_factor(shrink_load_factor, load_factor)
+        self._min_capacity = initial_capacity
+
+        # incremental resizing keeps the previous table alive and drains
+        # at least `resize_batch` of its buckets on every write
+        self.incremental_resize = incremental_resize
+        self.resize_batch = resize_batch
+        self._old_table: Optional[list[Optional[Node]]] = None
+        self._old_hasher: Optional[Hasher] = None
+        self._migrate_pos = 0
+        self._migrate_batch = resize_batch
+
+        # optional Bloom filter over the hash codes of all stored keys, sized
+        # for the growth threshold and rebuilt whenever the table is resized
+        if bloom is not None and bloom not in BLOOM_FILTERS:
+            raise ValueError(f"Unknown bloom filter: {bloom!r}")
+        self.bloom = bloom
+        self.bloom_fp_rate = bloom_fp_rate
+        self._bloom_removed = 0
+        if bloom is not None:
+            self._rebuild_bloom()
+
     # ---------- Core operations ----------
 
     def put(self, key: hashable, value: Any):
-        index = self.hasher.hash(key)
+        hash_code = self.hasher.hash_code(key)
+        if self._old_table is not None:
+            self._migrate_key(hash_code)
+
+        index = self.hasher.index(hash_code)
         current = self.table[index]
+        tree = self._bins[index] if self._bins is not None else None
 
-        if current is None:
-            self.table[index] = Node(key, value)
+        if tree is not None:
+            node = tree.find(key, hash_code)
+            if node is not None:
+                node.value = value
+                return
+            tree.insert(Node(key, value, hash_code))
+            self.table[index] = tree.head
+            self.num_items += 1
+        elif current is None:
+            self.table[index] = Node(key, value, hash_code)
             self.num_items += 1
         else:
+            length = 1
             while True:
-                if current.key == key:
+                if current.hash_code == hash_code and current.key == key:
                     current.value = value
                     return
                 if current.next is None:
-                    current.next = Node(key, value)
+                    current.next = Node(key, value, hash_code)
                     self.num_items += 1
                     break
                 current = current.next
+                length += 1
 
-        if self.num_items / self.capacity >= self.load_factor:
-            self._resize(self.capacity * 2)
+            # `length` excludes the node just appended
+            if length >= TREEIFY_THRESHOLD and self._old_table is None:
+                self._treeify(index)
 
+        if self._bloom is not None:
+            self._bloom.add(hash_code)
 
-    def get(self, key: hashable, default=None):
-        index = self.hasher.hash(key)
-        current = self.table[index]
-
-        while current:
-            if current.key == key:
-                return current.value
-            current = current.next
+        if self.num_items / self.capacity >= self.load_factor:
+            self._schedule_resize(self.capacity * 2)
 
-        return default
+    def get(self, key: hashable, default=None):
+        node = self._find_node(key)
+        if node is None:
+            return default
+        return node.value
 
     def remove(self, key: hashable):
-        index = self.hasher.hash(key)
+        hash_code = self.hasher.hash_code(key)
+        if self._old_table is not None:
+            self._migrate_key(hash_code)
+
+        index = self.hasher.index(hash_code)
+        tree = self._bins[index] if self._bins is not None else None
+        if tree is not None:
+            if not tree.remove(key, hash_code):
+                raise KeyError(key)
+            self.table[index] = tree.head
+            if len(tree) <= UNTREEIFY_THRESHOLD:
+                self._bins[index] = None  # type: ignore[index]
+            self._after_remove(hash_code)
+            return
+
         current = self.table[index]
         prev = None
 
         while current:
-            if current.key == key:
+            if current.hash_code == hash_code and current.key == key:
                 if prev is None:
                     self.table[index] = current.next
                 else:
                     prev.next = current.next
 
-                self.num_items -= 1
+                self._after_remove(hash_code)
                 return
 
             prev = current
@@ -93,62 +314,232 @@ class DynamicHashMap:
 
         raise KeyError(key)
 
+    def _after_remove(self, hash_code: int):
+        self.num_items -= 1
+        if self._bloom is not None:
+            self._forget_bloom(hash_code)
+        if self._old_table is None:
+            self._maybe_shrink()
+
     # ---------- Utility methods ----------
 
     def contains(self, key: hashable) -> bool:
-        index = self.hasher.hash(key)
-        current = self.table[index]
-
-        while current:
-            if current.key == key:
-                return True
-            current = current.next
-
-        return False
+        return self._find_node(key) is not None
 
     def size(self) -> int:
         return self.num_items
     
     def clear(self):
+        if self.shrink_load_factor:
+            self.capacity = self._min_capacity
+            self.hasher.set_size(self.capacity)
         self.table: list[Optional[Node]] = [None] * self.capacity
         self.num_items = 0
+        self._old_table = None
+        self._old_hasher = None
+        self._bins = None
+        if self._bloom is not None:
+            self._rebuild_bloom()
 
     def keys(self):
-        for head in self.table:
+        for head in self._buckets():
             current = head
             while current:
                 yield current.key
                 current = current.next
 
     def values(self):
-        for head in self.table:
+        for head in self._buckets():
             current = head
             while current:
                 yield current.value
                 current = current.next
 
     def items(self):
-        for head in self.table:
+        for head in self._buckets():
             current = head
             while current:
                 yield (current.key, current.value)
                 current = current.next
 
+    # ---------- Bulk operations ----------
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[tuple[hashable, Any]],
+        expected_size: Optional[int] = None,
+        load_factor: float = 0.75,
+        **kwargs,
+    ):
+        """
+        Builds a map from (key, value) pairs, sizing the table once up front.
+        expected_size defaults to len(items) when items has a length.
+        """
+        if expected_size is None and hasattr(items, "__len__"):
+            expected_size = len(items)  # type: ignore[arg-type]
+        capacity = cls._capacity_for(expected_size or 0, load_factor)
+
+        hm = cls(initial_capacity=capacity, load_factor=load_factor, **kwargs)
+        hm.put_many(items)
+        return hm
+
+    def put_many(self, items: Iterable[tuple[hashable, Any]]):
+        """Inserts (key, value) pairs or the items of a mapping"""
+        if hasattr(items, "items"):
+            items = items.items()  # type: ignore[union-attr]
+        if hasattr(items, "__len__"):
+            self.reserve(self.num_items + len(items))  # type: ignore[arg-type]
+
+        put = self.put
+        for key, value in items:
+            put(key, value)
+
+    def get_many(self, keys: Iterable[hashable], default=None) -> list[Any]:
+        get = self.get
+        return [get(key, default) for key in keys]
+
+    def remove_many(self, keys: Iterable[hashable]) -> int:
+        """Removes every present key, ignoring missing ones; returns the count removed"""
+        remove = self.remove
+        removed = 0
+        for key in keys:
+            # one probe per key; remove() raises before changing anything
+            try:
+                remove(key)
+            except KeyError:
+                continue
+            removed += 1
+        return removed
+
+    def reserve(self, expected_size: int):
+        """Grows the table once so expected_size items fit without further resizes"""
+        capacity = self._capacity_for(expected_size, self.load_factor, self.capacity)
+        if capacity > self.capacity:
+            self._resize(capacity)
+
+    @staticmethod
+    def _capacity_for(size: int, load_factor: float, minimum: int = 8) -> int:
+        capacity = max(minimum, 1)
+        while size / capacity >= load_factor:
+            capacity *= 2
+        return capacity
+
+    # ---------- Serialization ----------
+
+    def dump(self, target: "str | IO[bytes]"):
+        """
+        Writes a binary snapshot: a header recording the capacity, then
+        length-prefixed encoded keys and pickled values, streamed in blocks.
+        """
+        if isinstance(target, str) or not hasattr(target, "write"):
+            with open(target, "wb") as f:
+                self.dump(f)
+            return
+
+        target.write(SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, self.load_factor, self.capacity, self.num_items,
+        ))
+
+        block = bytearray()
+        pack_entry = SNAPSHOT_ENTRY.pack
+        dumps = pickle.dumps
+        for key, value in self.items():
+            key_data = encode_key(key)
+            value_data = dumps(value, pickle.HIGHEST_PROTOCOL)
+            block += pack_entry(len(key_data), len(value_data))
+            block += key_data
+            block += value_data
+            if len(block) >= SNAPSHOT_BLOCK_SIZE:
+                target.write(block)
+                block.clear()
+        target.write(block)
+
+    @classmethod
+    def load(cls, source: "str | IO[bytes]", **kwargs):
+        """Restores a map written by dump(), allocating its table exactly once"""
+        if isinstance(source, str) or not hasattr(source, "read"):
+            with open(source, "rb", buffering=SNAPSHOT_BLOCK_SIZE) as f:
+                return cls.load(f, **kwargs)
+
+        header = source.read(SNAPSHOT_HEADER.size)
+        if len(header) != SNAPSHOT_HEADER.size:
+            raise ValueError("Truncated snapshot header")
+        magic, version, load_factor, capacity, count = SNAPSHOT_HEADER.unpack(header)
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            raise ValueError(f"Not a HashMap snapshot (version {SNAPSHOT_VERSION})")
+
+        hm = cls(initial_capacity=capacity, load_factor=load_factor, **kwargs)
+        read = source.read
+        unpack_entry = SNAPSHOT_ENTRY.unpack
+        loads = pickle.loads
+        put = hm.put
+        for _ in range(count):
+            entry = read(SNAPSHOT_ENTRY.size)
+            if len(entry) != SNAPSHOT_ENTRY.size:
+                raise ValueError("Truncated snapshot entry")
+            key_len, value_len = unpack_entry(entry)
+            data = read(key_len + value_len)
+            if len(data) != key_len + value_len:
+                raise ValueError("Truncated snapshot entry")
+            put(decode_key(data[:key_len]), loads(data[key_len:]))
+
+        return hm
+
+    # ---------- Instrumentation ----------
+
+    def enable_stats(self) -> HashMapStats:
+        """Starts recording resize count, duration and load over time"""
+        if self._stats is None:
+            self._stats = HashMapStats()
+            instrument(self, self._stats)
+        return self._stats
+
+    def disable_stats(self):
+        if self._stats is not None:
+            uninstrument(self)
+            self._stats = None
+
+    def on_resize(self, callback: ResizeCallback):
+        """Registers callback(old_capacity, new_capacity, seconds), enabling stats"""
+        self.enable_stats().callbacks.append(callback)
+
+    def health(self) -> dict[str, Any]:
+        """Chain/probe length histograms, expected comparisons and resize stats"""
+        return health_report(self)
+
+    def _probe_lengths(self):
+        """Yields, for every entry, the key comparisons needed to find it"""
+        for head in self._buckets():
+            position = 1
+            current = head
+            while current:
+                yield position
+                position += 1
+                current = current.next
+
+    def _chain_lengths(self):
+        """Chain lengths of every bucket, including the old table's during a migration"""
+        lengths = []
+        for head in self._buckets():
+            length = 0
+            current = head
+            while current:
+                length += 1
+                current = current.next
+            lengths.append(length)
+        return lengths
+
     # ---------- Dict-like interface ----------
 
     def __len__(self):
         return self.num_items
 
     def __getitem__(self, key: hashable):
-        index = self.hasher.hash(key)
-        current = self.table[index]
-
-        while current:
-            if current.key == key:
-                return current.value
-            current = current.next
-
-        raise KeyError(key)
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
 
     def __setitem__(self, key: hashable, value: Any):
         self.put(key, value)
@@ -156,30 +547,210 @@ class DynamicHashMap:
     def __contains__(self, key: hashable) -> bool:
         return self.contains(key)
 
+    def _find_node(self, key: hashable) -> Optional[Node]:
+        hash_code = self.hasher.hash_code(key)
+        if self._bloom is not None and not self._bloom.might_contain(hash_code):
+            return None
+
+        # each attribute is read once, so an optimistic reader racing a
+        # resize sees a stale layout, never a half-cleared one
+        table = self.table
+        bins = self._bins
+        index = hash_code % len(table)
+        if bins is not None:
+            tree = bins[index]
+            if tree is not None:
+                return tree.find(key, hash_code)
+
+        current = table[index]
+        while current:
+            if current.hash_code == hash_code and current.key == key:
+                return current
+            current = current.next
+
+        # keys whose old bucket has not been migrated yet still live there
+        old_table = self._old_table
+        if old_table is not None:
+            current = old_table[hash_code % len(old_table)]
+            while current:
+                if current.hash_code == hash_code and current.key == key:
+                    return current
+                current = current.next
+
+        return None
+
+    def _buckets(self):
+        if self._old_table is not None:
+            yield from self._old_table
+        yield from self.table
+
     # ---------- Resizing ----------
 
+    def _schedule_resize(self, new_capacity: int):
+        """Resizes triggered by put/remove, spread over later writes if incremental"""
+        if self.incremental_resize:
+            self._start_migration(new_capacity)
+        else:
+            self._resize(new_capacity)
+
+    def _maybe_shrink(self):
+        if self.num_items >= self.shrink_load_factor * self.capacity:
+            return
+
+        # halve until the load reaches half the growth threshold, leaving a
+        # wide gap before either resize can trigger again
+        capacity = self.capacity
+        while capacity // 2 >= self._min_capacity and self.num_items / (capacity // 2) < self.load_factor / 2:
+            capacity //= 2
+
+        if capacity < self.capacity:
+            self._schedule_resize(capacity)
+
+    def shrink_to_fit(self):
+        """Immediately resizes to the smallest capacity that fits the current items"""
+        self._resize(self._capacity_for(self.num_items, self.load_factor, self._min_capacity))
+
     def _resize(self, new_capacity: int):
+        if self._old_table is not None:
+            self._finish_migration()
+
         old_table = self.table
+        retreeify = self._bins is not None or new_capacity < self.capacity
+        self._bins = None
 
         self.capacity = new_capacity
         self.table: list[Optional[Node]] = [None] * self.capacity
         self.hasher.set_size(new_capacity)
-        self.num_items = 0
 
+        # nodes are relinked as-is: their cached hash codes make this pure
+        # integer work with no rehashing or reallocation
+        table = self.table
         for head in old_table:
             current = head
             while current:
-                index = self.hasher.hash(current.key)
-                new_node = Node(current.key, current.value)
+                nxt = current.next
+                index = current.hash_code % new_capacity
+                current.next = table[index]
+                table[index] = current
+                current = nxt
+
+        # growing only splits chains, so only a map that already had long
+        # chains, or one that is shrinking, can need new TreeBins
+        if retreeify:
+            self._treeify_long_chains()
+        if self._bloom is not None:
+            self._rebuild_bloom()
+
+    # ---------- Tree bins ----------
+
+    def _treeify(self, index: int):
+        if self._bins is None:
+            self._bins = [None] * self.capacity
+        head = self.table[index]
+        assert head is not None
+        tree = TreeBin(head)
+        self._bins[index] = tree
+        self.table[index] = tree.head
+
+    def _treeify_long_chains(self):
+        for index, head in enumerate(self.table):
+            length = 0
+            current = head
+            while current and length <= TREEIFY_THRESHOLD:
+                length += 1
+                current = current.next
+            if length > TREEIFY_THRESHOLD:
+                self._treeify(index)
 
-                if self.table[index] is None:
-                    self.table[index] = new_node
-                else:
-                    temp = self.table[index]
-                    assert temp is not None
-                    while temp.next:
-                        temp = temp.next
-                    temp.next = new_node
+    # ---------- Bloom filter ----------
 
-                self.num_items += 1
+    def _rebuild_bloom(self):
+        """Re-creates the filter for the current capacity from the stored hash codes"""
+        threshold = max(int(self.load_factor * self.capacity), 1)
+        bloom = BLOOM_FILTERS[self.bloom](threshold, self.bloom_fp_rate)
+        for head in self._buckets():
+            current = head
+            while current:
+                bloom.add(current.hash_code)
                 current = current.next
+        self._bloom = bloom
+        self._bloom_removed = 0
+
+    def _forget_bloom(self, hash_code: int):
+        assert self._bloom is not None
+        if isinstance(self._bloom, CountingBloomFilter):
+            self._bloom.remove(hash_code)
+            return
+
+        # a plain filter keeps the bits of removed keys, raising its false
+        # positive rate; rebuild once they amount to half its design size
+        self._bloom_removed += 1
+        if self._bloom_removed >= self._bloom.capacity // 2:
+            self._rebuild_bloom()
+
+    # ---------- Incremental resizing ----------
+
+    def _start_migration(self, new_capacity: int):
+        if self._old_table is not None:
+            self._finish_migration()
+
+        self._old_table = self.table
+        self._old_hasher = Hasher(self.capacity)
+        self._migrate_pos = 0
+        # migrated nodes are prepended to chains, which would break the hash
+        # order TreeBins rely on; long chains are re-indexed by later puts
+        self._bins = None
+
+        # the migration must finish within the writes it takes to reach the
+        # next grow or shrink threshold of the new table
+        writes_left = min(
+            self.num_items - int(self.shrink_load_factor * new_capacity),
+            int(self.load_factor * new_capacity) - self.num_items,
+        )
+        self._migrate_batch = max(self.resize_batch, -(-len(self._old_table) // max(writes_left, 1)))
+
+        self.capacity = new_capacity
+        self.table: list[Optional[Node]] = [None] * self.capacity
+        self.hasher.set_size(new_capacity)
+
+        if self._bloom is not None:
+            self._rebuild_bloom()
+
+    def _migrate_bucket(self, old_index: int):
+        """Moves every node of one old bucket into the new table"""
+        assert self._old_table is not None
+        current = self._old_table[old_index]
+        self._old_table[old_index] = None
+
+        while current:
+            nxt = current.next
+            index = self.hasher.index(current.hash_code)
+            current.next = self.table[index]
+            self.table[index] = current
+            current = nxt
+
+    def _migrate_key(self, hash_code: int):
+        """
+        Migrates the old bucket owning hash_code so writes only touch the new
+        table, then advances the background migration by one batch.
+        """
+        assert self._old_hasher is not None
+        self._migrate_bucket(self._old_hasher.index(hash_code))
+        self._migrate_step(self._migrate_batch)
+
+    def _migrate_step(self, batch: int):
+        assert self._old_table is not None
+        end = min(self._migrate_pos + batch, len(self._old_table))
+
+        for old_index in range(self._migrate_pos, end):
+            if self._old_table[old_index] is not None:
+                self._migrate_bucket(old_index)
+
+        self._migrate_pos = end
+        if end == len(self._old_table):
+            self._old_table = None
+            self._old_hasher = None
+
+    def _finish_migration(self):
+        if self._old_table is not None:
+            self._migrate_step(len(self._old_table))
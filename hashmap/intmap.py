@@ -0,0 +1,176 @@
+"""NumPy-backed open-addressing HashMap for integer keys with vectorized batch operations."""
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+# 2**64 / golden ratio, used for Fibonacci hashing of the keys
+GOLDEN = 0x9E3779B97F4A7C15
+
+
+class IntHashMap:
+    """
+    Integer-keyed hash table stored in flat NumPy arrays (linear probing over
+    a power-of-two table). The batch methods take and return arrays, so each
+    call resolves every key in a handful of vectorized probe rounds instead
+    of one Python-level lookup per key.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 8,
+        load_factor: float = 0.5,
+        value_dtype: Any = None,
+    ):
+        if np is None:
+            raise ImportError("IntHashMap requires numpy (install the 'numpy' extra)")
+        # linear probing needs a free slot to end every probe
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1")
+
+        self.load_factor = load_factor
+        self.value_dtype = np.dtype(np.int64 if value_dtype is None else value_dtype)
+        self.capacity = 2
+        while self.capacity < initial_capacity:
+            self.capacity *= 2
+        self.num_items = 0
+        self._allocate(self.capacity)
+
+    def _allocate(self, capacity: int):
+        self._keys = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros(capacity, dtype=self.value_dtype)
+        self._used = np.zeros(capacity, dtype=bool)
+        self._shift = np.uint64(64 - (capacity.bit_length() - 1))
+
+    def _home(self, keys: "np.ndarray") -> "np.ndarray":
+        mixed = keys.astype(np.uint64) * np.uint64(GOLDEN)
+        return (mixed >> self._shift).astype(np.int64)
+
+    def _find(self, keys: "np.ndarray") -> "np.ndarray":
+        """Returns the slot of every key, or -1 where the key is absent"""
+        mask = self.capacity - 1
+        result = np.full(len(keys), -1, dtype=np.int64)
+        slots = self._home(keys)
+        pending = np.arange(len(keys))
+
+        while pending.size:
+            s = slots[pending]
+            used = self._used[s]
+            hit = used & (self._keys[s] == keys[pending])
+            result[pending[hit]] = s[hit]
+
+            # keep probing only past occupied, non-matching slots
+            probe = used & ~hit
+            pending = pending[probe]
+            slots[pending] = (s[probe] + 1) & mask
+
+        return result
+
+    def _place(self, keys: "np.ndarray", values: "np.ndarray"):
+        """Inserts distinct keys known to be absent from the table"""
+        mask = self.capacity - 1
+        slots = self._home(keys)
+        pending = np.arange(len(keys))
+
+        while pending.size:
+            s = slots[pending]
+            free = np.flatnonzero(~self._used[s])
+
+            # several pending keys may race for the same free slot: the first
+            # one wins and the rest move on together with the blocked keys
+            claimed, first = np.unique(s[free], return_index=True)
+            winners = pending[free[first]]
+            self._used[claimed] = True
+            self._keys[claimed] = keys[winners]
+            self._values[claimed] = values[winners]
+
+            lost = np.ones(len(pending), dtype=bool)
+            lost[free[first]] = False
+            pending = pending[lost]
+            slots[pending] = (s[lost] + 1) & mask
+
+    # ---------- Batch operations ----------
+
+    def insert(self, keys, values):
+        """Inserts or overwrites keys; for repeated keys the last value wins"""
+        keys = np.asarray(keys, dtype=np.int64)
+        values = np.broadcast_to(np.asarray(values, dtype=self.value_dtype), keys.shape)
+
+        _, last = np.unique(keys[::-1], return_index=True)
+        last = len(keys) - 1 - last
+        keys = keys[last]
+        values = values[last]
+
+        slots = self._find(keys)
+        present = slots >= 0
+        self._values[slots[present]] = values[present]
+
+        new_keys = keys[~present]
+        new_values = values[~present]
+        needed = self.num_items + len(new_keys)
+        if needed / self.capacity >= self.load_factor:
+            capacity = self.capacity
+            while needed / capacity >= self.load_factor:
+                capacity *= 2
+            self._resize(capacity)
+
+        self._place(new_keys, new_values)
+        self.num_items += len(new_keys)
+
+    def lookup(self, keys, default=0) -> "np.ndarray":
+        """Returns the value of every key, with default where the key is absent"""
+        keys = np.asarray(keys, dtype=np.int64)
+        slots = self._find(keys)
+        found = slots >= 0
+
+        result = np.full(len(keys), default, dtype=self.value_dtype)
+        result[found] = self._values[slots[found]]
+        return result
+
+    def contains(self, keys) -> "np.ndarray":
+        """Returns a boolean array telling which keys are present"""
+        return self._find(np.asarray(keys, dtype=np.int64)) >= 0
+
+    # ---------- Utility methods ----------
+
+    def size(self) -> int:
+        return self.num_items
+
+    def clear(self):
+        self._allocate(self.capacity)
+        self.num_items = 0
+
+    def keys(self) -> "np.ndarray":
+        return self._keys[self._used].copy()
+
+    def values(self) -> "np.ndarray":
+        return self._values[self._used].copy()
+
+    # ---------- Dict-like interface ----------
+
+    def __len__(self):
+        return self.num_items
+
+    def __getitem__(self, key: int):
+        slot = self._find(np.array([key], dtype=np.int64))[0]
+        if slot < 0:
+            raise KeyError(key)
+        return self._values[slot].item()
+
+    def __setitem__(self, key: int, value: Any):
+        self.insert([key], [value])
+
+    def __contains__(self, key: int) -> bool:
+        return bool(self.contains([key])[0])
+
+    # ---------- Resizing ----------
+
+    def _resize(self, new_capacity: int):
+        old_keys = self._keys[self._used]
+        old_values = self._values[self._used]
+
+        self.capacity = new_capacity
+        self._allocate(new_capacity)
+        self._place(old_keys, old_values)
@@ -0,0 +1,324 @@
+"""File-backed HashMap stored in a memory-mapped file."""
+import hashlib
+import io
+import mmap
+import os
+import pickle
+import struct
+from typing import Any
+
+from .codec import decode_key, encode_key
+from .hashmap import hashable
+
+MAGIC = b"FSHM"
+FORMAT_VERSION = 1
+
+# magic, format version, capacity, live entries, occupied slots, end of heap
+HEADER = struct.Struct("<4sIQQQQ")
+HEADER_SIZE = 64
+
+# full key hash, key offset, value offset, key length, value length
+SLOT = struct.Struct("<QQQII")
+
+# key offsets always point past the header, so small values mark slot states
+EMPTY = 0
+TOMBSTONE = 1
+
+
+def key_hash(encoded: bytes) -> int:
+    """Process-independent 64-bit hash of an encoded key"""
+    return int.from_bytes(hashlib.blake2b(encoded, digest_size=8).digest(), "little")
+
+
+class MmapHashMap:
+    """
+    Persistent hash map living in a single memory-mapped file:
+
+        header | fixed-width slot array | heap of key and value bytes
+
+    Slots are probed linearly and point into the heap, where keys are stored
+    with the codec encoding and values are pickled. Opening only reads the
+    header, pages are faulted in lazily by the OS, and files opened with
+    readonly=True can be mapped by many processes at once without copying.
+
+    Read-only maps may stay open while one writer updates the file: they see
+    its updates and remap when the heap has grown past their mapping. There
+    is no locking, so a read racing a write to the same key can see it half
+    done. A rehash (growth, compact(), clear()) swaps in a new file, so
+    readers opened before it keep reading the old one until they reopen.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        readonly: bool = False,
+        initial_capacity: int = 64,
+        load_factor: float = 0.7,
+    ):
+        # probes need a slot that is neither live nor a tombstone to stop at
+        if not 0 < load_factor < 1:
+            raise ValueError("load_factor must be between 0 and 1")
+        self.path = os.fspath(path)
+        self.readonly = readonly
+        self.load_factor = load_factor
+
+        if not os.path.exists(self.path):
+            if readonly:
+                raise FileNotFoundError(self.path)
+            self._create(self.path, initial_capacity, 0)
+        self._open()
+
+    @staticmethod
+    def _create(path: str, capacity: int, heap_size: int):
+        with open(path, "wb") as f:
+            heap_start = HEADER_SIZE + capacity * SLOT.size
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, capacity, 0, 0, heap_start))
+            f.truncate(heap_start + heap_size)
+
+    def _open(self):
+        self._file = open(self.path, "rb" if self.readonly else "r+b")
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+        self._read_header()
+
+    def _read_header(self):
+        magic, version, capacity, count, used, heap_end = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._close_handles()
+            raise ValueError(f"{self.path} is not a hash map file (version {FORMAT_VERSION})")
+
+        self.capacity = capacity
+        self.num_items = count
+        self._used = used
+        self._heap_end = heap_end
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """Returns heap bytes, remapping first if a writer has grown the file since"""
+        end = offset + length
+        if end > len(self._mm):
+            self._remap()
+        return self._mm[offset:end]
+
+    def _remap(self):
+        self._mm.close()
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=access)
+
+    def _close_handles(self):
+        self._mm.close()
+        self._file.close()
+
+    def _write_header(self):
+        HEADER.pack_into(
+            self._mm, 0, MAGIC, FORMAT_VERSION,
+            self.capacity, self.num_items, self._used, self._heap_end,
+        )
+
+    def _check_writable(self):
+        if self.readonly:
+            raise io.UnsupportedOperation("map is opened read-only")
+
+    def _probe(self, encoded: bytes, hash_code: int) -> tuple[int, bool]:
+        """
+        Returns (slot, True) if the key is stored, else (slot, False) where
+        slot is the first reusable slot on its probe sequence.
+        """
+        capacity = self.capacity
+        slot = hash_code % capacity
+        reusable = -1
+
+        for _ in range(capacity):
+            slot_hash, key_off, _, key_len, _ = SLOT.unpack_from(self._mm, HEADER_SIZE + slot * SLOT.size)
+            if key_off == EMPTY:
+                return (slot if reusable < 0 else reusable), False
+            if key_off == TOMBSTONE:
+                if reusable < 0:
+                    reusable = slot
+            elif slot_hash == hash_code and self._read(key_off, key_len) == encoded:
+                return slot, True
+            slot += 1
+            if slot == capacity:
+                slot = 0
+
+        return reusable, False
+
+    def _read_slot(self, slot: int) -> tuple[int, int, int, int, int]:
+        return SLOT.unpack_from(self._mm, HEADER_SIZE + slot * SLOT.size)
+
+    def _write_slot(self, slot: int, hash_code: int, key_off: int, value_off: int, key_len: int, value_len: int):
+        SLOT.pack_into(self._mm, HEADER_SIZE + slot * SLOT.size, hash_code, key_off, value_off, key_len, value_len)
+
+    def _append(self, data: bytes) -> int:
+        """Copies data to the end of the heap, growing the file if needed"""
+        offset = self._heap_end
+        end = offset + len(data)
+        if end > len(self._mm):
+            self._grow_file(max(end, 2 * len(self._mm)))
+        self._mm[offset:end] = data
+        self._heap_end = end
+        return offset
+
+    def _grow_file(self, size: int):
+        # grown before any slot points past the old end, so readers can remap
+        self._file.truncate(size)
+        self._remap()
+
+    # ---------- Core operations ----------
+
+    def put(self, key: hashable, value: Any):
+        self._check_writable()
+        encoded = encode_key(key)
+        hash_code = key_hash(encoded)
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        slot, found = self._probe(encoded, hash_code)
+
+        if found:
+            _, key_off, value_off, key_len, value_len = self._read_slot(slot)
+            if len(data) <= value_len:
+                # rewrite the value in place when it fits in the old space
+                self._mm[value_off:value_off + len(data)] = data
+            else:
+                value_off = self._append(data)
+            self._write_slot(slot, hash_code, key_off, value_off, key_len, len(data))
+            self._write_header()
+            return
+
+        key_off = self._append(encoded)
+        value_off = self._append(data)
+        if self._read_slot(slot)[1] == EMPTY:
+            self._used += 1
+        self._write_slot(slot, hash_code, key_off, value_off, len(encoded), len(data))
+        self.num_items += 1
+        self._write_header()
+
+        if self._used / self.capacity >= self.load_factor:
+            # _used counts tombstones; only double when live entries need the room
+            if self.num_items / self.capacity >= self.load_factor / 2:
+                self._rehash(self.capacity * 2)
+            else:
+                self._rehash(self.capacity)
+
+    def get(self, key: hashable, default=None):
+        encoded = encode_key(key)
+        slot, found = self._probe(encoded, key_hash(encoded))
+        if not found:
+            return default
+        return self._load_value(slot)
+
+    def remove(self, key: hashable):
+        self._check_writable()
+        encoded = encode_key(key)
+        slot, found = self._probe(encoded, key_hash(encoded))
+        if not found:
+            raise KeyError(key)
+
+        self._write_slot(slot, 0, TOMBSTONE, 0, 0, 0)
+        self.num_items -= 1
+        self._write_header()
+
+    def _load_value(self, slot: int) -> Any:
+        _, _, value_off, _, value_len = self._read_slot(slot)
+        return pickle.loads(self._read(value_off, value_len))
+
+    # ---------- Utility methods ----------
+
+    def contains(self, key: hashable) -> bool:
+        encoded = encode_key(key)
+        return self._probe(encoded, key_hash(encoded))[1]
+
+    def size(self) -> int:
+        if self.readonly:
+            self._read_header()
+        return self.num_items
+
+    def clear(self):
+        self._check_writable()
+        self._rehash(self.capacity, keep_entries=False)
+
+    def _live_slots(self):
+        for slot in range(self.capacity):
+            entry = self._read_slot(slot)
+            if entry[1] > TOMBSTONE:
+                yield entry
+
+    def keys(self):
+        for _, key_off, _, key_len, _ in self._live_slots():
+            yield decode_key(self._read(key_off, key_len))
+
+    def values(self):
+        for _, _, value_off, _, value_len in self._live_slots():
+            yield pickle.loads(self._read(value_off, value_len))
+
+    def items(self):
+        for _, key_off, value_off, key_len, value_len in self._live_slots():
+            key = decode_key(self._read(key_off, key_len))
+            yield (key, pickle.loads(self._read(value_off, value_len)))
+
+    def compact(self):
+        """Rewrites the file without tombstones and stale heap bytes"""
+        self._check_writable()
+        self._rehash(self.capacity)
+
+    def flush(self):
+        if not self.readonly:
+            self._mm.flush()
+
+    def close(self):
+        if not self._mm.closed:
+            self.flush()
+            self._close_handles()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---------- Dict-like interface ----------
+
+    def __len__(self):
+        return self.size()
+
+    def __getitem__(self, key: hashable):
+        encoded = encode_key(key)
+        slot, found = self._probe(encoded, key_hash(encoded))
+        if not found:
+            raise KeyError(key)
+        return self._load_value(slot)
+
+    def __setitem__(self, key: hashable, value: Any):
+        self.put(key, value)
+
+    def __contains__(self, key: hashable) -> bool:
+        return self.contains(key)
+
+    # ---------- Resizing ----------
+
+    def _rehash(self, new_capacity: int, keep_entries: bool = True):
+        """
+        Copies live entries into a fresh file and atomically swaps it in.
+        Readers that mapped the old file keep a consistent view of it.
+        """
+        entries = list(self._live_slots()) if keep_entries else []
+        mm = self._mm
+        heap_size = sum(key_len + value_len for _, _, _, key_len, value_len in entries)
+
+        tmp_path = self.path + ".tmp"
+        self._create(tmp_path, new_capacity, heap_size)
+        new = MmapHashMap(tmp_path, load_factor=self.load_factor)
+        try:
+            for hash_code, key_off, value_off, key_len, value_len in entries:
+                slot = hash_code % new_capacity
+                while new._read_slot(slot)[1] != EMPTY:
+                    slot = (slot + 1) % new_capacity
+                new_key_off = new._append(mm[key_off:key_off + key_len])
+                new_value_off = new._append(mm[value_off:value_off + value_len])
+                new._write_slot(slot, hash_code, new_key_off, new_value_off, key_len, value_len)
+            new.num_items = new._used = len(entries)
+            new._write_header()
+        finally:
+            new.close()
+
+        self.close()
+        os.replace(tmp_path, self.path)
+        self._open()
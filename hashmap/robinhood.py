@@ -0,0 +1,212 @@
+"""Open-addressing HashMap using Robin Hood probing with backward-shift deletion."""
+from typing import Any, Optional
+
+from .hashmap import (
+    DynamicHashMap,
+    _check_flat_table_options,
+    _check_shrink_load_factor,
+    _make_hasher,
+    hashable,
+)
+
+
+class RobinHoodHashMap(DynamicHashMap):
+    """
+    Drop-in alternative to DynamicHashMap that stores entries in flat parallel
+    lists instead of chained Node objects.
+
+    Every occupied slot remembers its probe distance (how far it sits from its
+    home slot). On insert, an entry that has travelled further than the one
+    occupying a slot takes that slot over, which keeps probe sequences short
+    and lets lookups stop as soon as they meet an entry closer to home.
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 8,
+        load_factor: float = 0.75,
+        incremental_resize: bool = False,
+        resize_batch: int = 4,
+        shrink_load_factor: float = 0.0,
+        bloom: Optional[str] = None,
+        bloom_fp_rate: float = 0.01,
+        hash_seed: "Optional[bytes | int | str]" = None,
+    ):
+        # same signature as DynamicHashMap; resize_batch and bloom_fp_rate only
+        # matter for the options rejected here
+        _check_flat_table_options("RobinHoodHashMap", incremental_resize, bloom)
+        self.load_factor = load_factor
+        self.capacity = initial_capacity
+        self.hasher = _make_hasher(self.capacity, hash_seed)
+        self.num_items = 0
+        self.shrink_load_factor = _check_shrink_load_factor(shrink_load_factor, load_factor)
+        self._min_capacity = initial_capacity
+        self._allocate(self.capacity)
+
+    def _allocate(self, capacity: int):
+        self._keys: list[Optional[hashable]] = [None] * capacity
+        self._values: list[Any] = [None] * capacity
+        self._dists: list[int] = [0] * capacity
+        self._hashes: list[int] = [0] * capacity
+
+    def _find_slot(self, key: hashable, hash_code: int) -> int:
+        """Returns the slot holding key, or -1 if the key is absent"""
+        keys = self._keys
+        dists = self._dists
+        hashes = self._hashes
+        capacity = self.capacity
+        index = hash_code % capacity
+        dist = 0
+
+        while True:
+            slot_key = keys[index]
+            if slot_key is None or dists[index] < dist:
+                return -1
+            if hashes[index] == hash_code and slot_key == key:
+                return index
+            index += 1
+            if index == capacity:
+                index = 0
+            dist += 1
+
+    def _place(self, key: hashable, value: Any, hash_code: int):
+        """Inserts a key known to be absent, displacing richer entries"""
+        keys = self._keys
+        values = self._values
+        dists = self._dists
+        hashes = self._hashes
+        capacity = self.capacity
+        index = hash_code % capacity
+        dist = 0
+
+        while True:
+            if keys[index] is None:
+                keys[index] = key
+                values[index] = value
+                dists[index] = dist
+                hashes[index] = hash_code
+                return
+            if dists[index] < dist:
+                keys[index], key = key, keys[index]
+                values[index], value = value, values[index]
+                dists[index], dist = dist, dists[index]
+                hashes[index], hash_code = hash_code, hashes[index]
+            index += 1
+            if index == capacity:
+                index = 0
+            dist += 1
+
+    # ---------- Core operations ----------
+
+    def put(self, key: hashable, value: Any):
+        hash_code = self.hasher.hash_code(key)
+        index = self._find_slot(key, hash_code)
+        if index >= 0:
+            self._values[index] = value
+            return
+
+        # open addressing needs at least one free slot to terminate probes
+        if self.num_items + 1 >= self.capacity:
+            self._resize(self.capacity * 2)
+
+        self._place(key, value, hash_code)
+        self.num_items += 1
+
+        if self.num_items / self.capacity >= self.load_factor:
+            self._resize(self.capacity * 2)
+
+    def get(self, key: hashable, default=None):
+        index = self._find_slot(key, self.hasher.hash_code(key))
+        if index < 0:
+            return default
+        return self._values[index]
+
+    def remove(self, key: hashable):
+        index = self._find_slot(key, self.hasher.hash_code(key))
+        if index < 0:
+            raise KeyError(key)
+
+        keys = self._keys
+        values = self._values
+        dists = self._dists
+        hashes = self._hashes
+        capacity = self.capacity
+
+        # backward-shift: pull following displaced entries one slot closer to home
+        nxt = index + 1 if index + 1 < capacity else 0
+        while keys[nxt] is not None and dists[nxt] > 0:
+            keys[index] = keys[nxt]
+            values[index] = values[nxt]
+            dists[index] = dists[nxt] - 1
+            hashes[index] = hashes[nxt]
+            index = nxt
+            nxt = index + 1 if index + 1 < capacity else 0
+
+        keys[index] = None
+        values[index] = None
+        dists[index] = 0
+        self.num_items -= 1
+        self._maybe_shrink()
+
+    # ---------- Utility methods ----------
+
+    def contains(self, key: hashable) -> bool:
+        return self._find_slot(key, self.hasher.hash_code(key)) >= 0
+
+    def clear(self):
+        if self.shrink_load_factor:
+            self.capacity = self._min_capacity
+            self.hasher.set_size(self.capacity)
+        self._allocate(self.capacity)
+        self.num_items = 0
+
+    def keys(self):
+        for key in self._keys:
+            if key is not None:
+                yield key
+
+    def values(self):
+        for key, value in zip(self._keys, self._values):
+            if key is not None:
+                yield value
+
+    def items(self):
+        for key, value in zip(self._keys, self._values):
+            if key is not None:
+                yield (key, value)
+
+    # ---------- Instrumentation ----------
+
+    def _probe_lengths(self):
+        for key, dist in zip(self._keys, self._dists):
+            if key is not None:
+                yield dist + 1
+
+    def _chain_lengths(self):
+        return None
+
+    # ---------- Dict-like interface ----------
+
+    def __getitem__(self, key: hashable):
+        index = self._find_slot(key, self.hasher.hash_code(key))
+        if index < 0:
+            raise KeyError(key)
+        return self._values[index]
+
+    # ---------- Resizing ----------
+
+    def _schedule_resize(self, new_capacity: int):
+        self._resize(new_capacity)
+
+    def _resize(self, new_capacity: int):
+        old_keys = self._keys
+        old_values = self._values
+        old_hashes = self._hashes
+
+        self.capacity = new_capacity
+        self.hasher.set_size(new_capacity)
+        self._allocate(new_capacity)
+
+        for key, value, hash_code in zip(old_keys, old_values, old_hashes):
+            if key is not None:
+                self._place(key, value, hash_code)
@@ -0,0 +1,334 @@
+"""Sharded HashMap stored in multiprocessing shared memory."""
+import multiprocessing
+import pickle
+import struct
+from multiprocessing import shared_memory
+from typing import Any, Optional
+
+from .codec import decode_key, encode_key
+from .hashmap import hashable
+from .mmapmap import key_hash
+
+MAGIC = b"FSSM"
+FORMAT_VERSION = 1
+
+# magic, format version, shards, slots per shard, max key bytes, max value bytes
+HEADER = struct.Struct("<4sIIIII")
+HEADER_SIZE = 32
+
+# seqlock version, live entries, occupied slots (live + tombstones)
+SHARD_HEADER = struct.Struct("<QQQ")
+
+# full key hash, key length, value length, state
+SLOT_HEADER = struct.Struct("<QIIBxxx")
+
+EMPTY = 0
+USED = 1
+TOMBSTONE = 2
+
+
+class ShardFullError(Exception):
+    def __init__(self, key: hashable):
+        super().__init__(f"No free slot left for key: {key!r}")
+        self.key = key
+
+
+class SharedShardedHashMap:
+    """
+    Fixed-capacity hash map living in one shared memory block, split into
+    independently locked shards of fixed-width slots (linear probing).
+
+    Hand the object to worker processes when they start (Process arguments
+    or a Pool initializer), using processes from the same `mp_context` the
+    map was created with: it pickles as a reference to the same block and
+    locks, so every process reads and writes one copy of the table. Writers lock
+    their shard; readers use the shard's version counter to read without the
+    lock and only fall back to it when a write overlapped.
+    """
+
+    def __init__(
+        self,
+        num_shards: int = 16,
+        slots_per_shard: int = 1024,
+        max_key_bytes: int = 64,
+        max_value_bytes: int = 192,
+        max_load: float = 0.9,
+        mp_context: Optional[Any] = None,
+    ):
+        self.num_shards = num_shards
+        self.slots_per_shard = slots_per_shard
+        self.max_key_bytes = max_key_bytes
+        self.max_value_bytes = max_value_bytes
+        self.max_load = max_load
+        self._compute_layout()
+
+        self._shm = shared_memory.SharedMemory(create=True, size=self._total_size)
+        self._owner = True
+        HEADER.pack_into(
+            self._shm.buf, 0, MAGIC, FORMAT_VERSION,
+            num_shards, slots_per_shard, max_key_bytes, max_value_bytes,
+        )
+        context = mp_context or multiprocessing.get_context()
+        self._locks = [context.Lock() for _ in range(num_shards)]
+
+    def _compute_layout(self):
+        self._slot_size = SLOT_HEADER.size + self.max_key_bytes + self.max_value_bytes
+        self._shard_size = SHARD_HEADER.size + self.slots_per_shard * self._slot_size
+        self._total_size = HEADER_SIZE + self.num_shards * self._shard_size
+
+    # ---------- Sharing between processes ----------
+
+    def __getstate__(self):
+        return {
+            "name": self._shm.name,
+            "locks": self._locks,
+            "max_load": self.max_load,
+        }
+
+    def __setstate__(self, state: dict[str, Any]):
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._owner = False
+        self._locks = state["locks"]
+        self.max_load = state["max_load"]
+
+        magic, version, shards, slots, key_bytes, value_bytes = HEADER.unpack_from(self._shm.buf, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{state['name']} is not a shared hash map")
+        self.num_shards = shards
+        self.slots_per_shard = slots
+        self.max_key_bytes = key_bytes
+        self.max_value_bytes = value_bytes
+        self._compute_layout()
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self):
+        """Detaches this process from the shared block"""
+        self._shm.close()
+
+    def unlink(self):
+        """Frees the shared block; call once, from the creating process"""
+        self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    # ---------- Layout helpers ----------
+
+    def _locate(self, key: hashable) -> tuple[bytes, int, int]:
+        """Returns (encoded key, hash, shard)"""
+        encoded = encode_key(key)
+        if len(encoded) > self.max_key_bytes:
+            raise ValueError(f"Encoded key exceeds {self.max_key_bytes} bytes: {key!r}")
+        hash_code = key_hash(encoded)
+        return encoded, hash_code, (hash_code >> 32) % self.num_shards
+
+    def _shard_offset(self, shard: int) -> int:
+        return HEADER_SIZE + shard * self._shard_size
+
+    def _slot_offset(self, shard: int, slot: int) -> int:
+        return self._shard_offset(shard) + SHARD_HEADER.size + slot * self._slot_size
+
+    def _read_shard_header(self, shard: int) -> tuple[int, int, int]:
+        return SHARD_HEADER.unpack_from(self._shm.buf, self._shard_offset(shard))
+
+    def _write_shard_header(self, shard: int, version: int, count: int, used: int):
+        SHARD_HEADER.pack_into(self._shm.buf, self._shard_offset(shard), version, count, used)
+
+    def _probe(self, shard: int, encoded: bytes, hash_code: int) -> tuple[int, bool]:
+        """
+        Returns (slot, True) if the key is stored in the shard, else
+        (slot, False) with the first reusable slot, or -1 if there is none.
+        """
+        buf = self._shm.buf
+        slots = self.slots_per_shard
+        slot = hash_code % slots
+        reusable = -1
+
+        for _ in range(slots):
+            offset = self._slot_offset(shard, slot)
+            slot_hash, key_len, _, state = SLOT_HEADER.unpack_from(buf, offset)
+            if state == EMPTY:
+                return (slot if reusable < 0 else reusable), False
+            if state == TOMBSTONE:
+                if reusable < 0:
+                    reusable = slot
+            elif slot_hash == hash_code:
+                start = offset + SLOT_HEADER.size
+                if buf[start:start + key_len] == encoded:
+                    return slot, True
+            slot += 1
+            if slot == slots:
+                slot = 0
+
+        return reusable, False
+
+    def _read_value(self, shard: int, slot: int) -> bytes:
+        offset = self._slot_offset(shard, slot)
+        _, _, value_len, _ = SLOT_HEADER.unpack_from(self._shm.buf, offset)
+        start = offset + SLOT_HEADER.size + self.max_key_bytes
+        return bytes(self._shm.buf[start:start + value_len])
+
+    def _write_slot(self, shard: int, slot: int, hash_code: int, encoded: bytes, data: bytes, state: int):
+        buf = self._shm.buf
+        offset = self._slot_offset(shard, slot)
+        SLOT_HEADER.pack_into(buf, offset, hash_code, len(encoded), len(data), state)
+        key_start = offset + SLOT_HEADER.size
+        buf[key_start:key_start + len(encoded)] = encoded
+        value_start = key_start + self.max_key_bytes
+        buf[value_start:value_start + len(data)] = data
+
+    def _find_value(self, key: hashable) -> Optional[bytes]:
+        encoded, hash_code, shard = self._locate(key)
+
+        version = self._read_shard_header(shard)[0]
+        if not version & 1:
+            slot, found = self._probe(shard, encoded, hash_code)
+            data = self._read_value(shard, slot) if found else None
+            if self._read_shard_header(shard)[0] == version:
+                return data
+
+        with self._locks[shard]:
+            slot, found = self._probe(shard, encoded, hash_code)
+            return self._read_value(shard, slot) if found else None
+
+    def _rebuild_shard(self, shard: int):
+        """Reinserts live entries of a shard to clear its tombstones (lock held)"""
+        entries = []
+        for slot in range(self.slots_per_shard):
+            entry = self._read_slot(shard, slot)
+            if entry is not None:
+                entries.append(entry)
+
+        empty = SLOT_HEADER.pack(0, 0, 0, EMPTY)
+        for slot in range(self.slots_per_shard):
+            offset = self._slot_offset(shard, slot)
+            self._shm.buf[offset:offset + SLOT_HEADER.size] = empty
+
+        for hash_code, encoded, data in entries:
+            slot, _ = self._probe(shard, encoded, hash_code)
+            self._write_slot(shard, slot, hash_code, encoded, data, USED)
+
+    def _read_slot(self, shard: int, slot: int) -> Optional[tuple[int, bytes, bytes]]:
+        buf = self._shm.buf
+        offset = self._slot_offset(shard, slot)
+        hash_code, key_len, value_len, state = SLOT_HEADER.unpack_from(buf, offset)
+        if state != USED:
+            return None
+        key_start = offset + SLOT_HEADER.size
+        value_start = key_start + self.max_key_bytes
+        return (
+            hash_code,
+            bytes(buf[key_start:key_start + key_len]),
+            bytes(buf[value_start:value_start + value_len]),
+        )
+
+    # ---------- Core operations ----------
+
+    def put(self, key: hashable, value: Any):
+        encoded, hash_code, shard = self._locate(key)
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_value_bytes:
+            raise ValueError(f"Pickled value exceeds {self.max_value_bytes} bytes")
+        limit = self.max_load * self.slots_per_shard
+
+        with self._locks[shard]:
+            version, count, used = self._read_shard_header(shard)
+            # an odd version tells optimistic readers a write is in progress
+            self._write_shard_header(shard, version + 1, count, used)
+            try:
+                slot, found = self._probe(shard, encoded, hash_code)
+                if not found and used + 1 > limit:
+                    if count + 1 > limit:
+                        raise ShardFullError(key)
+                    self._rebuild_shard(shard)
+                    used = count
+                    slot, found = self._probe(shard, encoded, hash_code)
+
+                if not found:
+                    state = SLOT_HEADER.unpack_from(self._shm.buf, self._slot_offset(shard, slot))[3]
+                    count += 1
+                    if state == EMPTY:
+                        used += 1
+                self._write_slot(shard, slot, hash_code, encoded, data, USED)
+            finally:
+                self._write_shard_header(shard, version + 2, count, used)
+
+    def get(self, key: hashable, default=None):
+        data = self._find_value(key)
+        if data is None:
+            return default
+        return pickle.loads(data)
+
+    def remove(self, key: hashable):
+        encoded, hash_code, shard = self._locate(key)
+        with self._locks[shard]:
+            slot, found = self._probe(shard, encoded, hash_code)
+            if not found:
+                raise KeyError(key)
+
+            version, count, used = self._read_shard_header(shard)
+            self._write_shard_header(shard, version + 1, count, used)
+            offset = self._slot_offset(shard, slot)
+            SLOT_HEADER.pack_into(self._shm.buf, offset, 0, 0, 0, TOMBSTONE)
+            self._write_shard_header(shard, version + 2, count - 1, used)
+
+    # ---------- Utility methods ----------
+
+    def contains(self, key: hashable) -> bool:
+        return self._find_value(key) is not None
+
+    def size(self) -> int:
+        return sum(self._read_shard_header(shard)[1] for shard in range(self.num_shards))
+
+    def clear(self):
+        for shard in range(self.num_shards):
+            with self._locks[shard]:
+                version = self._read_shard_header(shard)[0]
+                self._write_shard_header(shard, version + 1, 0, 0)
+                start = self._slot_offset(shard, 0)
+                end = start + self.slots_per_shard * self._slot_size
+                self._shm.buf[start:end] = bytes(end - start)
+                self._write_shard_header(shard, version + 2, 0, 0)
+
+    def items(self):
+        """Yields a per-shard consistent snapshot of the entries"""
+        for shard in range(self.num_shards):
+            with self._locks[shard]:
+                entries = [self._read_slot(shard, slot) for slot in range(self.slots_per_shard)]
+            for entry in entries:
+                if entry is not None:
+                    _, encoded, data = entry
+                    yield (decode_key(encoded), pickle.loads(data))
+
+    def keys(self):
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        for _, value in self.items():
+            yield value
+
+    # ---------- Dict-like interface ----------
+
+    def __len__(self):
+        return self.size()
+
+    def __getitem__(self, key: hashable):
+        data = self._find_value(key)
+        if data is None:
+            raise KeyError(key)
+        return pickle.loads(data)
+
+    def __setitem__(self, key: hashable, value: Any):
+        self.put(key, value)
+
+    def __contains__(self, key: hashable) -> bool:
+        return self.contains(key)
@@ -0,0 +1,90 @@
+"""Opt-in health statistics and resize hooks for hash maps."""
+import time
+from types import MethodType
+from typing import Any, Callable
+
+# called with (old_capacity, new_capacity, duration_in_seconds)
+ResizeCallback = Callable[[int, int, float], None]
+
+RESIZE_METHODS = ("_resize", "_start_migration")
+
+
+class HashMapStats:
+    """Resize telemetry collected while a map is instrumented"""
+
+    def __init__(self):
+        self.resize_count = 0
+        self.resize_time = 0.0
+        # (monotonic timestamp, items, capacity) recorded after every resize
+        self.load_history: list[tuple[float, int, int]] = []
+        self.callbacks: list[ResizeCallback] = []
+
+    def record_resize(self, old_capacity: int, new_capacity: int, num_items: int, duration: float):
+        self.resize_count += 1
+        self.resize_time += duration
+        self.load_history.append((time.monotonic(), num_items, new_capacity))
+        for callback in self.callbacks:
+            callback(old_capacity, new_capacity, duration)
+
+
+def instrument(hm: Any, stats: HashMapStats):
+    """
+    Shadows the map's resize methods with timed wrappers stored on the
+    instance, so maps without stats keep calling the plain class methods.
+    """
+    for name in RESIZE_METHODS:
+        original = getattr(type(hm), name, None)
+        if original is None:
+            continue
+
+        def timed(self, new_capacity: int, _original=original):
+            old_capacity = self.capacity
+            start = time.perf_counter()
+            _original(self, new_capacity)
+            duration = time.perf_counter() - start
+            stats.record_resize(old_capacity, new_capacity, self.num_items, duration)
+
+        setattr(hm, name, MethodType(timed, hm))
+
+
+def uninstrument(hm: Any):
+    for name in RESIZE_METHODS:
+        hm.__dict__.pop(name, None)
+
+
+def health_report(hm: Any) -> dict[str, Any]:
+    """
+    Summarizes how well keys are spread. Comparison counts are derived from
+    the table layout: a successful lookup of an entry costs its probe length,
+    a miss in a chained table costs the length of the chain it lands on.
+    """
+    probe_lengths = list(hm._probe_lengths())
+    probe_histogram: dict[int, int] = {}
+    for length in probe_lengths:
+        probe_histogram[length] = probe_histogram.get(length, 0) + 1
+
+    report: dict[str, Any] = {
+        "size": hm.num_items,
+        "capacity": hm.capacity,
+        "load_factor": hm.num_items / hm.capacity,
+        "probe_histogram": dict(sorted(probe_histogram.items())),
+        "max_probe_length": max(probe_lengths, default=0),
+        "avg_comparisons_hit": sum(probe_lengths) / len(probe_lengths) if probe_lengths else 0.0,
+    }
+
+    chain_lengths = hm._chain_lengths()
+    if chain_lengths is not None:
+        chain_lengths = list(chain_lengths)
+        chain_histogram: dict[int, int] = {}
+        for length in chain_lengths:
+            chain_histogram[length] = chain_histogram.get(length, 0) + 1
+        report["chain_histogram"] = dict(sorted(chain_histogram.items()))
+        report["avg_comparisons_miss"] = sum(chain_lengths) / len(chain_lengths) if chain_lengths else 0.0
+
+    stats = hm._stats
+    if stats is not None:
+        report["resize_count"] = stats.resize_count
+        report["resize_time"] = stats.resize_time
+        report["load_history"] = list(stats.load_history)
+
+    return report
@@ -0,0 +1,191 @@
+"""HashMap with expiring entries, reclaimed through a hashed timer wheel."""
+import time
+from typing import Any, Callable, Optional
+
+from .hashmap import DynamicHashMap, hashable
+
+NEVER = float("inf")
+
+
+class TTLEntry:
+    def __init__(self, key: hashable, value: Any, expires_at: float):
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at
+
+
+class TTLHashMap:
+    """
+    Map whose entries expire `ttl` seconds after they were last written.
+
+    Expired entries are never returned: lookups check the deadline and drop
+    the entry on the spot. Memory is reclaimed without scanning the table by
+    a hashed timer wheel of `wheel_size` slots, each covering `tick` seconds
+    and listing the entries that expire in it. Every operation advances the
+    wheel by at most `sweep_slots` elapsed ticks; expire() catches up fully.
+    """
+
+    def __init__(
+        self,
+        default_ttl: Optional[float] = None,
+        tick: float = 1.0,
+        wheel_size: int = 512,
+        sweep_slots: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if default_ttl is not None and default_ttl <= 0:
+            raise ValueError("default_ttl must be positive")
+        if tick <= 0:
+            raise ValueError("tick must be positive")
+        if wheel_size <= 0:
+            raise ValueError("wheel_size must be positive")
+
+        self.default_ttl = default_ttl
+        self.tick = tick
+        self.wheel_size = wheel_size
+        self.sweep_slots = sweep_slots
+        self.clock = clock
+        self.expirations = 0
+
+        self._entries = DynamicHashMap()
+        # entries that may be stale (overwritten or removed) are left in
+        # their slot and skipped when the slot is swept
+        self._wheel: list[list[TTLEntry]] = [[] for _ in range(wheel_size)]
+        self._cursor = self._tick_of(clock())
+
+    def _tick_of(self, timestamp: float) -> int:
+        return int(timestamp // self.tick)
+
+    # ---------- Expiry ----------
+
+    def _expire_entry(self, entry: TTLEntry):
+        self._entries.remove(entry.key)
+        self.expirations += 1
+
+    def _sweep_slot(self, slot: int, now: float):
+        entries = self._entries
+        kept = []
+        for entry in self._wheel[slot]:
+            if entries.get(entry.key) is not entry:
+                continue
+            if entry.expires_at <= now:
+                self._expire_entry(entry)
+            else:
+                # due in a later turn of the wheel
+                kept.append(entry)
+        self._wheel[slot] = kept
+
+    def _advance(self, max_slots: Optional[int] = None) -> float:
+        """Sweeps the slots of ticks that have fully elapsed; returns the current time"""
+        now = self.clock()
+        target = self._tick_of(now)
+        if target - self._cursor > self.wheel_size:
+            # every slot is due at most once per sweep, whatever the gap
+            self._cursor = target - self.wheel_size
+
+        steps = target - self._cursor
+        if max_slots is not None:
+            steps = min(steps, max_slots)
+        for _ in range(steps):
+            self._sweep_slot(self._cursor % self.wheel_size, now)
+            self._cursor += 1
+        return now
+
+    def expire(self) -> int:
+        """Reclaims every entry whose tick has elapsed; returns how many were dropped"""
+        before = self.expirations
+        self._advance()
+        return self.expirations - before
+
+    def _live_entry(self, key: hashable, now: float) -> Optional[TTLEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            self._expire_entry(entry)
+            return None
+        return entry
+
+    # ---------- Core operations ----------
+
+    def put(self, key: hashable, value: Any, ttl: Optional[float] = None):
+        """Stores key for `ttl` seconds (default_ttl if omitted, forever if both are None)"""
+        if ttl is None:
+            ttl = self.default_ttl
+        elif ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        now = self._advance(self.sweep_slots)
+        expires_at = now + ttl if ttl is not None else NEVER
+        entry = TTLEntry(key, value, expires_at)
+        self._entries.put(key, entry)
+        if expires_at != NEVER:
+            self._wheel[self._tick_of(expires_at) % self.wheel_size].append(entry)
+
+    def get(self, key: hashable, default=None):
+        entry = self._live_entry(key, self._advance(self.sweep_slots))
+        if entry is None:
+            return default
+        return entry.value
+
+    def remove(self, key: hashable):
+        entry = self._live_entry(key, self._advance(self.sweep_slots))
+        if entry is None:
+            raise KeyError(key)
+        self._entries.remove(key)
+
+    def ttl(self, key: hashable) -> Optional[float]:
+        """Seconds until key expires, or None if it never does"""
+        now = self._advance(self.sweep_slots)
+        entry = self._live_entry(key, now)
+        if entry is None:
+            raise KeyError(key)
+        if entry.expires_at == NEVER:
+            return None
+        return entry.expires_at - now
+
+    # ---------- Utility methods ----------
+
+    def contains(self, key: hashable) -> bool:
+        return self._live_entry(key, self._advance(self.sweep_slots)) is not None
+
+    def size(self) -> int:
+        """Number of stored entries, which may include expired ones not yet swept"""
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self._wheel = [[] for _ in range(self.wheel_size)]
+        self._cursor = self._tick_of(self.clock())
+
+    def keys(self):
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        for _, value in self.items():
+            yield value
+
+    def items(self):
+        """Yields live entries; expired ones are skipped, not removed"""
+        now = self.clock()
+        for key, entry in self._entries.items():
+            if entry.expires_at > now:
+                yield (key, entry.value)
+
+    # ---------- Dict-like interface ----------
+
+    def __len__(self):
+        return self.size()
+
+    def __getitem__(self, key: hashable):
+        entry = self._live_entry(key, self._advance(self.sweep_slots))
+        if entry is None:
+            raise KeyError(key)
+        return entry.value
+
+    def __setitem__(self, key: hashable, value: Any):
+        self.put(key, value)
+
+    def __contains__(self, key: hashable) -> bool:
+        return self.contains(key)
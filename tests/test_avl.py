@@ -0,0 +1,234 @@
+import random
+
+import pytest
+from trees import AVLTree, BinarySearchTree, DuplicateKeyError, KeyDoesNotExist
+
+
+def assert_balanced(tree):
+    """Checks ordering, stored heights and the AVL balance invariant"""
+    def check(node, lo, hi):
+        if node is None:
+            return -1
+        assert lo < node.key < hi
+        left = check(node.left, lo, node.key)
+        right = check(node.right, node.key, hi)
+        assert abs(left - right) <= 1
+        assert node.height == 1 + max(left, right)
+        if tree._order_statistics:
+            assert node.size == 1 + size(node.left) + size(node.right)
+        return node.height
+
+    def size(node):
+        return node.size if node is not None else 0
+
+    check(tree.root, float("-inf"), float("inf"))
+
+
+# ---------- Basic operations ----------
+
+def test_is_a_binary_search_tree():
+    assert isinstance(AVLTree(), BinarySearchTree)
+
+
+def test_insert_and_search():
+    tree = AVLTree()
+    for key in (10, 5, 15):
+        tree.insert(key)
+
+    assert tree.search(10) is True
+    assert 5 in tree
+    assert tree.search(20) is False
+    assert len(tree) == 3
+
+
+def test_insert_duplicate_raises_error():
+    tree = AVLTree()
+    tree.insert(10)
+
+    with pytest.raises(DuplicateKeyError) as exc_info:
+        tree.insert(10)
+
+    assert exc_info.value.key == 10
+    assert len(tree) == 1
+
+
+def test_delete_nonexistent_key_raises_error():
+    tree = AVLTree()
+    tree.insert(10)
+
+    with pytest.raises(KeyDoesNotExist) as exc_info:
+        tree.delete(20)
+
+    assert exc_info.value.key == 20
+
+
+def test_min_max_and_empty():
+    tree = AVLTree()
+    with pytest.raises(ValueError):
+        tree.min()
+
+    for key in (40, 10, 90, 25):
+        tree.insert(key)
+    assert tree.min() == 10
+    assert tree.max() == 90
+
+
+# ---------- Balancing ----------
+
+@pytest.mark.parametrize("keys", [range(1000), range(1000, 0, -1)])
+def test_sorted_insertion_stays_logarithmic(keys):
+    tree = AVLTree()
+    for key in keys:
+        tree.insert(key)
+
+    assert_balanced(tree)
+    # an AVL tree of n nodes is at most ~1.44 log2(n) high
+    assert tree.height() <= 14
+    assert tree.inorder() == sorted(keys)
+
+
+def test_all_rotation_cases():
+    for keys in ([3, 2, 1], [1, 2, 3], [3, 1, 2], [1, 3, 2]):
+        tree = AVLTree()
+        for key in keys:
+            tree.insert(key)
+
+        assert tree.root.key == 2
+        assert tree.preorder() == [2, 1, 3]
+
+
+def test_delete_rebalances():
+    tree = AVLTree()
+    for key in range(1, 8):
+        tree.insert(key)
+    for key in (1, 2, 3):
+        tree.delete(key)
+
+    assert_balanced(tree)
+    assert tree.inorder() == [4, 5, 6, 7]
+
+
+def test_delete_node_with_two_children():
+    tree = AVLTree()
+    for key in (50, 30, 70, 20, 40, 60, 80):
+        tree.insert(key)
+    tree.delete(50)
+
+    assert_balanced(tree)
+    assert tree.inorder() == [20, 30, 40, 60, 70, 80]
+    assert 50 not in tree
+
+
+def test_random_workload_matches_set():
+    rng = random.Random(3)
+    tree = AVLTree()
+    expected = set()
+    for _ in range(3000):
+        key = rng.randrange(500)
+        if key in expected:
+            tree.delete(key)
+            expected.remove(key)
+        else:
+            tree.insert(key)
+            expected.add(key)
+
+    assert_balanced(tree)
+    assert tree.inorder() == sorted(expected)
+    assert len(tree) == len(expected)
+
+
+def test_height_matches_base_computation():
+    tree = AVLTree()
+    for key in range(100):
+        tree.insert(key)
+
+    assert tree.height() == BinarySearchTree.height(tree)
+
+
+def test_clear_and_reuse():
+    tree = AVLTree()
+    for key in range(10):
+        tree.insert(key)
+    tree.clear()
+    tree.insert(5)
+
+    assert tree.height() == 0
+    assert list(tree) == [5]
+
+
+def test_repr():
+    tree = AVLTree()
+    for key in (2, 1, 3):
+        tree.insert(key)
+
+    assert repr(tree) == "AVLTree(nodes=[1, 2, 3])"
+
+
+# ---------- Bulk construction ----------
+
+def test_from_sorted_builds_valid_avl_tree():
+    tree = AVLTree.from_sorted(range(1000))
+
+    assert isinstance(tree, AVLTree)
+    assert_balanced(tree)
+    assert tree.height() == 9
+
+    for key in range(0, 1000, 3):
+        tree.delete(key)
+    for key in range(1000, 1500):
+        tree.insert(key)
+    assert_balanced(tree)
+
+
+def test_from_iterable_rejects_duplicates():
+    tree = AVLTree.from_iterable([3, 1, 2])
+    assert_balanced(tree)
+    assert tree.inorder() == [1, 2, 3]
+
+    with pytest.raises(DuplicateKeyError):
+        AVLTree.from_iterable([3, 1, 3])
+
+
+def test_rebuild_keeps_heights():
+    tree = AVLTree()
+    for key in range(100):
+        tree.insert(key)
+
+    tree.rebuild()
+
+    assert_balanced(tree)
+    assert tree.height() == 6
+
+
+# ---------- Order statistics ----------
+
+def test_sizes_survive_rotations():
+    rng = random.Random(3)
+    tree = AVLTree(order_statistics=True)
+    keys = set()
+    for _ in range(3000):
+        key = rng.randrange(500)
+        if key in keys:
+            tree.delete(key)
+            keys.remove(key)
+        else:
+            tree.insert(key)
+            keys.add(key)
+
+        if len(keys) % 50 == 0:
+            assert_balanced(tree)
+
+    ordered = sorted(keys)
+    assert [tree.select(k) for k in range(len(ordered))] == ordered
+    assert all(tree.rank(key) == i for i, key in enumerate(ordered))
+    assert tree.count_range(100, 199) == sum(100 <= key <= 199 for key in keys)
+
+
+def test_bulk_built_tree_has_sizes():
+    tree = AVLTree.from_sorted(range(100), order_statistics=True)
+    tree.insert(100)
+    tree.delete(0)
+
+    assert tree.select(0) == 1
+    assert tree.rank(100) == 99
+    assert tree.percentile(50) == 50
@@ -0,0 +1,26 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.workloads import make_keys
+
+
+def test_workloads_are_distinct_and_disjoint():
+    for key_type in ("int", "str"):
+        for distribution in ("random", "sequential", "adversarial"):
+            present, absent = make_keys(100, key_type, distribution)
+            assert len(set(present)) == 100
+            assert len(set(absent)) == 100
+            assert not set(present) & set(absent)
+
+
+def test_suite_writes_json(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    main(["--sizes", "50", "--no-memory", "--output", str(output)])
+    main(["--sizes", "50", "--structures", "dynamic", "--compare", str(output)])
+
+    rows = json.loads(output.read_text())["results"]
+    ops = {(row["structure"], row["op"]) for row in rows}
+    assert ("dynamic", "insert") in ops
+    assert ("bst", "search_hit") in ops
+    assert all(row["size"] == 50 for row in rows)
+    assert "x" in capsys.readouterr().out
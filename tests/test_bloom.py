@@ -0,0 +1,74 @@
+import pytest
+from hashmap.bloom import BloomFilter, CountingBloomFilter
+from hashmap.hashing import hash_key
+
+
+def test_added_codes_are_found():
+    bf = BloomFilter(1000)
+    for i in range(1000):
+        bf.add(i * 7919)
+
+    assert all(bf.might_contain(i * 7919) for i in range(1000))
+    assert len([i for i in range(1000) if i * 7919 in bf]) == 1000
+
+
+def test_false_positive_rate_close_to_target():
+    # the filter relies on HashMap hashing to have mixed the codes
+    bf = BloomFilter(10_000, fp_rate=0.01)
+    for i in range(10_000):
+        bf.add(hash_key(i))
+
+    false_positives = sum(bf.might_contain(hash_key(i)) for i in range(10_000, 110_000))
+    assert false_positives / 100_000 < 0.02
+
+
+def test_sizing():
+    bf = BloomFilter(1000, fp_rate=0.01)
+
+    assert 9000 < bf.num_bits < 10_000
+    assert bf.num_hashes == 7
+
+
+def test_handles_large_and_negative_codes():
+    bf = BloomFilter(10)
+    bf.add(-1)
+    bf.add(31 ** 40)
+
+    assert bf.might_contain(-1)
+    assert bf.might_contain(31 ** 40)
+
+
+def test_clear():
+    bf = BloomFilter(10)
+    bf.add(1)
+    bf.clear()
+
+    assert not bf.might_contain(1)
+    assert bf.count == 0
+
+
+def test_invalid_fp_rate():
+    with pytest.raises(ValueError):
+        BloomFilter(10, fp_rate=0)
+    with pytest.raises(ValueError):
+        BloomFilter(10, fp_rate=1.5)
+
+
+def test_counting_remove():
+    bf = CountingBloomFilter(100)
+    bf.add(1)
+    bf.add(2)
+    bf.remove(1)
+
+    assert not bf.might_contain(1)
+    assert bf.might_contain(2)
+    assert bf.count == 1
+
+
+def test_counting_keeps_duplicates():
+    bf = CountingBloomFilter(100)
+    bf.add(5)
+    bf.add(5)
+    bf.remove(5)
+
+    assert bf.might_contain(5)
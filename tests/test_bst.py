@@ -1,5 +1,7 @@
+import random
+
 import pytest
-from trees import BinarySearchTree, DuplicateKeyError, KeyDoesNotExist
+from trees import BinarySearchTree, DuplicateKeyError, KeyDoesNotExist, Node
 
 
 # ---------- Basic operations ----------
@@ -550,3 +552,232 @@ def test_repr():
     r = repr(bst)
     assert "BinarySearchTree" in r
     assert "[30, 50, 70]" in r
+
+
+# ---------- Deep trees ----------
+
+def make_chain(n):
+    """Builds the degenerate right-leaning tree sorted inserts produce, without O(n^2) inserts"""
+    bst = BinarySearchTree()
+    bst.root = current = Node(0)
+    for key in range(1, n):
+        current.right = Node(key)
+        current = current.right
+    bst._size = n
+    return bst
+
+
+def test_deep_tree_search_and_height():
+    bst = make_chain(20_000)
+
+    assert bst.search(19_999) is True
+    assert bst.search(20_000) is False
+    assert bst.height() == 19_999
+
+
+def test_deep_tree_traversals():
+    bst = make_chain(20_000)
+
+    assert bst.inorder() == list(range(20_000))
+    assert bst.preorder() == list(range(20_000))
+    assert bst.postorder() == list(range(19_999, -1, -1))
+    assert sum(1 for _ in bst) == 20_000
+
+
+def test_traversals_of_mixed_shape():
+    bst = BinarySearchTree()
+    for key in [50, 30, 70, 20, 40, 60, 80, 35, 45, 65]:
+        bst.insert(key)
+
+    assert bst.preorder() == [50, 30, 20, 40, 35, 45, 70, 60, 65, 80]
+    assert bst.postorder() == [20, 35, 45, 40, 30, 65, 60, 80, 70, 50]
+    assert bst.height() == 3
+
+
+# ---------- Streaming traversals ----------
+
+def test_iter_traversals_match_lists():
+    bst = BinarySearchTree()
+    for key in [50, 30, 70, 20, 40, 60, 80]:
+        bst.insert(key)
+
+    assert list(bst.iter_inorder()) == bst.inorder()
+    assert list(bst.iter_preorder()) == bst.preorder()
+    assert list(bst.iter_postorder()) == bst.postorder()
+
+
+def test_iter_traversals_are_lazy():
+    bst = make_chain(20_000)
+    keys = bst.iter_inorder()
+
+    assert next(keys) == 0
+    assert next(keys) == 1
+    assert not isinstance(bst.iter_preorder(), list)
+
+
+def test_reversed():
+    bst = BinarySearchTree()
+    for key in [50, 30, 70, 20, 40, 60, 80]:
+        bst.insert(key)
+
+    assert list(reversed(bst)) == [80, 70, 60, 50, 40, 30, 20]
+    assert list(reversed(BinarySearchTree())) == []
+
+
+def test_repr_is_bounded():
+    bst = make_chain(20_000)
+
+    r = repr(bst)
+    assert r == "BinarySearchTree(size=20000, nodes=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, ...])"
+
+
+def test_repr_empty_tree():
+    assert repr(BinarySearchTree()) == "BinarySearchTree(nodes=[])"
+
+
+# ---------- Bulk construction ----------
+
+def test_from_sorted_is_balanced():
+    bst = BinarySearchTree.from_sorted(range(1023))
+
+    assert bst.inorder() == list(range(1023))
+    assert len(bst) == 1023
+    assert bst.height() == 9
+
+
+def test_from_sorted_empty():
+    bst = BinarySearchTree.from_sorted([])
+
+    assert bst.is_empty()
+    assert bst.height() == -1
+
+
+def test_from_sorted_rejects_bad_input():
+    with pytest.raises(DuplicateKeyError):
+        BinarySearchTree.from_sorted([1, 2, 2, 3])
+    with pytest.raises(ValueError, match="not sorted"):
+        BinarySearchTree.from_sorted([1, 3, 2])
+
+
+def test_from_iterable():
+    bst = BinarySearchTree.from_iterable([50, 20, 80, 10, 30, 70])
+
+    assert bst.inorder() == [10, 20, 30, 50, 70, 80]
+    assert bst.height() == 2
+    with pytest.raises(DuplicateKeyError):
+        BinarySearchTree.from_iterable([5, 1, 5])
+
+
+def test_rebuild_balances_degenerate_tree():
+    bst = make_chain(20_000)
+    root_nodes = set(map(id, bst._inorder_nodes(bst.root)))
+
+    bst.rebuild()
+
+    assert bst.height() == 14
+    assert len(bst) == 20_000
+    assert list(bst) == list(range(20_000))
+    assert set(map(id, bst._inorder_nodes(bst.root))) == root_nodes
+
+    bst.insert(-1)
+    bst.delete(10_000)
+    assert bst.min() == -1
+    assert 10_000 not in bst
+
+
+def test_rebuild_empty_tree():
+    bst = BinarySearchTree()
+    bst.rebuild()
+
+    assert bst.is_empty()
+
+
+# ---------- Order statistics ----------
+
+def assert_sizes(bst):
+    """Checks that every node's size matches its subtree"""
+    def check(node):
+        if node is None:
+            return 0
+        size = 1 + check(node.left) + check(node.right)
+        assert node.size == size
+        return size
+
+    assert check(bst.root) == len(bst)
+
+
+def test_rank_and_select():
+    bst = BinarySearchTree(order_statistics=True)
+    for key in [50, 30, 70, 20, 40, 60, 80]:
+        bst.insert(key)
+
+    assert [bst.select(k) for k in range(7)] == [20, 30, 40, 50, 60, 70, 80]
+    assert bst.rank(20) == 0
+    assert bst.rank(50) == 3
+    assert bst.rank(55) == 4
+    assert bst.rank(100) == 7
+    with pytest.raises(IndexError):
+        bst.select(7)
+    with pytest.raises(IndexError):
+        bst.select(-1)
+
+
+def test_count_range():
+    bst = BinarySearchTree.from_iterable(range(0, 100, 10), order_statistics=True)
+
+    assert bst.count_range(20, 50) == 4
+    assert bst.count_range(15, 55) == 4
+    assert bst.count_range(-10, 1000) == 10
+    assert bst.count_range(51, 59) == 0
+    assert bst.count_range(50, 20) == 0
+
+
+def test_percentile():
+    bst = BinarySearchTree.from_sorted(range(1, 101), order_statistics=True)
+
+    assert bst.percentile(0) == 1
+    assert bst.percentile(50) == 50
+    assert bst.percentile(99.5) == 100
+    assert bst.percentile(100) == 100
+    with pytest.raises(ValueError):
+        bst.percentile(101)
+    with pytest.raises(ValueError, match="Tree is empty"):
+        BinarySearchTree(order_statistics=True).percentile(50)
+
+
+def test_sizes_maintained_through_updates():
+    rng = random.Random(7)
+    bst = BinarySearchTree(order_statistics=True)
+    keys = set()
+    for _ in range(2000):
+        key = rng.randrange(300)
+        if key in keys:
+            bst.delete(key)
+            keys.remove(key)
+        else:
+            bst.insert(key)
+            keys.add(key)
+    assert_sizes(bst)
+
+    with pytest.raises(DuplicateKeyError):
+        bst.insert(next(iter(keys)))
+    with pytest.raises(KeyDoesNotExist):
+        bst.delete(-1)
+    assert_sizes(bst)
+
+    ordered = sorted(keys)
+    assert [bst.select(k) for k in range(len(ordered))] == ordered
+    assert all(bst.rank(key) == i for i, key in enumerate(ordered))
+
+    bst.rebuild()
+    assert_sizes(bst)
+
+
+def test_order_statistics_disabled_by_default():
+    bst = BinarySearchTree()
+    bst.insert(1)
+
+    with pytest.raises(RuntimeError):
+        bst.rank(1)
+    with pytest.raises(RuntimeError):
+        bst.select(0)
@@ -0,0 +1,188 @@
+import pytest
+from hashmap import BoundedCache
+
+
+# ---------- LRU ----------
+
+def test_lru_evicts_least_recently_used():
+    cache = BoundedCache(max_size=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.evictions == 1
+
+
+def test_lru_overwrite_refreshes_entry():
+    cache = BoundedCache(max_size=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["a"] = 10
+    cache["c"] = 3
+
+    assert cache.get("a") == 10
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_lru_items_most_recent_first():
+    cache = BoundedCache(max_size=3)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    cache.get("a")
+
+    assert list(cache.keys()) == ["a", "c", "b"]
+
+
+# ---------- LFU ----------
+
+def test_lfu_evicts_least_frequently_used():
+    cache = BoundedCache(max_size=2, policy="lfu")
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache.get("a")
+    cache.get("b")
+    cache["c"] = 3
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+
+def test_lfu_ties_broken_by_recency():
+    cache = BoundedCache(max_size=2, policy="lfu")
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+
+    assert "a" not in cache
+    assert list(cache.keys()) == ["c", "b"]
+
+
+def test_lfu_eviction_after_explicit_remove():
+    cache = BoundedCache(max_size=2, policy="lfu")
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("b")
+    cache.remove("a")
+    cache["c"] = 3
+    cache.get("c")
+    cache.get("c")
+    cache["d"] = 4
+
+    assert "b" not in cache
+    assert set(cache.keys()) == {"c", "d"}
+
+
+def test_lfu_items_by_frequency():
+    cache = BoundedCache(max_size=3, policy="lfu")
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+    for _ in range(3):
+        cache.get("b")
+    cache.get("c")
+
+    assert list(cache.keys()) == ["b", "c", "a"]
+
+
+# ---------- Limits and counters ----------
+
+def test_max_bytes_limit():
+    cache = BoundedCache(max_bytes=100, sizeof=len)
+    cache["a"] = "x" * 40
+    cache["b"] = "y" * 40
+    cache["c"] = "z" * 40
+
+    assert "a" not in cache
+    assert cache.current_bytes == 80
+    assert cache.evictions == 1
+
+
+def test_value_larger_than_max_bytes_is_not_stored():
+    cache = BoundedCache(max_bytes=10, sizeof=len)
+    cache["a"] = "small"
+    cache["a"] = "x" * 50
+
+    assert "a" not in cache
+    assert cache.current_bytes == 0
+    assert cache.evictions == 0
+
+
+def test_hit_and_miss_counters():
+    cache = BoundedCache(max_size=10)
+    cache["a"] = 1
+    cache.get("a")
+    cache.get("missing")
+    with pytest.raises(KeyError):
+        cache["missing"]
+
+    assert cache.hits == 1
+    assert cache.misses == 2
+    assert cache.hit_rate() == pytest.approx(1 / 3)
+
+
+def test_contains_does_not_refresh():
+    cache = BoundedCache(max_size=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert "a" in cache
+    cache["c"] = 3
+
+    assert "a" not in cache
+    assert cache.hits == 0
+
+
+def test_remove_and_clear():
+    cache = BoundedCache(max_size=5, policy="lfu")
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.remove("a")
+
+    with pytest.raises(KeyError):
+        cache.remove("a")
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    cache["c"] = 3
+    assert cache["c"] == 3
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        BoundedCache(policy="fifo")
+    with pytest.raises(ValueError):
+        BoundedCache(max_size=0)
+    with pytest.raises(ValueError):
+        BoundedCache(max_bytes=-1)
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu"])
+def test_size_never_exceeds_limit(policy):
+    cache = BoundedCache(max_size=50, policy=policy)
+    for i in range(1000):
+        cache[i % 120] = i
+        cache.get(i % 7)
+
+    assert len(cache) == 50
+    assert len(list(cache.items())) == 50
+
+
+def test_lfu_overwrite_keeps_frequency():
+    cache = BoundedCache(max_size=2, policy="lfu")
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache.get("a")
+    cache["a"] = 10
+    cache["c"] = 3
+
+    assert cache["a"] == 10
+    assert "b" not in cache
@@ -0,0 +1,211 @@
+import random
+
+import pytest
+from hashmap import CompactHashMap, KeyedHasher
+
+
+class Key:
+    """Key with a chosen hash code, for building exact collisions"""
+
+    def __init__(self, name, hash_code):
+        self.name = name
+        self.hash_code = hash_code
+
+    def __eq__(self, other):
+        return isinstance(other, Key) and self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+
+def test_put_and_get():
+    hm = CompactHashMap()
+    hm.put("a", 1)
+    hm.put("b", 2)
+
+    assert hm.get("a") == 1
+    assert hm.get("b") == 2
+    assert hm.get("missing", 42) == 42
+
+
+def test_put_overwrite_keeps_position():
+    hm = CompactHashMap()
+    hm["a"] = 1
+    hm["b"] = 2
+    hm["a"] = 99
+
+    assert list(hm.items()) == [("a", 99), ("b", 2)]
+    assert len(hm) == 2
+
+
+def test_iteration_is_insertion_ordered():
+    hm = CompactHashMap(initial_capacity=2)
+    keys = [17, "z", 3, "a", 100, 1]
+    for i, key in enumerate(keys):
+        hm[key] = i
+
+    assert list(hm.keys()) == keys
+    assert list(hm.values()) == list(range(len(keys)))
+
+
+def test_remove():
+    hm = CompactHashMap(initial_capacity=4)
+    hm.put(1, "one")
+    hm.put(5, "five")
+    hm.put(9, "nine")
+
+    hm.remove(5)
+
+    assert hm.get(5) is None
+    assert hm[1] == "one"
+    assert hm[9] == "nine"
+    assert list(hm.keys()) == [1, 9]
+    assert len(hm) == 2
+
+
+def test_remove_missing_key():
+    hm = CompactHashMap()
+    with pytest.raises(KeyError):
+        hm.remove("missing")
+
+
+def test_getitem_missing_raises():
+    hm = CompactHashMap()
+    with pytest.raises(KeyError):
+        hm["missing"]
+
+
+def test_resize():
+    hm = CompactHashMap(initial_capacity=4, load_factor=0.75)
+    hm.put("a", 1)
+    hm.put("b", 2)
+    hm.put("c", 3)
+
+    assert hm.capacity == 8
+    assert list(hm.items()) == [("a", 1), ("b", 2), ("c", 3)]
+
+
+def test_churn_compacts_without_growing():
+    hm = CompactHashMap(initial_capacity=16)
+
+    for i in range(1000):
+        hm[i] = i
+        hm.remove(i)
+
+    assert len(hm) == 0
+    assert hm.capacity == 16
+    assert len(hm._keys) < 16
+
+
+@pytest.mark.parametrize("load_factor", [1, 1.5, 10])
+def test_load_factor_of_one_or_more(load_factor):
+    hm = CompactHashMap(load_factor=load_factor)
+    for i in range(200):
+        hm[i] = i
+    for i in range(150):
+        hm.remove(i)
+    for i in range(1000, 1200):
+        hm[i] = i
+
+    assert hm.get("missing") is None
+    assert len(hm) == 250
+    assert all(hm[i] == i for i in range(150, 200))
+
+    hm.shrink_to_fit()
+    assert hm.get("missing") is None
+    assert list(hm.keys()) == list(range(150, 200)) + list(range(1000, 1200))
+
+
+def test_index_uses_narrow_typecode():
+    assert CompactHashMap(initial_capacity=8)._index.typecode == "b"
+    assert CompactHashMap(initial_capacity=1000)._index.typecode == "h"
+
+
+def test_clear():
+    hm = CompactHashMap()
+    hm["a"] = 1
+    hm.clear()
+
+    assert len(hm) == 0
+    assert "a" not in hm
+    assert list(hm.items()) == []
+
+    hm["b"] = 2
+    assert list(hm.items()) == [("b", 2)]
+
+
+def test_matches_dict_under_random_workload():
+    rng = random.Random(99)
+    hm = CompactHashMap(initial_capacity=4)
+    expected = {}
+
+    for _ in range(3000):
+        key = rng.choice([rng.randrange(200), f"k{rng.randrange(200)}"])
+        if rng.random() < 0.3 and key in expected:
+            hm.remove(key)
+            del expected[key]
+        else:
+            hm[key] = rng.random()
+            expected[key] = hm[key]
+
+    assert len(hm) == len(expected)
+    assert list(hm.items()) == list(expected.items())
+
+
+def test_bulk_operations_preserve_order():
+    hm = CompactHashMap.from_items([(i, str(i)) for i in range(300, 0, -1)])
+
+    assert hm.capacity == 512
+    assert list(hm.keys()) == list(range(300, 0, -1))
+    assert hm.remove_many([300, 1, 1000]) == 2
+    assert hm.get_many([299, 300]) == ["299", None]
+
+
+def test_dump_and_load_preserve_order(tmp_path):
+    hm = CompactHashMap.from_items([("z", 1), ("a", 2), ("m", 3)])
+    path = tmp_path / "snapshot.bin"
+    hm.dump(path)
+
+    loaded = CompactHashMap.load(path)
+    assert isinstance(loaded, CompactHashMap)
+    assert list(loaded.items()) == [("z", 1), ("a", 2), ("m", 3)]
+
+
+def test_shrinking_keeps_order():
+    hm = CompactHashMap(shrink_load_factor=0.1)
+    for i in range(1000):
+        hm[i] = i
+    for i in range(990):
+        hm.remove(i)
+
+    assert hm.capacity <= 64
+    assert len(hm._keys) <= 64
+    assert list(hm.keys()) == list(range(990, 1000))
+
+    hm.clear()
+    assert hm.capacity == 8
+
+
+def test_health_reports_probe_lengths():
+    hm = CompactHashMap(initial_capacity=16)
+    for hash_code in (1, 17, 33):
+        hm.put(Key(hash_code, hash_code), hash_code)
+
+    report = hm.health()
+    assert report["probe_histogram"] == {1: 1, 2: 1, 3: 1}
+    assert report["avg_comparisons_hit"] == 2.0
+
+
+def test_accepts_dynamic_hashmap_options():
+    hm = CompactHashMap(16, 0.75, resize_batch=8, bloom_fp_rate=0.05, hash_seed=b"seed")
+    for i in range(100):
+        hm[i] = i
+
+    assert isinstance(hm.hasher, KeyedHasher)
+    assert all(hm[i] == i for i in range(100))
+
+
+@pytest.mark.parametrize("option", [{"incremental_resize": True}, {"bloom": "standard"}])
+def test_rejects_unsupported_options(option):
+    with pytest.raises(ValueError, match="CompactHashMap does not support"):
+        CompactHashMap(**option)
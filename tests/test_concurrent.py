@@ -0,0 +1,154 @@
+import sys
+import threading
+
+import pytest
+from hashmap import ConcurrentHashMap
+
+
+@pytest.fixture
+def fast_switching():
+    # force frequent thread switches so operations actually interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def run_threads(target, count):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_put_and_get():
+    hm = ConcurrentHashMap()
+    hm.put("a", 1)
+    hm["b"] = 2
+
+    assert hm.get("a") == 1
+    assert hm["b"] == 2
+    assert hm.get("missing", 0) == 0
+    assert len(hm) == 2
+
+
+def test_remove_and_contains():
+    hm = ConcurrentHashMap()
+    hm["a"] = 1
+    hm.remove("a")
+
+    assert "a" not in hm
+    assert hm.contains("a") is False
+    with pytest.raises(KeyError):
+        hm.remove("a")
+    with pytest.raises(KeyError):
+        hm["a"]
+
+
+def test_put_if_absent():
+    hm = ConcurrentHashMap()
+
+    assert hm.put_if_absent("a", 1) == 1
+    assert hm.put_if_absent("a", 2) == 1
+    assert hm["a"] == 1
+
+
+def test_keys_spread_over_segments():
+    hm = ConcurrentHashMap(concurrency_level=8)
+    for i in range(1000):
+        hm[i] = i
+
+    assert all(segment.map.num_items > 0 for segment in hm.segments)
+    assert sorted(hm.keys()) == list(range(1000))
+    assert sorted(hm.values()) == list(range(1000))
+
+
+@pytest.mark.parametrize("stride", [16, 1 << 20])
+def test_strided_keys_spread_over_segments(stride):
+    hm = ConcurrentHashMap(concurrency_level=16)
+    for i in range(1000):
+        hm[i * stride] = i
+
+    counts = [segment.map.num_items for segment in hm.segments]
+    assert max(counts) < 2 * 1000 / 16
+
+
+def test_optimistic_read_retries_when_bins_vanish():
+    hm = ConcurrentHashMap(concurrency_level=1)
+    segment = hm.segments[0]
+    hm[1] = "one"
+
+    class VanishingBins(list):
+        def __getitem__(self, index):
+            # a resize resetting the bins right after the reader checked them
+            segment.map._bins = None
+            raise TypeError("'NoneType' object is not subscriptable")
+
+    segment.map._bins = VanishingBins([None] * segment.map.capacity)
+    assert hm.get(1) == "one"
+
+
+def test_clear():
+    hm = ConcurrentHashMap()
+    for i in range(100):
+        hm[i] = i
+    hm.clear()
+
+    assert len(hm) == 0
+    assert list(hm.items()) == []
+
+
+def test_concurrent_writers(fast_switching):
+    hm = ConcurrentHashMap(initial_capacity=4, concurrency_level=4)
+
+    def writer(worker):
+        for i in range(2000):
+            hm[(worker * 2000) + i] = worker
+
+    run_threads(writer, 8)
+
+    assert len(hm) == 16000
+    assert all(hm[i] == i // 2000 for i in range(16000))
+
+
+def test_concurrent_put_if_absent_single_winner(fast_switching):
+    hm = ConcurrentHashMap()
+    results = []
+
+    def contender(worker):
+        results.append(hm.put_if_absent("key", worker))
+
+    run_threads(contender, 16)
+
+    assert len(set(results)) == 1
+    assert hm["key"] == results[0]
+
+
+def test_readers_during_resizes(fast_switching):
+    hm = ConcurrentHashMap(initial_capacity=2, concurrency_level=2)
+    for i in range(100):
+        hm[i] = i
+    errors = []
+    done = threading.Event()
+
+    def reader(_):
+        while not done.is_set():
+            for i in range(100):
+                if hm.get(i) != i:
+                    errors.append(i)
+
+    def writer(_):
+        for i in range(100, 20000):
+            hm[i] = i
+        done.set()
+
+    readers = [threading.Thread(target=reader, args=(i,)) for i in range(3)]
+    for thread in readers:
+        thread.start()
+    writer(0)
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert len(hm) == 20000
@@ -0,0 +1,205 @@
+import random
+
+import pytest
+from hashmap import CuckooHashMap, KeyedHasher
+from hashmap.cuckoo import BUCKET_SIZE, STASH_SIZE
+from hashmap.hashing import mix64
+
+
+class Key:
+    """Key with a chosen hash code, for building exact collisions"""
+
+    def __init__(self, name, hash_code):
+        self.name = name
+        self.hash_code = hash_code
+
+    def __eq__(self, other):
+        return isinstance(other, Key) and self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+
+def test_put_and_get():
+    hm = CuckooHashMap()
+    hm.put("a", 1)
+    hm.put("b", 2)
+
+    assert hm.get("a") == 1
+    assert hm.get("b") == 2
+    assert hm.get("missing") is None
+    assert hm.get("missing", 42) == 42
+
+
+def test_put_overwrite():
+    hm = CuckooHashMap()
+    hm.put("a", 1)
+    hm.put("a", 99)
+
+    assert hm["a"] == 99
+    assert len(hm) == 1
+
+
+def test_getitem_missing_raises():
+    hm = CuckooHashMap()
+    with pytest.raises(KeyError):
+        hm["missing"]
+
+
+def test_remove():
+    hm = CuckooHashMap()
+    for i in range(50):
+        hm[i] = i
+    hm.remove(10)
+
+    assert 10 not in hm
+    assert len(hm) == 49
+    with pytest.raises(KeyError):
+        hm.remove(10)
+
+
+def test_capacity_rounds_to_whole_buckets():
+    assert CuckooHashMap(initial_capacity=1).capacity == 2 * BUCKET_SIZE
+    assert CuckooHashMap(initial_capacity=13).capacity == 16
+
+
+def test_high_load_factor():
+    hm = CuckooHashMap(initial_capacity=1024, load_factor=0.95)
+    for i in range(900):
+        hm[i] = i
+
+    assert hm.capacity == 1024
+    assert all(hm[i] == i for i in range(900))
+
+
+def test_lookups_probe_at_most_two_buckets_and_stash():
+    hm = CuckooHashMap()
+    for i in range(5000):
+        hm[f"key-{i}"] = i
+
+    report = hm.health()
+    assert report["max_probe_length"] <= 3
+    assert len(hm._stash) <= STASH_SIZE
+
+
+def test_colliding_keys_use_stash_then_grow():
+    hm = CuckooHashMap(initial_capacity=8, load_factor=1.0)
+    # identical hash codes share both buckets, so only 8 slots plus the stash fit
+    keys = [Key(i, 0) for i in range(2 * BUCKET_SIZE + STASH_SIZE)]
+    for key in keys:
+        hm[key] = key.name
+
+    assert len(hm._stash) == STASH_SIZE
+    assert all(hm[key] == key.name for key in keys)
+    assert sorted(hm.values()) == list(range(len(keys)))
+
+    hm.remove(keys[0])
+    assert len(hm._stash) == STASH_SIZE - 1
+    assert all(hm[key] == key.name for key in keys[1:])
+
+
+def test_overflowing_stash_grows_table():
+    hm = CuckooHashMap(initial_capacity=8, load_factor=1.0)
+    # hash codes 0 and 1 share their first bucket in an 8-slot table
+    keys = [Key(i, 2 * i + (i % 2)) for i in range(8)]
+    for key in keys:
+        hm[key] = key.name
+
+    assert all(hm[key] == key.name for key in keys)
+    assert len(hm._stash) <= STASH_SIZE
+
+
+def test_identical_hash_codes_do_not_grow_forever():
+    hm = CuckooHashMap()
+    keys = [Key(i, 7) for i in range(40)]
+    for key in keys:
+        hm[key] = key.name
+
+    # the load alone needs 64 slots; failed walks add at most a few doublings
+    assert hm.capacity <= 256
+    assert all(hm[key] == key.name for key in keys)
+    assert len(hm) == 40
+
+
+def test_matches_dict_under_random_workload():
+    rng = random.Random(1)
+    hm = CuckooHashMap()
+    expected = {}
+    for _ in range(5000):
+        key = rng.randrange(800)
+        if rng.random() < 0.3 and key in expected:
+            hm.remove(key)
+            del expected[key]
+        else:
+            hm[key] = key * 3
+            expected[key] = key * 3
+
+    assert dict(hm.items()) == expected
+    assert len(hm) == len(expected)
+
+
+def test_clear():
+    hm = CuckooHashMap()
+    for i in range(20):
+        hm[i] = i
+    hm.clear()
+
+    assert len(hm) == 0
+    assert list(hm.items()) == []
+
+
+def test_bulk_operations():
+    hm = CuckooHashMap.from_items([(i, str(i)) for i in range(300)])
+
+    assert hm.get_many([0, 299, 300]) == ["0", "299", None]
+    assert hm.remove_many(range(100)) == 100
+    assert len(hm) == 200
+
+
+def test_shrinking():
+    hm = CuckooHashMap(shrink_load_factor=0.1)
+    for i in range(1000):
+        hm[i] = i
+    for i in range(990):
+        hm.remove(i)
+
+    assert hm.capacity <= 64
+    assert all(hm[i] == i for i in range(990, 1000))
+
+
+def test_keys_sharing_a_bucket_pair_do_not_pile_into_stash():
+    hm = CuckooHashMap(initial_capacity=1024)
+    num_buckets = hm._num_buckets
+    # distinct hash codes that all map to buckets (0, 1) at this size
+    codes = (h for h in range(0, 1 << 40, num_buckets) if mix64(h) % num_buckets == 1)
+    keys = [Key(i, next(codes)) for i in range(60)]
+    for key in keys:
+        hm[key] = key.name
+
+    assert len(hm._stash) <= STASH_SIZE
+    assert hm.health()["max_probe_length"] <= 3
+    assert all(hm[key] == key.name for key in keys)
+
+
+def test_hash_seed():
+    hm = CuckooHashMap(hash_seed=1)
+    for i in range(500):
+        hm[f"key-{i}"] = i
+
+    assert all(hm[f"key-{i}"] == i for i in range(500))
+    assert hm.hasher.hash_code("key-1") != CuckooHashMap().hasher.hash_code("key-1")
+
+
+def test_accepts_dynamic_hashmap_options():
+    hm = CuckooHashMap(16, 0.75, resize_batch=8, bloom_fp_rate=0.05, hash_seed=b"seed")
+    for i in range(100):
+        hm[i] = i
+
+    assert isinstance(hm.hasher, KeyedHasher)
+    assert all(hm[i] == i for i in range(100))
+
+
+@pytest.mark.parametrize("option", [{"incremental_resize": True}, {"bloom": "standard"}])
+def test_rejects_unsupported_options(option):
+    with pytest.raises(ValueError, match="CuckooHashMap does not support"):
+        CuckooHashMap(**option)
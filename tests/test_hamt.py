@@ -0,0 +1,168 @@
+import random
+
+import pytest
+from hashmap import PersistentHashMap
+
+
+class Key:
+    """Key with a chosen hash code, for building exact collisions"""
+
+    def __init__(self, name, hash_code):
+        self.name = name
+        self.hash_code = hash_code
+
+    def __eq__(self, other):
+        return isinstance(other, Key) and self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
+
+
+def test_set_returns_new_version():
+    empty = PersistentHashMap()
+    one = empty.set("a", 1)
+    two = one.set("b", 2)
+
+    assert len(empty) == 0
+    assert one.get("a") == 1 and "b" not in one
+    assert two["a"] == 1 and two["b"] == 2
+    assert len(two) == 2
+
+
+def test_overwrite_keeps_old_version():
+    v1 = PersistentHashMap().set("a", 1)
+    v2 = v1.set("a", 2)
+
+    assert v1["a"] == 1
+    assert v2["a"] == 2
+    assert len(v2) == 1
+
+
+def test_setting_same_value_returns_same_version():
+    value = object()
+    v1 = PersistentHashMap().set("a", value)
+
+    assert v1.set("a", value) is v1
+
+
+def test_delete():
+    v1 = PersistentHashMap([(i, i) for i in range(100)])
+    v2 = v1.delete(50)
+
+    assert 50 in v1 and 50 not in v2
+    assert len(v1) == 100 and len(v2) == 99
+    with pytest.raises(KeyError):
+        v2.delete(50)
+    with pytest.raises(KeyError):
+        PersistentHashMap().delete("missing")
+
+
+def test_get_default_and_missing():
+    hm = PersistentHashMap().set("a", None)
+
+    assert hm.get("a", 0) is None
+    assert hm.get("b", 0) == 0
+    with pytest.raises(KeyError):
+        hm["b"]
+
+
+def test_structural_sharing():
+    v1 = PersistentHashMap([(i, i) for i in range(1000)])
+    v2 = v1.set(1000, 1000)
+
+    # with 1000 keys the root is full, so only the child on the path to the
+    # new key is copied and the other 31 subtries are shared
+    old_children, new_children = v1._root.array[1::2], v2._root.array[1::2]
+    assert len(old_children) == len(new_children) == 32
+    assert sum(old is not new for old, new in zip(old_children, new_children)) == 1
+
+
+def test_matches_dict_under_random_edits():
+    rng = random.Random(7)
+    hm = PersistentHashMap()
+    expected = {}
+    versions = []
+    for _ in range(3000):
+        key = rng.randrange(500)
+        if key in expected and rng.random() < 0.4:
+            hm = hm.delete(key)
+            del expected[key]
+        else:
+            hm = hm.set(key, key * 2)
+            expected[key] = key * 2
+        versions.append((hm, dict(expected)))
+
+    for version, snapshot in versions[::250]:
+        assert dict(version.items()) == snapshot
+        assert len(version) == len(snapshot)
+
+
+def test_full_hash_collisions():
+    keys = [Key(i, 12345) for i in range(5)]
+    hm = PersistentHashMap()
+    for key in keys:
+        hm = hm.set(key, key.name)
+    hm = hm.set(Key("other", 12345 + 32), "other")
+
+    assert all(hm[key] == key.name for key in keys)
+    assert hm[Key("other", 12345 + 32)] == "other"
+
+    for key in keys:
+        hm = hm.delete(key)
+    assert len(hm) == 1
+    assert list(hm.keys()) == [Key("other", 12345 + 32)]
+
+
+def test_transient_batch_edits():
+    base = PersistentHashMap([("a", 1)])
+    transient = base.transient()
+    for i in range(100):
+        transient[i] = i
+    del transient["a"]
+    result = transient.persistent()
+
+    assert base["a"] == 1 and len(base) == 1
+    assert "a" not in result
+    assert len(result) == 100
+    assert all(result[i] == i for i in range(100))
+
+
+def test_transient_does_not_leak_into_source():
+    base = PersistentHashMap([(i, i) for i in range(100)])
+    transient = base.transient()
+    transient.put(5, "changed")
+    transient.remove(6)
+
+    assert base[5] == 5 and base[6] == 6
+
+
+def test_transient_unusable_after_persistent():
+    transient = PersistentHashMap().transient()
+    transient.put("a", 1)
+    frozen = transient.persistent()
+
+    with pytest.raises(RuntimeError):
+        transient.put("b", 2)
+    assert "b" not in frozen
+
+
+def test_transient_remove_missing():
+    transient = PersistentHashMap([("a", 1)]).transient()
+
+    with pytest.raises(KeyError):
+        transient.remove("b")
+
+
+def test_update_and_mixed_keys():
+    hm = PersistentHashMap().update({"a": 1, 2: "two", (3, "x"): b"tuple", 4.5: "float"})
+
+    assert hm[(3, "x")] == b"tuple"
+    assert hm[4.5] == "float"
+    assert sorted(map(str, hm.keys())) == sorted(map(str, ["a", 2, (3, "x"), 4.5]))
+
+
+def test_keyed_hashing():
+    hm = PersistentHashMap([("a", 1), ("b", 2)], hash_seed=b"secret")
+
+    assert hm.set("c", 3)["c"] == 3
+    assert hm["a"] == 1
@@ -1,5 +1,19 @@
 import pytest
-from hashmap import DynamicHashMap
+from hashmap import DynamicHashMap, HashedKey, Hasher, KeyedHasher
+
+
+class Key:
+    """Key with a chosen hash code, for building exact collisions"""
+
+    def __init__(self, name, hash_code):
+        self.name = name
+        self.hash_code = hash_code
+
+    def __eq__(self, other):
+        return isinstance(other, Key) and self.name == other.name
+
+    def __hash__(self):
+        return hash(self.name)
 
 
 def test_put_and_get():
@@ -77,26 +91,27 @@ def test_collision_handling():
     hm = DynamicHashMap(initial_capacity=4)
 
     # these collide since 1 % 4 == 5 % 4
-    hm.put(1, "one")
-    hm.put(5, "five")
+    hm.put(Key("one", 1), "one")
+    hm.put(Key("five", 5), "five")
 
-    assert hm.get(1) == "one"
-    assert hm.get(5) == "five"
+    assert hm.get(Key("one", 1)) == "one"
+    assert hm.get(Key("five", 5)) == "five"
     assert hm.size() == 2
 
 
 def test_remove_from_collision_chain():
     hm = DynamicHashMap(initial_capacity=4)
+    one, five, nine = Key("one", 1), Key("five", 5), Key("nine", 9)
 
-    hm.put(1, "one")
-    hm.put(5, "five")
-    hm.put(9, "nine")
+    hm.put(one, "one")
+    hm.put(five, "five")
+    hm.put(nine, "nine")
 
-    hm.remove(5)
+    hm.remove(five)
 
-    assert hm.get(1) == "one"
-    assert hm.get(5) is None
-    assert hm.get(9) == "nine"
+    assert hm.get(one) == "one"
+    assert hm.get(five) is None
+    assert hm.get(nine) == "nine"
     assert hm.size() == 2
 
 
@@ -117,12 +132,12 @@ def test_resize():
 def test_resize_preserves_collisions():
     hm = DynamicHashMap(initial_capacity=2, load_factor=1)
 
-    hm.put(0, "zero")
-    hm.put(2, "two")
+    hm.put(Key("zero", 0), "zero")
+    hm.put(Key("two", 2), "two")
 
     assert hm.capacity == 4
-    assert hm.get(0) == "zero"
-    assert hm.get(2) == "two"
+    assert hm.get(Key("zero", 0)) == "zero"
+    assert hm.get(Key("two", 2)) == "two"
 
 
 # ---------- Dict-like interface tests ----------
@@ -325,3 +340,721 @@ def test_iteration_after_resize():
     assert keys == set(range(10))
     assert values == {i * 10 for i in range(10)}
 
+
+
+# ---------- Incremental resize tests ----------
+
+def test_incremental_resize_keeps_old_table_until_migrated():
+    hm = DynamicHashMap(initial_capacity=8, incremental_resize=True, resize_batch=1)
+
+    for i in range(6):
+        hm[i] = i
+
+    assert hm.capacity == 16
+    assert hm._old_table is not None
+
+    for i in range(6):
+        assert hm[i] == i
+        assert i in hm
+
+
+def test_incremental_resize_migrates_on_writes():
+    hm = DynamicHashMap(initial_capacity=8, incremental_resize=True, resize_batch=2)
+
+    for i in range(6):
+        hm[i] = i
+    for i in range(100, 104):
+        hm[i] = i
+
+    assert hm._old_table is None
+    assert len(hm) == 10
+    assert set(hm.keys()) == set(range(6)) | set(range(100, 104))
+
+
+def test_incremental_resize_overwrite_and_remove_during_migration():
+    hm = DynamicHashMap(initial_capacity=8, incremental_resize=True, resize_batch=1)
+
+    for i in range(6):
+        hm[i] = i
+
+    hm[5] = "updated"
+    hm.remove(0)
+
+    assert hm[5] == "updated"
+    assert 0 not in hm
+    assert len(hm) == 5
+    assert len(list(hm.items())) == 5
+
+
+def test_incremental_resize_large():
+    hm = DynamicHashMap(initial_capacity=2, incremental_resize=True)
+
+    for i in range(5000):
+        hm[i] = i * 2
+    for i in range(0, 5000, 2):
+        hm.remove(i)
+
+    assert len(hm) == 2500
+    assert all(hm[i] == i * 2 for i in range(1, 5000, 2))
+    assert sorted(hm.keys()) == list(range(1, 5000, 2))
+
+
+def test_incremental_clear_during_migration():
+    hm = DynamicHashMap(initial_capacity=8, incremental_resize=True, resize_batch=1)
+
+    for i in range(6):
+        hm[i] = i
+    hm.clear()
+
+    assert len(hm) == 0
+    assert list(hm.keys()) == []
+    assert 1 not in hm
+
+
+# ---------- Cached hash code tests ----------
+
+class CountingHasher(Hasher):
+    def __init__(self, size: int):
+        super().__init__(size)
+        self.calls = 0
+
+    def hash_code(self, key):
+        self.calls += 1
+        return super().hash_code(key)
+
+
+def test_nodes_store_full_hash_code():
+    hm = DynamicHashMap()
+    hm.put("hello", 1)
+
+    node = hm._find_node("hello")
+    assert node is not None
+    assert node.hash_code == Hasher(1).hash_code("hello")
+
+
+def test_resize_does_not_rehash_keys():
+    hm = DynamicHashMap(initial_capacity=2)
+    hm.hasher = CountingHasher(hm.capacity)
+
+    for i in range(50):
+        hm[f"key-{i}"] = i
+
+    # exactly one hash per insert, however many resizes happened
+    assert hm.hasher.calls == 50
+    assert hm.capacity >= 64
+    assert all(hm[f"key-{i}"] == i for i in range(50))
+
+
+def test_equal_hash_codes_still_compare_keys():
+    hm = DynamicHashMap()
+    # a different key carrying the same full hash code
+    collider = Key("b", Hasher(1).hash_code("a"))
+    hm.put("a", "str")
+    hm.put(collider, "key")
+
+    assert hm["a"] == "str"
+    assert hm[collider] == "key"
+    assert len(hm) == 2
+
+
+# ---------- Bulk operation tests ----------
+
+def test_from_items_presizes_table():
+    pairs = [(i, i * 2) for i in range(1000)]
+    hm = DynamicHashMap.from_items(pairs)
+
+    assert len(hm) == 1000
+    assert hm.capacity == 2048
+    assert all(hm[i] == i * 2 for i in range(1000))
+
+
+def test_from_items_with_generator_and_expected_size():
+    hm = DynamicHashMap.from_items(((str(i), i) for i in range(100)), expected_size=100)
+
+    assert hm.capacity == 256
+    assert hm["42"] == 42
+
+
+def test_from_items_forwards_constructor_options():
+    hm = DynamicHashMap.from_items([("a", 1)], load_factor=0.5, incremental_resize=True)
+
+    assert hm.load_factor == 0.5
+    assert hm.incremental_resize is True
+    assert hm["a"] == 1
+
+
+def test_put_many_resizes_once():
+    hm = DynamicHashMap()
+    resizes = []
+    resize = hm._resize
+    hm._resize = lambda capacity: resizes.append(capacity) or resize(capacity)
+
+    hm.put_many([(i, i) for i in range(500)])
+
+    assert resizes == [1024]
+    assert len(hm) == 500
+
+
+def test_put_many_accepts_mapping():
+    hm = DynamicHashMap()
+    hm.put_many({"a": 1, "b": 2})
+
+    assert hm["a"] == 1
+    assert hm["b"] == 2
+
+
+def test_get_many():
+    hm = DynamicHashMap.from_items([("a", 1), ("b", 2)])
+
+    assert hm.get_many(["a", "missing", "b"]) == [1, None, 2]
+    assert hm.get_many(["missing"], default=0) == [0]
+
+
+def test_remove_many():
+    hm = DynamicHashMap.from_items([(i, i) for i in range(10)])
+
+    assert hm.remove_many([1, 2, 3, 99]) == 3
+    assert len(hm) == 7
+    assert 2 not in hm
+
+
+def test_remove_many_probes_each_key_once():
+    hm = DynamicHashMap.from_items([(i, i) for i in range(10)])
+    calls = []
+    hash_code = hm.hasher.hash_code
+    hm.hasher.hash_code = lambda key: calls.append(key) or hash_code(key)
+
+    assert hm.remove_many([1, 2, 99]) == 2
+    assert calls == [1, 2, 99]
+
+
+def test_reserve():
+    hm = DynamicHashMap()
+    hm["a"] = 1
+    hm.reserve(100)
+
+    assert hm.capacity == 256
+    assert hm["a"] == 1
+
+    hm.reserve(10)
+    assert hm.capacity == 256
+
+
+# ---------- Snapshot tests ----------
+
+def test_dump_and_load_round_trip(tmp_path):
+    hm = DynamicHashMap(load_factor=0.5)
+    for i in range(500):
+        hm[i] = {"id": i}
+        hm[f"key-{i}"] = [i]
+
+    path = tmp_path / "snapshot.bin"
+    hm.dump(path)
+    loaded = DynamicHashMap.load(path)
+
+    assert len(loaded) == 1000
+    assert loaded.capacity == hm.capacity
+    assert loaded.load_factor == 0.5
+    assert dict(loaded.items()) == dict(hm.items())
+
+
+def test_load_allocates_table_once(tmp_path):
+    hm = DynamicHashMap.from_items((i, i) for i in range(1000))
+    path = str(tmp_path / "snapshot.bin")
+    hm.dump(path)
+
+    resizes = []
+    original = DynamicHashMap._resize
+    DynamicHashMap._resize = lambda self, capacity: resizes.append(capacity) or original(self, capacity)
+    try:
+        loaded = DynamicHashMap.load(path)
+    finally:
+        DynamicHashMap._resize = original
+
+    assert resizes == []
+    assert loaded[999] == 999
+
+
+def test_dump_to_file_object():
+    import io
+
+    hm = DynamicHashMap()
+    hm["a"] = 1
+    buffer = io.BytesIO()
+    hm.dump(buffer)
+    buffer.seek(0)
+
+    assert dict(DynamicHashMap.load(buffer).items()) == {"a": 1}
+
+
+def test_dump_empty_map(tmp_path):
+    path = tmp_path / "empty.bin"
+    DynamicHashMap().dump(path)
+
+    assert len(DynamicHashMap.load(path)) == 0
+
+
+def test_load_rejects_foreign_data(tmp_path):
+    path = tmp_path / "garbage.bin"
+    path.write_bytes(b"definitely not a snapshot file")
+
+    with pytest.raises(ValueError):
+        DynamicHashMap.load(path)
+
+
+def test_load_rejects_truncated_snapshot(tmp_path):
+    path = tmp_path / "snapshot.bin"
+    DynamicHashMap.from_items([("a", 1), ("b", 2)]).dump(path)
+    path.write_bytes(path.read_bytes()[:-20])
+
+    with pytest.raises(ValueError):
+        DynamicHashMap.load(path)
+
+
+# ---------- Shrinking tests ----------
+
+def test_no_shrinking_by_default():
+    hm = DynamicHashMap()
+    for i in range(1000):
+        hm[i] = i
+    peak = hm.capacity
+    for i in range(1000):
+        hm.remove(i)
+
+    assert hm.capacity == peak
+
+
+def test_removals_shrink_table():
+    hm = DynamicHashMap(shrink_load_factor=0.1)
+    for i in range(1000):
+        hm[i] = i
+    for i in range(990):
+        hm.remove(i)
+
+    assert hm.capacity <= 64
+    assert len(hm) == 10
+    assert all(hm[i] == i for i in range(990, 1000))
+
+
+def test_shrink_has_hysteresis():
+    hm = DynamicHashMap(initial_capacity=8, shrink_load_factor=0.1)
+    for i in range(200):
+        hm[i] = i
+    for i in range(190):
+        hm.remove(i)
+
+    resizes = []
+    resize = hm._resize
+    hm._resize = lambda capacity: resizes.append(capacity) or resize(capacity)
+    # oscillating around the new size must not resize back and forth
+    for _ in range(50):
+        hm[-1] = 0
+        hm.remove(-1)
+
+    assert resizes == []
+
+
+def test_shrink_never_goes_below_initial_capacity():
+    hm = DynamicHashMap(initial_capacity=32, shrink_load_factor=0.1)
+    for i in range(100):
+        hm[i] = i
+    for i in range(100):
+        hm.remove(i)
+
+    assert hm.capacity == 32
+
+
+def test_clear_resets_capacity_when_shrinking():
+    hm = DynamicHashMap(initial_capacity=8, shrink_load_factor=0.1)
+    for i in range(100):
+        hm[i] = i
+    hm.clear()
+
+    assert hm.capacity == 8
+    hm["a"] = 1
+    assert hm["a"] == 1
+
+
+def test_invalid_shrink_load_factor():
+    with pytest.raises(ValueError):
+        DynamicHashMap(load_factor=0.75, shrink_load_factor=0.5)
+    with pytest.raises(ValueError):
+        DynamicHashMap(shrink_load_factor=-0.1)
+
+
+def test_shrink_to_fit():
+    hm = DynamicHashMap()
+    for i in range(1000):
+        hm[i] = i
+    for i in range(980):
+        hm.remove(i)
+    hm.shrink_to_fit()
+
+    assert hm.capacity == 32
+    assert sorted(hm.keys()) == list(range(980, 1000))
+
+
+def test_shrink_to_fit_during_incremental_migration():
+    hm = DynamicHashMap(incremental_resize=True, resize_batch=1)
+    for i in range(6):
+        hm[i] = i
+    assert hm._old_table is not None
+
+    hm.shrink_to_fit()
+
+    assert hm._old_table is None
+    assert hm.capacity == 16
+    assert all(hm[i] == i for i in range(6))
+
+
+def test_incremental_shrink():
+    hm = DynamicHashMap(incremental_resize=True, shrink_load_factor=0.1)
+    for i in range(1000):
+        hm[i] = i
+    for i in range(995):
+        hm.remove(i)
+    hm["extra"] = 1
+
+    assert hm.capacity <= 64
+    assert sorted(k for k in hm.keys() if k != "extra") == list(range(995, 1000))
+    assert len(hm) == 6
+
+
+# ---------- Instrumentation tests ----------
+
+def test_stats_disabled_by_default():
+    hm = DynamicHashMap()
+    for i in range(100):
+        hm[i] = i
+
+    report = hm.health()
+    assert "resize_count" not in report
+    assert "_resize" not in vars(hm)
+
+
+def test_health_reports_chain_histogram():
+    hm = DynamicHashMap(initial_capacity=4, load_factor=10)
+    # 1, 5 and 9 share bucket 1; 2 sits alone in bucket 2
+    for hash_code in (1, 5, 9, 2):
+        hm[Key(hash_code, hash_code)] = hash_code
+
+    report = hm.health()
+    assert report["size"] == 4
+    assert report["capacity"] == 4
+    assert report["chain_histogram"] == {0: 2, 1: 1, 3: 1}
+    assert report["probe_histogram"] == {1: 2, 2: 1, 3: 1}
+    assert report["max_probe_length"] == 3
+    assert report["avg_comparisons_hit"] == (1 + 2 + 3 + 1) / 4
+    assert report["avg_comparisons_miss"] == 1.0
+
+
+def test_health_counts_old_table_during_migration():
+    hm = DynamicHashMap(initial_capacity=8, incremental_resize=True, resize_batch=1)
+    for i in range(7):
+        hm[i] = i
+
+    assert hm._old_table is not None
+    report = hm.health()
+    chains = report["chain_histogram"]
+    assert sum(length * count for length, count in chains.items()) == 7
+    assert sum(report["probe_histogram"].values()) == 7
+
+
+def test_stats_track_resizes():
+    hm = DynamicHashMap(initial_capacity=2)
+    stats = hm.enable_stats()
+    for i in range(100):
+        hm[i] = i
+
+    assert stats.resize_count == 7
+    assert stats.resize_time > 0
+    assert [capacity for _, _, capacity in stats.load_history] == [4, 8, 16, 32, 64, 128, 256]
+    assert hm.health()["resize_count"] == 7
+
+
+def test_on_resize_callback():
+    hm = DynamicHashMap(initial_capacity=4)
+    events = []
+    hm.on_resize(lambda old, new, seconds: events.append((old, new)))
+
+    for i in range(5):
+        hm[i] = i
+
+    assert events == [(4, 8)]
+
+
+def test_stats_track_incremental_migrations():
+    hm = DynamicHashMap(initial_capacity=4, incremental_resize=True)
+    stats = hm.enable_stats()
+    for i in range(20):
+        hm[i] = i
+
+    assert stats.resize_count >= 3
+
+
+def test_disable_stats_restores_plain_methods():
+    hm = DynamicHashMap()
+    hm.enable_stats()
+    hm.disable_stats()
+
+    assert "_resize" not in vars(hm)
+    assert "resize_count" not in hm.health()
+
+
+# ---------- Bloom filter tests ----------
+
+def test_no_bloom_filter_by_default():
+    hm = DynamicHashMap()
+
+    assert hm._bloom is None
+
+
+@pytest.mark.parametrize("kind", ["standard", "counting"])
+def test_bloom_map_behaves_like_plain_map(kind):
+    hm = DynamicHashMap(initial_capacity=4, bloom=kind)
+    for i in range(200):
+        hm[f"k{i}"] = i
+    for i in range(0, 200, 2):
+        hm.remove(f"k{i}")
+
+    assert len(hm) == 100
+    assert all(hm.get(f"k{i}") == i for i in range(1, 200, 2))
+    assert not any(f"k{i}" in hm for i in range(0, 200, 2))
+
+
+def test_bloom_short_circuits_misses():
+    hm = DynamicHashMap(bloom="standard", bloom_fp_rate=0.01)
+    for i in range(1000):
+        hm[i] = i
+
+    passed = sum(hm._bloom.might_contain(hm.hasher.hash_code(i)) for i in range(1000, 11000))
+    assert passed < 500
+
+
+def test_bloom_rebuilt_on_resize():
+    hm = DynamicHashMap(initial_capacity=8, bloom="standard")
+    small = hm._bloom
+    for i in range(100):
+        hm[i] = i
+
+    assert hm._bloom is not small
+    assert hm._bloom.capacity >= 75
+
+
+def test_bloom_survives_incremental_resize():
+    hm = DynamicHashMap(initial_capacity=4, incremental_resize=True, resize_batch=1, bloom="counting")
+    for i in range(100):
+        hm[i] = i
+
+    assert all(hm.contains(i) for i in range(100))
+
+
+def test_standard_bloom_rebuilt_after_many_removals():
+    hm = DynamicHashMap(initial_capacity=128, bloom="standard")
+    for i in range(90):
+        hm[i] = i
+    # sized for 96 keys, so the filter is rebuilt on the 48th removal
+    for i in range(47):
+        hm.remove(i)
+    assert hm._bloom.count == 90
+
+    hm.remove(47)
+    assert hm._bloom.count == 42
+
+
+def test_bloom_cleared_with_map():
+    hm = DynamicHashMap(bloom="counting")
+    hm["a"] = 1
+    hm.clear()
+
+    assert hm._bloom.count == 0
+    assert "a" not in hm
+
+
+def test_invalid_bloom_kind():
+    with pytest.raises(ValueError):
+        DynamicHashMap(bloom="blocked")
+
+
+# ---------- Key type tests ----------
+
+def test_bytes_float_and_tuple_keys():
+    hm = DynamicHashMap()
+    hm[b"raw"] = "bytes"
+    hm[1.5] = "float"
+    hm[("user", 42, (b"x", 0.5))] = "tuple"
+
+    assert hm[b"raw"] == "bytes"
+    assert hm[1.5] == "float"
+    assert hm[("user", 42, (b"x", 0.5))] == "tuple"
+    assert ("user", 42) not in hm
+    assert len(hm) == 3
+
+
+def test_integral_floats_match_ints():
+    hm = DynamicHashMap()
+    hm[2] = "two"
+    hm[2.0] = "two point zero"
+    hm[True] = "true"
+
+    assert len(hm) == 2
+    assert hm[2] == "two point zero"
+    assert hm[1] == "true"
+    assert Hasher(1).hash_code(-0.0) == Hasher(1).hash_code(0)
+
+
+@pytest.mark.parametrize("stride", [1, 16, 1 << 24])
+def test_strided_int_keys_spread_over_buckets(stride):
+    hm = DynamicHashMap(initial_capacity=4096, load_factor=1)
+    for i in range(2048):
+        hm[i * stride] = i
+
+    assert hm.health()["max_probe_length"] <= 8
+
+
+def test_tuple_hash_depends_on_order():
+    hasher = Hasher(1)
+
+    assert hasher.hash_code((1, 2)) != hasher.hash_code((2, 1))
+    assert hasher.hash_code(((1, 2), 3)) != hasher.hash_code((1, (2, 3)))
+
+
+def test_hashed_key_matches_plain_key():
+    hm = DynamicHashMap()
+    key = HashedKey(("order", 7))
+    hm[key] = "wrapped"
+
+    assert hm[("order", 7)] == "wrapped"
+    assert hm[HashedKey(("order", 7))] == "wrapped"
+    assert key == ("order", 7)
+
+
+def test_objects_with_precomputed_hash_code():
+    hm = DynamicHashMap()
+    hm[Key("a", 123)] = 1
+
+    assert hm[Key("a", 123)] == 1
+    assert hm.get(Key("a", 124)) is None
+
+
+def test_unsupported_key_type():
+    hm = DynamicHashMap()
+    with pytest.raises(TypeError):
+        hm[[1, 2]] = 1
+    with pytest.raises(TypeError):
+        hm[(1, [2])] = 1
+
+
+def test_sequential_keys_spread_over_buckets():
+    hm = DynamicHashMap(initial_capacity=1024, load_factor=1.0)
+    for i in range(0, 1000 * 1024, 1024):
+        hm[i] = i
+
+    assert max(hm._chain_lengths()) <= 8
+
+
+# ---------- Keyed hashing and tree bin tests ----------
+
+def test_keyed_hashing_is_seed_dependent():
+    a = KeyedHasher(1, b"seed-a")
+    b = KeyedHasher(1, b"seed-b")
+
+    assert a.hash_code("key") == KeyedHasher(1, b"seed-a").hash_code("key")
+    assert a.hash_code("key") != b.hash_code("key")
+    assert a.hash_code(2) == a.hash_code(2.0)
+    assert a.hash_code(HashedKey("key")) == a.hash_code("key")
+
+
+def test_keyed_map_operations():
+    hm = DynamicHashMap(hash_seed="random")
+    for i in range(100):
+        hm[(i, str(i))] = i
+    hm.remove((0, "0"))
+
+    assert isinstance(hm.hasher, KeyedHasher)
+    assert len(hm) == 99
+    assert all(hm[(i, str(i))] == i for i in range(1, 100))
+
+
+def test_keyed_map_accepts_int_seed():
+    hm = DynamicHashMap(hash_seed=12345)
+    hm[Key("a", 7)] = 1
+
+    assert hm[Key("a", 7)] == 1
+
+
+def test_keyed_map_accepts_lone_surrogates():
+    hm = DynamicHashMap(hash_seed=1)
+    hm["\ud800"] = 1
+
+    assert hm["\ud800"] == 1
+    assert hm.hasher.hash_code("\ud800") != hm.hasher.hash_code("\udc00")
+
+
+def test_invalid_hash_seed():
+    with pytest.raises(ValueError):
+        DynamicHashMap(hash_seed=b"x" * 65)
+    with pytest.raises(ValueError):
+        DynamicHashMap(hash_seed=-1)
+
+
+def test_long_chains_are_treeified():
+    hm = DynamicHashMap(initial_capacity=4, load_factor=100)
+    keys = [Key(i, 4 * i) for i in range(20)]
+    for key in keys:
+        hm[key] = key.name
+
+    assert hm._bins is not None and hm._bins[0] is not None
+    assert all(hm[key] == key.name for key in keys)
+    assert hm.get(Key(99, 4 * 99)) is None
+    assert list(hm._chain_lengths()) == [20, 0, 0, 0]
+    assert sorted(hm.values()) == list(range(20))
+
+
+def test_tree_bins_handle_equal_hash_codes():
+    hm = DynamicHashMap(initial_capacity=4, load_factor=100)
+    keys = [Key(i, 8) for i in range(12)]
+    for key in keys:
+        hm[key] = key.name
+    hm[keys[3]] = "updated"
+
+    assert hm[keys[3]] == "updated"
+    assert len(hm) == 12
+
+
+def test_tree_bins_untreeify_after_removals():
+    hm = DynamicHashMap(initial_capacity=4, load_factor=100)
+    keys = [Key(i, 4 * i) for i in range(12)]
+    for key in keys:
+        hm[key] = key.name
+    for key in keys[:6]:
+        hm.remove(key)
+
+    assert hm._bins[0] is None
+    assert all(hm[key] == key.name for key in keys[6:])
+    with pytest.raises(KeyError):
+        hm.remove(keys[0])
+
+
+def test_tree_bins_rebuilt_after_resize():
+    hm = DynamicHashMap(initial_capacity=4)
+    # all hash codes are multiples of 64, so every key shares one bucket
+    keys = [Key(i, 64 * i) for i in range(40)]
+    for key in keys:
+        hm[key] = key.name
+
+    assert hm.capacity == 64
+    assert hm._bins[0] is not None
+    assert all(hm[key] == key.name for key in keys)
+
+
+def test_tree_bins_with_incremental_resize():
+    hm = DynamicHashMap(initial_capacity=4, incremental_resize=True, resize_batch=1)
+    keys = [Key(i, 1024 * i) for i in range(60)]
+    for key in keys:
+        hm[key] = key.name
+    for key in keys[::2]:
+        hm.remove(key)
+
+    assert all(hm.get(key) == key.name for key in keys[1::2])
+    assert not any(key in hm for key in keys[::2])
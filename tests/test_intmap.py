@@ -0,0 +1,135 @@
+import subprocess
+import sys
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from hashmap import IntHashMap
+
+
+@pytest.mark.parametrize("load_factor", [0, 1, 2])
+def test_rejects_invalid_load_factor(load_factor):
+    with pytest.raises(ValueError):
+        IntHashMap(load_factor=load_factor)
+
+
+def test_package_import_does_not_load_numpy():
+    code = "import sys, hashmap; assert 'numpy' not in sys.modules; hashmap.IntHashMap"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_insert_and_lookup():
+    hm = IntHashMap()
+    hm.insert(np.array([1, 2, 3]), np.array([10, 20, 30]))
+
+    result = hm.lookup(np.array([3, 1, 2, 4]), default=-1)
+
+    assert result.tolist() == [30, 10, 20, -1]
+    assert len(hm) == 3
+
+
+def test_contains():
+    hm = IntHashMap()
+    hm.insert([5, 6], [1, 1])
+
+    assert hm.contains([5, 7, 6]).tolist() == [True, False, True]
+
+
+def test_insert_overwrites_existing_keys():
+    hm = IntHashMap()
+    hm.insert([1, 2], [10, 20])
+    hm.insert([2, 3], [200, 300])
+
+    assert hm.lookup([1, 2, 3]).tolist() == [10, 200, 300]
+    assert len(hm) == 3
+
+
+def test_duplicate_keys_in_batch_last_value_wins():
+    hm = IntHashMap()
+    hm.insert([7, 7, 8, 7], [1, 2, 3, 4])
+
+    assert hm.lookup([7, 8]).tolist() == [4, 3]
+    assert len(hm) == 2
+
+
+def test_scalar_value_broadcasts():
+    hm = IntHashMap()
+    hm.insert([1, 2, 3], 9)
+
+    assert hm.lookup([1, 2, 3]).tolist() == [9, 9, 9]
+
+
+def test_colliding_keys_in_one_batch():
+    hm = IntHashMap(initial_capacity=1024, load_factor=0.9)
+    # multiples of the capacity: all land on nearby slots under modulo hashing
+    keys = np.arange(0, 1024 * 500, 1024)
+    hm.insert(keys, keys * 2)
+
+    assert (hm.lookup(keys) == keys * 2).all()
+
+
+def test_resize_keeps_entries():
+    hm = IntHashMap(initial_capacity=2)
+    keys = np.arange(10_000)
+    hm.insert(keys, -keys)
+
+    assert hm.capacity >= 20_000
+    assert (hm.lookup(keys) == -keys).all()
+    assert not hm.contains([10_000, -1]).any()
+
+
+def test_negative_and_large_keys():
+    hm = IntHashMap()
+    keys = np.array([-1, -(2**62), 2**62, 0])
+    hm.insert(keys, [1, 2, 3, 4])
+
+    assert hm.lookup(keys).tolist() == [1, 2, 3, 4]
+
+
+def test_float_values():
+    hm = IntHashMap(value_dtype=np.float64)
+    hm.insert([1, 2], [0.5, 1.5])
+
+    assert hm.lookup([2, 3], default=np.nan)[0] == 1.5
+    assert np.isnan(hm.lookup([3], default=np.nan)[0])
+
+
+def test_dict_like_interface():
+    hm = IntHashMap()
+    hm[42] = 7
+
+    assert hm[42] == 7
+    assert 42 in hm
+    assert 43 not in hm
+    with pytest.raises(KeyError):
+        hm[43]
+
+
+def test_keys_values_and_clear():
+    hm = IntHashMap()
+    hm.insert([3, 1, 2], [30, 10, 20])
+
+    assert sorted(hm.keys().tolist()) == [1, 2, 3]
+    assert sorted(hm.values().tolist()) == [10, 20, 30]
+
+    hm.clear()
+    assert len(hm) == 0
+    assert not hm.contains([1, 2, 3]).any()
+
+
+def test_matches_dict_for_random_batches():
+    rng = np.random.default_rng(7)
+    hm = IntHashMap()
+    expected = {}
+
+    for _ in range(20):
+        keys = rng.integers(-5000, 5000, size=500)
+        values = rng.integers(0, 1000, size=500)
+        hm.insert(keys, values)
+        for key, value in zip(keys.tolist(), values.tolist()):
+            expected[key] = value
+
+    probe = np.arange(-5000, 5000)
+    assert len(hm) == len(expected)
+    assert hm.lookup(probe, default=-1).tolist() == [expected.get(k, -1) for k in probe.tolist()]
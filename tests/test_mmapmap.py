@@ -0,0 +1,191 @@
+import io
+import multiprocessing
+
+import pytest
+from hashmap import MmapHashMap
+from hashmap.codec import decode_key, encode_key
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "map.bin"
+
+
+def read_key(path, key):
+    with MmapHashMap(path, readonly=True) as hm:
+        return hm[key]
+
+
+def test_key_codec_round_trip():
+    for key in (0, 1, -1, 255, -256, 2**70, "", "hello", "héllo", "\ud800", b"", b"\x00\xff", 1.5, -0.25, (), (1, ("a", b"b"), 2.5)):
+        assert decode_key(encode_key(key)) == key
+
+    assert encode_key(1) != encode_key("1")
+    assert encode_key("a") != encode_key(b"a")
+    assert encode_key(2.0) == encode_key(2)
+    with pytest.raises(TypeError):
+        encode_key(object())
+
+
+def test_put_and_get(path):
+    with MmapHashMap(path) as hm:
+        hm.put("a", 1)
+        hm[2] = {"nested": [1, 2, 3]}
+
+        assert hm.get("a") == 1
+        assert hm[2] == {"nested": [1, 2, 3]}
+        assert hm.get("missing", 42) == 42
+        assert len(hm) == 2
+
+
+def test_persists_across_reopen(path):
+    with MmapHashMap(path) as hm:
+        for i in range(100):
+            hm[f"key-{i}"] = i
+
+    with MmapHashMap(path) as hm:
+        assert len(hm) == 100
+        assert all(hm[f"key-{i}"] == i for i in range(100))
+
+
+def test_overwrite_in_place_and_with_growth(path):
+    with MmapHashMap(path) as hm:
+        hm["a"] = "long value that takes space"
+        heap_end = hm._heap_end
+
+        hm["a"] = "short"
+        assert hm._heap_end == heap_end
+        assert hm["a"] == "short"
+
+        hm["a"] = "x" * 1000
+        assert hm["a"] == "x" * 1000
+        assert len(hm) == 1
+
+
+def test_remove(path):
+    with MmapHashMap(path, initial_capacity=4) as hm:
+        hm[1] = "one"
+        hm[5] = "five"
+        hm.remove(1)
+
+        assert 1 not in hm
+        assert hm[5] == "five"
+        assert len(hm) == 1
+        with pytest.raises(KeyError):
+            hm.remove(1)
+        with pytest.raises(KeyError):
+            hm[1]
+
+
+def test_growth_rehashes(path):
+    with MmapHashMap(path, initial_capacity=4) as hm:
+        for i in range(1000):
+            hm[i] = str(i)
+
+        assert hm.capacity >= 1024
+        assert all(hm[i] == str(i) for i in range(1000))
+        assert sorted(hm.keys()) == list(range(1000))
+
+
+def test_tombstones_are_reused_and_compacted(path):
+    with MmapHashMap(path, initial_capacity=64) as hm:
+        for i in range(20):
+            hm[i] = i
+            hm.remove(i)
+        assert len(hm) == 0
+
+        hm["kept"] = 1
+        hm.compact()
+
+        assert hm._used == 1
+        assert dict(hm.items()) == {"kept": 1}
+
+
+def test_clear(path):
+    with MmapHashMap(path) as hm:
+        hm["a"] = 1
+        hm.clear()
+
+        assert len(hm) == 0
+        assert list(hm.items()) == []
+
+    with MmapHashMap(path) as hm:
+        assert len(hm) == 0
+
+
+def test_readonly(path):
+    with MmapHashMap(path) as hm:
+        hm["a"] = 1
+
+    with MmapHashMap(path, readonly=True) as hm:
+        assert hm["a"] == 1
+        assert list(hm.values()) == [1]
+        with pytest.raises(io.UnsupportedOperation):
+            hm["b"] = 2
+        with pytest.raises(io.UnsupportedOperation):
+            hm.remove("a")
+
+
+def test_reader_follows_heap_growth(path):
+    with MmapHashMap(path) as writer:
+        writer["a"] = "old"
+        with MmapHashMap(path, readonly=True) as reader:
+            writer["b"] = "x" * 100_000
+            writer["a"] = "y" * 50
+
+            assert reader["a"] == "y" * 50
+            assert reader["b"] == "x" * 100_000
+            assert len(reader) == 2
+            assert dict(reader.items()) == {"a": "y" * 50, "b": "x" * 100_000}
+
+
+def test_reader_keeps_old_file_across_rehash(path):
+    with MmapHashMap(path, initial_capacity=4) as writer:
+        writer["a"] = 1
+        with MmapHashMap(path, readonly=True) as reader:
+            for i in range(100):
+                writer[i] = i
+
+            assert reader["a"] == 1
+            assert 50 not in reader
+
+
+def test_churn_does_not_grow_file(path):
+    with MmapHashMap(path) as hm:
+        for i in range(10):
+            hm[f"live-{i}"] = i
+        for i in range(5000):
+            hm[i] = i
+            hm.remove(i)
+
+        assert hm.capacity == 64
+        assert len(hm) == 10
+        assert all(hm[f"live-{i}"] == i for i in range(10))
+
+
+@pytest.mark.parametrize("load_factor", [0, 1, 1.5])
+def test_rejects_invalid_load_factor(path, load_factor):
+    with pytest.raises(ValueError):
+        MmapHashMap(path, load_factor=load_factor)
+
+
+def test_readonly_missing_file(path):
+    with pytest.raises(FileNotFoundError):
+        MmapHashMap(path, readonly=True)
+
+
+def test_rejects_foreign_files(path):
+    path.write_bytes(b"not a hash map" * 10)
+    with pytest.raises(ValueError):
+        MmapHashMap(path)
+
+
+def test_shared_read_only_across_processes(path):
+    with MmapHashMap(path) as hm:
+        hm["shared"] = [1, 2, 3]
+
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(2) as pool:
+        results = pool.starmap(read_key, [(path, "shared")] * 2)
+
+    assert results == [[1, 2, 3], [1, 2, 3]]
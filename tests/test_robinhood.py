@@ -0,0 +1,206 @@
+import random
+
+import pytest
+from hashmap import KeyedHasher, RobinHoodHashMap
+
+
+def test_put_and_get():
+    hm = RobinHoodHashMap()
+    hm.put("a", 1)
+    hm.put("b", 2)
+
+    assert hm.get("a") == 1
+    assert hm.get("b") == 2
+    assert hm.get("missing") is None
+    assert hm.get("missing", 42) == 42
+
+
+def test_put_overwrite():
+    hm = RobinHoodHashMap()
+    hm.put("a", 1)
+    hm.put("a", 99)
+
+    assert hm["a"] == 99
+    assert len(hm) == 1
+
+
+def test_getitem_missing_raises():
+    hm = RobinHoodHashMap()
+    with pytest.raises(KeyError):
+        hm["missing"]
+
+
+def test_collisions_and_remove():
+    hm = RobinHoodHashMap(initial_capacity=16)
+
+    # all share home slot 1
+    hm.put(1, "one")
+    hm.put(17, "seventeen")
+    hm.put(33, "thirty-three")
+
+    hm.remove(17)
+
+    assert hm.get(1) == "one"
+    assert hm.get(17) is None
+    assert hm.get(33) == "thirty-three"
+    assert len(hm) == 2
+
+
+def test_remove_missing_key():
+    hm = RobinHoodHashMap()
+    with pytest.raises(KeyError):
+        hm.remove("missing")
+
+
+def test_backward_shift_keeps_entries_reachable():
+    hm = RobinHoodHashMap(initial_capacity=16)
+    for key in (3, 19, 35, 4, 20):
+        hm.put(key, key)
+
+    hm.remove(3)
+
+    for key in (19, 35, 4, 20):
+        assert hm[key] == key
+    assert 3 not in hm
+
+
+def test_wraparound_probing():
+    hm = RobinHoodHashMap(initial_capacity=8, load_factor=0.9)
+    hm.put(7, "a")
+    hm.put(15, "b")
+    hm.put(23, "c")
+
+    assert hm[7] == "a"
+    assert hm[15] == "b"
+    assert hm[23] == "c"
+
+    hm.remove(7)
+    assert hm[15] == "b"
+    assert hm[23] == "c"
+
+
+def test_resize():
+    hm = RobinHoodHashMap(initial_capacity=4, load_factor=0.75)
+    hm.put("a", 1)
+    hm.put("b", 2)
+    hm.put("c", 3)
+
+    assert hm.capacity == 8
+    assert hm["a"] == 1
+    assert hm["b"] == 2
+    assert hm["c"] == 3
+
+
+def test_full_load_factor_never_fills_table():
+    hm = RobinHoodHashMap(initial_capacity=2, load_factor=1)
+    for i in range(10):
+        hm[i] = i
+
+    assert all(hm[i] == i for i in range(10))
+    assert hm.capacity > len(hm)
+
+
+def test_clear():
+    hm = RobinHoodHashMap()
+    hm["a"] = 1
+    hm.clear()
+
+    assert len(hm) == 0
+    assert "a" not in hm
+    assert list(hm.keys()) == []
+
+
+def test_iteration():
+    hm = RobinHoodHashMap()
+    hm["a"] = 1
+    hm["b"] = 2
+    hm["c"] = 3
+
+    assert set(hm.keys()) == {"a", "b", "c"}
+    assert set(hm.values()) == {1, 2, 3}
+    assert set(hm.items()) == {("a", 1), ("b", 2), ("c", 3)}
+
+
+def test_matches_dict_under_random_workload():
+    rng = random.Random(1234)
+    hm = RobinHoodHashMap(initial_capacity=4)
+    expected = {}
+
+    for _ in range(3000):
+        key = rng.choice([rng.randrange(200), f"k{rng.randrange(200)}"])
+        if rng.random() < 0.3 and key in expected:
+            hm.remove(key)
+            del expected[key]
+        else:
+            hm[key] = rng.random()
+            expected[key] = hm[key]
+
+    assert len(hm) == len(expected)
+    assert dict(hm.items()) == expected
+
+
+def test_resize_reuses_cached_hash_codes():
+    hm = RobinHoodHashMap(initial_capacity=2)
+    calls = []
+    hash_code = hm.hasher.hash_code
+    hm.hasher.hash_code = lambda key: calls.append(key) or hash_code(key)
+
+    for i in range(40):
+        hm[f"key-{i}"] = i
+
+    assert len(calls) == 40
+    assert all(hm[f"key-{i}"] == i for i in range(40))
+
+
+def test_bulk_operations():
+    hm = RobinHoodHashMap.from_items([(i, str(i)) for i in range(300)])
+
+    assert hm.capacity == 512
+    assert hm.get_many([0, 299, 300]) == ["0", "299", None]
+    assert hm.remove_many(range(100)) == 100
+    assert len(hm) == 200
+
+
+def test_shrinking():
+    hm = RobinHoodHashMap(shrink_load_factor=0.1)
+    for i in range(1000):
+        hm[i] = i
+    for i in range(990):
+        hm.remove(i)
+
+    assert hm.capacity <= 64
+    assert all(hm[i] == i for i in range(990, 1000))
+
+    hm.shrink_to_fit()
+    assert hm.capacity == 16
+
+
+def test_health_reports_probe_lengths():
+    hm = RobinHoodHashMap(initial_capacity=16)
+    for key in (1, 17, 33, 5):
+        hm.put(key, key)
+    stats = hm.enable_stats()
+    for i in range(100):
+        hm[i + 100] = i
+
+    report = hm.health()
+    assert report["size"] == 104
+    assert sum(report["probe_histogram"].values()) == 104
+    assert report["max_probe_length"] >= 1
+    assert "chain_histogram" not in report
+    assert report["resize_count"] == stats.resize_count > 0
+
+
+def test_accepts_dynamic_hashmap_options():
+    hm = RobinHoodHashMap(16, 0.75, resize_batch=8, bloom_fp_rate=0.05, hash_seed=b"seed")
+    for i in range(100):
+        hm[i] = i
+
+    assert isinstance(hm.hasher, KeyedHasher)
+    assert all(hm[i] == i for i in range(100))
+
+
+@pytest.mark.parametrize("option", [{"incremental_resize": True}, {"bloom": "standard"}])
+def test_rejects_unsupported_options(option):
+    with pytest.raises(ValueError, match="RobinHoodHashMap does not support"):
+        RobinHoodHashMap(**option)
@@ -0,0 +1,123 @@
+import multiprocessing
+
+import pytest
+from hashmap import SharedShardedHashMap, ShardFullError
+
+
+@pytest.fixture
+def shared():
+    with SharedShardedHashMap(num_shards=4, slots_per_shard=64) as hm:
+        yield hm
+
+
+def add_range(hm, start, stop):
+    for i in range(start, stop):
+        hm[i] = {"worker": start, "i": i}
+    hm.close()
+
+
+_worker_map = None
+
+
+def attach(hm):
+    global _worker_map
+    _worker_map = hm
+
+
+def read_key(key):
+    return _worker_map.get(key)
+
+
+def test_put_and_get(shared):
+    shared.put("a", 1)
+    shared[2] = [1, 2, 3]
+
+    assert shared.get("a") == 1
+    assert shared[2] == [1, 2, 3]
+    assert shared.get("missing", 0) == 0
+    assert len(shared) == 2
+
+
+def test_overwrite(shared):
+    shared["a"] = "first"
+    shared["a"] = "second"
+
+    assert shared["a"] == "second"
+    assert len(shared) == 1
+
+
+def test_remove(shared):
+    shared["a"] = 1
+    shared.remove("a")
+
+    assert "a" not in shared
+    assert len(shared) == 0
+    with pytest.raises(KeyError):
+        shared.remove("a")
+    with pytest.raises(KeyError):
+        shared["a"]
+
+
+def test_items_and_clear(shared):
+    for i in range(100):
+        shared[i] = i * i
+
+    assert dict(shared.items()) == {i: i * i for i in range(100)}
+    assert sorted(shared.keys()) == list(range(100))
+
+    shared.clear()
+    assert len(shared) == 0
+    assert list(shared.items()) == []
+
+
+def test_size_limits(shared):
+    with pytest.raises(ValueError):
+        shared["k" * 100] = 1
+    with pytest.raises(ValueError):
+        shared["a"] = "x" * 1000
+
+
+def test_full_shard_raises():
+    with SharedShardedHashMap(num_shards=1, slots_per_shard=8, max_load=0.5) as hm:
+        for i in range(4):
+            hm[i] = i
+        with pytest.raises(ShardFullError) as exc_info:
+            hm[99] = 99
+
+        assert exc_info.value.key == 99
+        assert len(hm) == 4
+
+
+def test_tombstones_are_reclaimed():
+    with SharedShardedHashMap(num_shards=1, slots_per_shard=8, max_load=0.5) as hm:
+        for i in range(100):
+            hm[i] = i
+            hm.remove(i)
+        hm["kept"] = 1
+
+        assert len(hm) == 1
+        assert hm["kept"] == 1
+
+
+def test_concurrent_writers_across_processes():
+    ctx = multiprocessing.get_context("spawn")
+    with SharedShardedHashMap(num_shards=4, slots_per_shard=64, mp_context=ctx) as hm:
+        workers = [ctx.Process(target=add_range, args=(hm, start, start + 25)) for start in range(0, 100, 25)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert len(hm) == 100
+        assert all(hm[i] == {"worker": i - i % 25, "i": i} for i in range(100))
+
+
+def test_pool_readers_see_parent_writes():
+    ctx = multiprocessing.get_context("spawn")
+    with SharedShardedHashMap(num_shards=4, slots_per_shard=64, mp_context=ctx) as hm:
+        hm["config"] = {"threshold": 3}
+        with ctx.Pool(2, initializer=attach, initargs=(hm,)) as pool:
+            results = pool.map(read_key, ["config", "missing", "config"])
+
+        assert results == [{"threshold": 3}, None, {"threshold": 3}]
@@ -0,0 +1,152 @@
+import pytest
+from hashmap import TTLHashMap
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_entries_without_ttl_never_expire(clock):
+    hm = TTLHashMap(clock=clock)
+    hm["a"] = 1
+    clock.advance(1e9)
+
+    assert hm["a"] == 1
+    assert hm.ttl("a") is None
+
+
+def test_default_ttl(clock):
+    hm = TTLHashMap(default_ttl=10, clock=clock)
+    hm["a"] = 1
+    clock.advance(9.5)
+    assert hm.get("a") == 1
+    assert hm.ttl("a") == pytest.approx(0.5)
+
+    clock.advance(0.5)
+    assert hm.get("a") is None
+    assert "a" not in hm
+    with pytest.raises(KeyError):
+        hm["a"]
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    hm = TTLHashMap(default_ttl=100, clock=clock)
+    hm.put("short", 1, ttl=1)
+    hm.put("long", 2)
+    clock.advance(2)
+
+    assert "short" not in hm
+    assert hm["long"] == 2
+
+
+def test_overwrite_resets_ttl(clock):
+    hm = TTLHashMap(default_ttl=10, tick=1, clock=clock)
+    hm["a"] = 1
+    clock.advance(8)
+    hm["a"] = 2
+    clock.advance(8)
+
+    assert hm["a"] == 2
+    assert hm.expire() == 0
+
+
+def test_remove(clock):
+    hm = TTLHashMap(default_ttl=10, clock=clock)
+    hm["a"] = 1
+    hm.remove("a")
+
+    assert len(hm) == 0
+    with pytest.raises(KeyError):
+        hm.remove("a")
+
+
+def test_remove_expired_raises(clock):
+    hm = TTLHashMap(default_ttl=1, clock=clock)
+    hm["a"] = 1
+    clock.advance(5)
+
+    with pytest.raises(KeyError):
+        hm.remove("a")
+
+
+def test_timer_wheel_reclaims_without_access(clock):
+    hm = TTLHashMap(default_ttl=5, tick=1, wheel_size=8, sweep_slots=100, clock=clock)
+    for i in range(100):
+        hm[i] = i
+    clock.advance(7)
+    hm["fresh"] = 1
+
+    assert len(hm) == 1
+    assert hm.expirations == 100
+
+
+def test_sweeping_is_amortized(clock):
+    hm = TTLHashMap(tick=1, wheel_size=64, sweep_slots=1, clock=clock)
+    for i in range(10):
+        hm.put(i, i, ttl=i + 1)
+    clock.advance(20)
+
+    # each operation sweeps at most one elapsed tick
+    hm["x"] = 0
+    assert len(hm) == 11
+    hm.get("x")
+    assert len(hm) == 10
+
+    assert hm.expire() == 9
+    assert len(hm) == 1
+
+
+def test_entries_beyond_one_wheel_turn(clock):
+    hm = TTLHashMap(tick=1, wheel_size=4, sweep_slots=100, clock=clock)
+    hm.put("a", 1, ttl=10)
+    for _ in range(9):
+        clock.advance(1)
+        hm.expire()
+    assert hm["a"] == 1
+
+    # the slot is swept once its tick has fully elapsed
+    clock.advance(2)
+    assert hm.expire() == 1
+    assert len(hm) == 0
+
+
+def test_items_skip_expired(clock):
+    hm = TTLHashMap(clock=clock)
+    hm.put("a", 1, ttl=1)
+    hm.put("b", 2, ttl=10)
+    clock.advance(5)
+
+    assert dict(hm.items()) == {"b": 2}
+    assert list(hm.keys()) == ["b"]
+    assert list(hm.values()) == [2]
+
+
+def test_clear(clock):
+    hm = TTLHashMap(default_ttl=1, clock=clock)
+    hm["a"] = 1
+    hm.clear()
+    clock.advance(5)
+
+    assert len(hm) == 0
+    assert hm.expire() == 0
+
+
+def test_invalid_arguments(clock):
+    with pytest.raises(ValueError):
+        TTLHashMap(default_ttl=0)
+    with pytest.raises(ValueError):
+        TTLHashMap(tick=0)
+    with pytest.raises(ValueError):
+        TTLHashMap(clock=clock).put("a", 1, ttl=-1)
@@ -1,4 +1,5 @@
 """Trees package - Binary Search Tree implementation."""
 from .bst import BinarySearchTree, Node, DuplicateKeyError, KeyDoesNotExist
+from .avl import AVLTree
 
-__all__ = ["BinarySearchTree", "Node", "DuplicateKeyError", "KeyDoesNotExist"]
+__all__ = ["BinarySearchTree", "Node", "DuplicateKeyError", "KeyDoesNotExist", "AVLTree"]
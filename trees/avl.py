@@ -0,0 +1,158 @@
+"""Self-balancing AVL tree with the BinarySearchTree API."""
+from typing import Callable, Optional
+
+from .bst import BinarySearchTree, DuplicateKeyError, KeyDoesNotExist, Node
+
+
+class AVLNode(Node):
+    def __init__(self, key: int):
+        super().__init__(key)
+        self.height: int = 0
+        self.left: Optional['AVLNode'] = None
+        self.right: Optional['AVLNode'] = None
+
+
+def _height(node: Optional[AVLNode]) -> int:
+    return node.height if node is not None else -1
+
+
+def _update_height(node: AVLNode) -> None:
+    node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+# refreshes a node's height and any other data derived from its children
+Updater = Callable[[AVLNode], None]
+
+
+def _rotate_right(node: AVLNode, update: Updater = _update_height) -> AVLNode:
+    pivot = node.left
+    assert pivot is not None
+    node.left = pivot.right
+    pivot.right = node
+    update(node)
+    update(pivot)
+    return pivot
+
+
+def _rotate_left(node: AVLNode, update: Updater = _update_height) -> AVLNode:
+    pivot = node.right
+    assert pivot is not None
+    node.right = pivot.left
+    pivot.left = node
+    update(node)
+    update(pivot)
+    return pivot
+
+
+def _rebalance(node: AVLNode, update: Updater = _update_height) -> AVLNode:
+    """Restores the AVL invariant at node, returning the new subtree root"""
+    update(node)
+    balance = _height(node.left) - _height(node.right)
+
+    if balance > 1:
+        assert node.left is not None
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left, update)
+        return _rotate_right(node, update)
+    if balance < -1:
+        assert node.right is not None
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right, update)
+        return _rotate_left(node, update)
+    return node
+
+
+class AVLTree(BinarySearchTree):
+    """
+    BinarySearchTree that keeps the heights of every node's two subtrees
+    within one of each other, rotating on the way back up from each insert
+    and delete. Height is therefore O(log n) whatever the insertion order.
+    """
+
+    root: Optional[AVLNode]  # type: ignore[assignment]
+    _node_type = AVLNode
+
+    def _update_node(self, node: AVLNode) -> None:  # type: ignore[override]
+        _update_height(node)
+        super()._update_node(node)
+
+    def _retrace(self, path: list[AVLNode]) -> None:
+        """Rebalances the ancestors of a changed subtree, bottom-up"""
+        sized = self._order_statistics
+        update = self._update_node if sized else _update_height
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            subtree = _rebalance(node, update)
+
+            if i == 0:
+                self.root = subtree
+            elif path[i - 1].left is node:
+                path[i - 1].left = subtree
+            else:
+                path[i - 1].right = subtree
+
+            # nothing above changes once a subtree keeps its root and height,
+            # except subtree sizes, which change all the way up
+            if subtree is node and node.height == old_height and not sized:
+                break
+
+    def insert(self, key: int) -> None:
+        """Inserts a key in the tree, raises DuplicateKeyError if key already exists"""
+        path: list[AVLNode] = []
+        current = self.root
+        while current is not None:
+            if key == current.key:
+                raise DuplicateKeyError(key)
+            path.append(current)
+            current = current.left if key < current.key else current.right
+
+        node = AVLNode(key)
+        if not path:
+            self.root = node
+        elif key < path[-1].key:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+
+        self._size += 1
+        self._retrace(path)
+
+    def delete(self, key: int) -> None:
+        """
+        Delete the node with the given key, rebalancing its ancestors.
+        Raises KeyDoesNotExist if the key is not found.
+        """
+        path: list[AVLNode] = []
+        node = self.root
+        while node is not None and node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+
+        if node is None:
+            raise KeyDoesNotExist(key)
+
+        if node.left is not None and node.right is not None:
+            # move the successor's key up and unlink the successor instead
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.key = successor.key
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+        elif path[-1].left is node:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+
+        self._size -= 1
+        self._retrace(path)
+
+    def height(self) -> int:
+        """Returns the height of the tree, kept up to date on every node"""
+        return _height(self.root)
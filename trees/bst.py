@@ -1,5 +1,10 @@
 """Binary Search Tree implementation with comprehensive features."""
-from typing import Optional
+import math
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+# keys shown by repr() before it elides the rest
+REPR_LIMIT = 10
 
 
 class Node:
@@ -7,6 +12,8 @@ class Node:
         self.key: int = key
         self.left: Optional['Node'] = None
         self.right: Optional['Node'] = None
+        # subtree size, kept up to date only by trees with order_statistics=True
+        self.size: int = 1
 
     def __repr__(self) -> str:
         return f"Node({self.key})"
@@ -24,13 +31,80 @@ class KeyDoesNotExist(Exception):
         self.key = key
 
 
+def _subtree_size(node: Optional[Node]) -> int:
+    return node.size if node is not None else 0
+
+
 class BinarySearchTree:
+    """
+    Unbalanced binary search tree. With order_statistics=True every node
+    also tracks the size of its subtree, which costs O(height) extra work per
+    insert and delete and enables rank(), select(), count_range() and
+    percentile() in O(height).
+    """
+
     root: Optional[Node]
     _size: int
 
-    def __init__(self):
+    # node class used by the bulk builders; subclasses with augmented nodes override it
+    _node_type = Node
+
+    def __init__(self, order_statistics: bool = False):
         self.root = None
         self._size = 0
+        self._order_statistics = order_statistics
+
+    @classmethod
+    def from_sorted(cls, keys: Iterable[int], order_statistics: bool = False):
+        """
+        Builds a perfectly balanced tree from keys in ascending order in O(n).
+        Raises DuplicateKeyError on a repeated key and ValueError if the keys
+        are out of order.
+        """
+        nodes: list[Node] = []
+        for key in keys:
+            if nodes:
+                previous = nodes[-1].key
+                if key == previous:
+                    raise DuplicateKeyError(key)
+                if key < previous:
+                    raise ValueError(f"Keys are not sorted: {key} follows {previous}")
+            nodes.append(cls._node_type(key))
+
+        tree = cls(order_statistics=order_statistics)
+        tree.root = tree._link_balanced(nodes, 0, len(nodes))
+        tree._size = len(nodes)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, keys: Iterable[int], order_statistics: bool = False):
+        """
+        Builds a perfectly balanced tree from keys in any order in O(n log n).
+        Raises DuplicateKeyError on a repeated key.
+        """
+        return cls.from_sorted(sorted(keys), order_statistics=order_statistics)
+
+    def rebuild(self) -> None:
+        """Rebalances the tree in place in O(n), reusing its nodes"""
+        nodes = list(self._inorder_nodes(self.root))
+        self.root = self._link_balanced(nodes, 0, len(nodes))
+
+    def _link_balanced(self, nodes: list[Node], lo: int, hi: int) -> Optional[Node]:
+        """Links sorted nodes[lo:hi] into a balanced subtree and returns its root"""
+        if lo >= hi:
+            return None
+        # recursion depth is log2(n), so this is safe for any tree size
+        mid = (lo + hi) // 2
+        node = nodes[mid]
+        node.left = self._link_balanced(nodes, lo, mid)
+        node.right = self._link_balanced(nodes, mid + 1, hi)
+        self._update_node(node)
+        return node
+
+    def _update_node(self, node: Node) -> None:
+        """Refreshes the data a node derives from its children"""
+        if self._order_statistics:
+            node.size = 1 + _subtree_size(node.left) + _subtree_size(node.right)
 
     def insert(self, key: int) -> None:
         """Inserts a key in a BST, raises DuplicateKeyError if key already exists"""
@@ -46,29 +120,30 @@ class BinarySearchTree:
             elif key < current.key:
                 if current.left is None:
                     current.left = Node(key)
-                    self._size += 1
-                    return
+                    break
                 current = current.left
             else:
                 if current.right is None:
                     current.right = Node(key)
-                    self._size += 1
-                    return
+                    break
                 current = current.right
 
+        self._size += 1
+        if self._order_statistics:
+            # the key is known to be new now, so every node above it grew by one
+            current = self.root
+            while current.key != key:
+                current.size += 1
+                current = current.left if key < current.key else current.right
+
     def search(self, key: int) -> bool:
         """Returns True if key exists else False"""
-        def traversal(node: Optional[Node], search_key: int) -> bool:
-            if node is None:
-                return False
-            if node.key == search_key:
+        current = self.root
+        while current is not None:
+            if key == current.key:
                 return True
-            elif search_key < node.key:
-                return traversal(node.left, search_key)
-            else:
-                return traversal(node.right, search_key)
-
-        return traversal(self.root, key)
+            current = current.left if key < current.key else current.right
+        return False
 
     def delete(self, key: int) -> None:
         """
@@ -88,6 +163,13 @@ class BinarySearchTree:
         if node is None:
             raise KeyDoesNotExist(key)
 
+        sized = self._order_statistics
+        if sized:
+            ancestor = self.root
+            while ancestor is not node:
+                ancestor.size -= 1
+                ancestor = ancestor.left if key < ancestor.key else ancestor.right
+
         def replace_child(
             parent_node: Optional[Node],
             old_child: Node,
@@ -109,6 +191,9 @@ class BinarySearchTree:
             successor: Node = node.right
 
             while successor.left is not None:
+                if sized:
+                    # the successor leaves every subtree on its way down
+                    successor.size -= 1
                 succ_parent = successor
                 successor = successor.left
 
@@ -117,6 +202,8 @@ class BinarySearchTree:
                 successor.right = node.right
 
             successor.left = node.left
+            if sized:
+                successor.size = node.size - 1
             replace_child(parent, node, successor)
 
         self._size -= 1
@@ -154,44 +241,102 @@ class BinarySearchTree:
             current = current.right
         return current.key
 
+    # ---------- Order statistics ----------
+
+    def _check_order_statistics(self) -> None:
+        if not self._order_statistics:
+            raise RuntimeError("Order statistics need a tree created with order_statistics=True")
+
+    def _count_below(self, key: int, inclusive: bool) -> int:
+        """Number of keys less than key (or equal to it, if inclusive)"""
+        count = 0
+        current = self.root
+        while current is not None:
+            if key < current.key or (key == current.key and not inclusive):
+                current = current.left
+            else:
+                count += 1 + _subtree_size(current.left)
+                current = current.right
+        return count
+
+    def rank(self, key: int) -> int:
+        """Returns the number of keys smaller than key; key need not be in the tree"""
+        self._check_order_statistics()
+        return self._count_below(key, inclusive=False)
+
+    def select(self, k: int) -> int:
+        """Returns the k-th smallest key (0-based), raises IndexError if out of range"""
+        self._check_order_statistics()
+        if not 0 <= k < self._size:
+            raise IndexError(f"Rank out of range: {k}")
+
+        current = self.root
+        while True:
+            left_size = _subtree_size(current.left)
+            if k < left_size:
+                current = current.left
+            elif k == left_size:
+                return current.key
+            else:
+                k -= left_size + 1
+                current = current.right
+
+    def count_range(self, lo: int, hi: int) -> int:
+        """Returns the number of keys with lo <= key <= hi"""
+        self._check_order_statistics()
+        if hi < lo:
+            return 0
+        return self._count_below(hi, inclusive=True) - self._count_below(lo, inclusive=False)
+
+    def percentile(self, p: float) -> int:
+        """Returns the nearest-rank p-th percentile key, for 0 <= p <= 100"""
+        self._check_order_statistics()
+        if not 0 <= p <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100: {p}")
+        if self.root is None:
+            raise ValueError("Tree is empty")
+        return self.select(max(0, math.ceil(p / 100 * self._size) - 1))
+
     def height(self) -> int:
         """Returns the height of the tree (longest path from root to leaf)"""
-        def _height(node: Optional[Node]) -> int:
-            if node is None:
-                return -1
-            return 1 + max(_height(node.left), _height(node.right))
-
-        return _height(self.root)
+        if self.root is None:
+            return -1
+
+        height = 0
+        stack: list[tuple[Node, int]] = [(self.root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > height:
+                height = depth
+            if node.left is not None:
+                stack.append((node.left, depth + 1))
+            if node.right is not None:
+                stack.append((node.right, depth + 1))
+        return height
 
     def inorder(self) -> list[int]:
         """Returns inorder traversal of the tree (sorted order)"""
-        def _inorder(node: Optional[Node]):
-            if node is not None:
-                yield from _inorder(node.left)
-                yield node.key
-                yield from _inorder(node.right)
-
-        return list(_inorder(self.root))
+        return list(self._inorder_iter(self.root))
 
     def preorder(self) -> list[int]:
         """Returns preorder traversal of the tree"""
-        def _preorder(node: Optional[Node]):
-            if node is not None:
-                yield node.key
-                yield from _preorder(node.left)
-                yield from _preorder(node.right)
-
-        return list(_preorder(self.root))
+        return list(self._preorder_iter(self.root))
 
     def postorder(self) -> list[int]:
         """Returns postorder traversal of the tree"""
-        def _postorder(node: Optional[Node]):
-            if node is not None:
-                yield from _postorder(node.left)
-                yield from _postorder(node.right)
-                yield node.key
+        return list(self._postorder_iter(self.root))
 
-        return list(_postorder(self.root))
+    def iter_inorder(self) -> Iterator[int]:
+        """Streams keys in sorted order using O(height) memory"""
+        return self._inorder_iter(self.root)
+
+    def iter_preorder(self) -> Iterator[int]:
+        """Streams keys in preorder using O(height) memory"""
+        return self._preorder_iter(self.root)
+
+    def iter_postorder(self) -> Iterator[int]:
+        """Streams keys in postorder using O(height) memory"""
+        return self._postorder_iter(self.root)
 
     def __len__(self) -> int:
         """Returns the number of nodes in the tree"""
@@ -203,14 +348,73 @@ class BinarySearchTree:
 
     def __iter__(self):
         """Iterates through the tree in sorted order (inorder traversal)"""
-        yield from self._inorder_iter(self.root)
+        return self._inorder_iter(self.root)
+
+    def __reversed__(self):
+        """Iterates through the tree in descending order"""
+        return self._reverse_inorder_iter(self.root)
+
+    # Traversals keep an explicit stack of at most height() nodes, so deep
+    # trees cannot hit the recursion limit and each key costs O(1) amortized
 
     def _inorder_iter(self, node: Optional[Node]):
-        """Helper for iterator"""
-        if node is not None:
-            yield from self._inorder_iter(node.left)
+        """Yields the keys of the subtree at node in sorted order"""
+        stack: list[Node] = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.key
+            node = node.right
+
+    def _inorder_nodes(self, node: Optional[Node]):
+        """Yields the nodes of the subtree at node in sorted order"""
+        stack: list[Node] = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def _reverse_inorder_iter(self, node: Optional[Node]):
+        """Yields the keys of the subtree at node in descending order"""
+        stack: list[Node] = []
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.right
+            node = stack.pop()
+            yield node.key
+            node = node.left
+
+    def _preorder_iter(self, node: Optional[Node]):
+        """Yields the keys of the subtree at node, each before its children"""
+        stack: list[Node] = [node] if node is not None else []
+        while stack:
+            node = stack.pop()
             yield node.key
-            yield from self._inorder_iter(node.right)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def _postorder_iter(self, node: Optional[Node]):
+        """Yields the keys of the subtree at node, each after its children"""
+        stack: list[Node] = []
+        last: Optional[Node] = None
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                node = top.right
+            else:
+                yield top.key
+                last = stack.pop()
 
     def __str__(self) -> str:
         """String representation of the tree"""
@@ -219,5 +423,10 @@ class BinarySearchTree:
         return f"BinarySearchTree(size={self._size}, root={self.root.key})"
 
     def __repr__(self) -> str:
-        """Detailed representation of the tree"""
-        return f"BinarySearchTree(nodes={self.inorder()})"
+        """Detailed representation of the tree, listing at most REPR_LIMIT keys"""
+        name = type(self).__name__
+        keys = list(islice(self._inorder_iter(self.root), REPR_LIMIT + 1))
+        if len(keys) <= REPR_LIMIT:
+            return f"{name}(nodes={keys})"
+        shown = ", ".join(map(repr, keys[:REPR_LIMIT]))
+        return f"{name}(size={self._size}, nodes=[{shown}, ...])"